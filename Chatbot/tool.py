@@ -3,10 +3,10 @@ from src.functional_tools.player_summary_tool import get_player_summary
 from src.functional_tools.team_vs_team_tool import get_team_vs_team_summary
 from src.functional_tools.player_comparison_tool import get_player_comparison
 from src.functional_tools.venue_analysis_tool import get_venue_summary
-from src.functional_tools.tournament_summary_tool import get_tournament_summary
-from src.functional_tools.leaderboard_tool import get_leaderboard_summary
+from src.functional_tools.tournament_summary_tool import get_tournament_summary, parse_tournament_scope
+from src.functional_tools.leaderboard_tool import get_leaderboard_summary, parse_leaderboard_query
 from src.functional_tools.player_vs_team_tool import get_player_vs_team_summary
-from src.functional_tools.phase_wise_tool import get_phase_wise_performance
+from src.functional_tools.phase_wise_tool import get_phase_wise_performance, parse_over_window
 from src.functional_tools.playoff_tool import get_playoff_performance
 from src.functional_tools.pair_stats_tool import get_pair_stats
 from src.functional_tools.rag_csv_tool import get_rag_tool
@@ -15,7 +15,8 @@ from src.utils import normalize_venue_name
 from src.utils import normalize_team_name  
 from src.utils import extract_stat
 import pandas as pd
-from src.data_loader import load_ipl_data
+from src.data_loader import current_ipl_data, derived_from_frame, frame_fingerprint
+from src.result_cache import ResultCache
 from Chatbot.llm import load_llm 
 import streamlit as st
 import re
@@ -24,8 +25,44 @@ import re
 llm = load_llm()
 qa_chain = get_rag_tool(llm)
 
-# Load IPL data globally
-ipl = load_ipl_data()
+# Results keyed by (tool, resolved arguments); dropped when the data snapshot changes
+tool_cache = ResultCache()
+
+
+def _build_names(ipl):
+    batters = ipl["batter"].dropna().unique().tolist()
+    return {
+        "batters": batters,
+        "players": sorted(set(batters) | set(ipl["bowler"].dropna().unique())),
+        "partners": sorted(set(batters) | set(ipl["non-striker"].dropna().unique())),
+        "venues": {venue.lower(): venue for venue in ipl["Venue"].dropna().unique()},
+    }
+
+
+def _names(ipl):
+    """Player and venue names the tools resolve user input against, listed once per frame."""
+    return derived_from_frame(ipl, "tool_names", _build_names)
+
+
+def _resolve_venue(ipl, venue_query):
+    """
+    The venue name in ``ipl`` that ``venue_query`` refers to, or None.
+
+    Tries the query as a venue name (any case), then its normalize_venue_name
+    form, then a venue named inside the query ("Eden Gardens IPL summary").
+    """
+    venues = _names(ipl)["venues"]
+    for candidate in (venue_query, normalize_venue_name(venue_query)):
+        if candidate.strip().lower() in venues:
+            return venues[candidate.strip().lower()]
+    query = venue_query.lower()
+    named = [name for name in venues if re.search(rf"\b{re.escape(name)}\b", query)]
+    return venues[max(named, key=len)] if named else None
+
+
+def _cached(ipl, key, compute):
+    """``compute()`` cached under ``key`` for the data version of ``ipl``, the frame it reads."""
+    return tool_cache.get_or_compute(key, compute, version=frame_fingerprint(ipl))
 
 # PLAYER TEXT SUMMARY TOOL
 @tool
@@ -44,15 +81,15 @@ def get_player_summary_tool(player_name: str) -> str:
     """
 
     # Normalize the player name
-    all_players = ipl["batter"].unique().tolist()
-    normalized_name = get_normalized_player_name(player_name, all_players)
+    ipl = current_ipl_data()
+    normalized_name = get_normalized_player_name(player_name, _names(ipl)["batters"])
 
     if not normalized_name:
         return f"Error: No close match found for '{player_name}'. Try a more accurate or complete name."
 
 
     # Call your existing summary function
-    return get_player_summary(normalized_name)
+    return _cached(ipl, ("player_summary", normalized_name), lambda: get_player_summary(normalized_name, ipl))
 
 # Team vs Team analysis.
 @tool
@@ -80,10 +117,11 @@ def get_team_vs_team_summary_tool(query: str) -> str:
         return "Error:Please provide two valid IPL teams in your query like 'Show MI vs CSK summary'."
 
     team1_raw, team2_raw = teams[0], teams[1]
-    team1 = normalize_team_name(team1_raw)
-    team2 = normalize_team_name(team2_raw)
+    # The matchup is the same either way round; summarise (and cache) it in one order
+    team1, team2 = sorted([normalize_team_name(team1_raw), normalize_team_name(team2_raw)])
 
-    return get_team_vs_team_summary(team1, team2, ipl)
+    ipl = current_ipl_data()
+    return _cached(ipl, ("team_vs_team", team1, team2), lambda: get_team_vs_team_summary(team1, team2, ipl))
 
 
 # 🧍‍♂️ PLAYER COMPARISON TOOL
@@ -92,12 +130,11 @@ def get_player_comparison_tool(player1: str, player2: str) -> str:
     """Compare batting and bowling performance of two IPL players.
     Accepts full or partial names, case-insensitive.
     """
-    # Combine batter and bowler columns for full player list
-    all_players = sorted(set(ipl["batter"].dropna().unique()) | set(ipl["bowler"].dropna().unique()))
-
     # Normalize both player names
-    player1_normalized = get_normalized_player_name(player1, all_players)
-    player2_normalized = get_normalized_player_name(player2, all_players)
+    ipl = current_ipl_data()
+    players = _names(ipl)["players"]
+    player1_normalized = get_normalized_player_name(player1, players)
+    player2_normalized = get_normalized_player_name(player2, players)
 
     # Handle unmatched names
     if not player1_normalized:
@@ -109,7 +146,10 @@ def get_player_comparison_tool(player1: str, player2: str) -> str:
     if player1_normalized == player2_normalized:
         return f"Both inputs refer to the same player: {player1_normalized}"
 
-    return get_player_comparison(player1_normalized, player2_normalized, ipl)
+    return _cached(
+        ipl, ("player_comparison", player1_normalized, player2_normalized),
+        lambda: get_player_comparison(player1_normalized, player2_normalized, ipl),
+    )
 
 
 # VENUE ANALYSIS TOOL
@@ -134,7 +174,12 @@ def get_venue_summary_tool(venue_query: str) -> str:
 
     This tool helps analyze venue-specific trends in IPL history.
     """
-    return get_venue_summary(ipl, venue_query)
+    ipl = current_ipl_data()
+    # Resolve the venue first, so every way of naming it shares one entry
+    venue = _resolve_venue(ipl, venue_query)
+    if venue is None:
+        return get_venue_summary(ipl, venue_query)
+    return _cached(ipl, ("venue", venue), lambda: get_venue_summary(ipl, venue))
 
 # TOURNAMENT OVERVIEW TOOL
 @tool
@@ -154,7 +199,12 @@ def get_tournament_summary_tool(season_query: str) -> str:
     - "Give me IPL winners of all seasons"
     - "Summarize the 2016 IPL season"
     """
-    return get_tournament_summary(season_query, ipl)
+    ipl = current_ipl_data()
+    # Key on the season asked about, so "IPL 2023", "2023" and "season 2023" share one entry
+    scope = parse_tournament_scope(season_query)
+    if scope is None:
+        return get_tournament_summary(season_query, ipl)
+    return _cached(ipl, ("tournament", scope), lambda: get_tournament_summary(str(scope), ipl))
 
 # LEADERBOARD TOOL
 @tool
@@ -173,7 +223,8 @@ def get_leaderboard_summary_tool(query: str) -> str:
     - "Show overall top bowlers"
     - "2020 leaderboard for batsmen"
     """
-    return get_leaderboard_summary(query, ipl)
+    ipl = current_ipl_data()
+    return _cached(ipl, ("leaderboard",) + parse_leaderboard_query(query), lambda: get_leaderboard_summary(query, ipl))
 
 
 # Player vs Team Tool
@@ -203,8 +254,8 @@ def get_player_vs_team_tool(query: str) -> str:
     season = int(match.group(3)) if match.group(3) else None
 
     # Normalize player name
-    all_players = set(ipl["batter"]).union(set(ipl["bowler"]))
-    player_name = get_normalized_player_name(raw_player_name, all_players)
+    ipl = current_ipl_data()
+    player_name = get_normalized_player_name(raw_player_name, _names(ipl)["players"])
     if not player_name:
         return f"Error:Player '{raw_player_name}' not found in dataset."
 
@@ -213,19 +264,24 @@ def get_player_vs_team_tool(query: str) -> str:
     if not team_name:
         return f"Error: Team '{raw_team_name}' not recognized"
 
-    return get_player_vs_team_summary(player_name, team_name, season, ipl)
+    return _cached(
+        ipl, ("player_vs_team", player_name, team_name, season),
+        lambda: get_player_vs_team_summary(player_name, team_name, season, ipl),
+    )
 
 
 # Phase Tool
 @tool
 def get_phase_wise_performance_tool(query: str) -> str:
     """
-    Retrieve a player's batting and/or bowling performance during a specific phase of an IPL match.
+    Retrieve a player's batting and/or bowling performance during a specific phase of an IPL match,
+    or in any range of overs.
 
     Accepted Phases:
     - Powerplay (Overs 1-6)
     - Middle Overs (Overs 7-15)
     - Death Overs (Overs 16-20)
+    - Any over range, e.g. "Overs 12-16"
 
     Input Formats:
     - "Player Name in Phase"
@@ -234,19 +290,33 @@ def get_phase_wise_performance_tool(query: str) -> str:
     Examples:
     - "Virat Kohli in Powerplay"
     - "MS Dhoni in Death Overs in 2021"
+    - "Jasprit Bumrah in Overs 17-19 in 2020"
 
     Output:
     - Batting: Runs scored, strike rate, boundaries (4s, 6s)
     - Bowling (if applicable): Overs bowled, wickets, economy rate
     """
-    match = re.match(r"(.+?)\s+in\s+([\w\s]+?)(?:\s+in\s+(\d{4}))?$", query.strip(), re.IGNORECASE)
+    match = re.match(r"(.+?)\s+in\s+([\w\s-]+?)(?:\s+in\s+(\d{4}))?$", query.strip(), re.IGNORECASE)
     if not match:
         return "Error:Invalid format. Use: 'PlayerName in Phase [in Season]'"
 
-    player_name = match.group(1).strip()
+    raw_player_name = match.group(1).strip()
     phase = match.group(2).strip().lower()
     season = int(match.group(3)) if match.group(3) else None
-    return get_phase_wise_performance(player_name, phase, season, ipl)
+
+    ipl = current_ipl_data()
+    player_name = get_normalized_player_name(raw_player_name, _names(ipl)["players"])
+    if not player_name:
+        return f"Error:Player '{raw_player_name}' not found in dataset."
+
+    # Keyed by the resolved over range, so e.g. "death" and "death overs" share an entry
+    overs, label = parse_over_window(phase)
+    if overs is None:
+        return get_phase_wise_performance(player_name, phase, season, ipl)
+    return _cached(
+        ipl, ("phase", player_name, overs, label, season),
+        lambda: get_phase_wise_performance(player_name, phase, season, ipl),
+    )
 
 ## playoff performance tools
 @tool
@@ -271,18 +341,17 @@ def get_playoff_performance_tool(player_or_team_name: str) -> str:
     - "Virat Kohli"
     - "Chennai Super Kings"
     """
-    all_players = ipl["batter"].unique().tolist()
-
     # Try player normalization first
-    normalized_player = get_normalized_player_name(player_or_team_name, all_players)
+    ipl = current_ipl_data()
+    normalized_player = get_normalized_player_name(player_or_team_name, _names(ipl)["batters"])
 
     if normalized_player:
-        return get_playoff_performance(normalized_player, ipl)
+        return _cached(ipl, ("playoff", normalized_player), lambda: get_playoff_performance(normalized_player, ipl))
 
     # If not a player, try team normalization
     normalized_team = normalize_team_name(player_or_team_name)
     if normalized_team:
-        return get_playoff_performance(normalized_team, ipl)
+        return _cached(ipl, ("playoff", normalized_team), lambda: get_playoff_performance(normalized_team, ipl))
 
     return f"Error:'{player_or_team_name}' not found as a player or team in the dataset."
 
@@ -306,16 +375,19 @@ def get_pair_stats_tool(query: str) -> str:
 
         raw_player1 = match.group(1).strip()
         raw_player2 = match.group(2).strip()
-        season = match.group(3).strip() if match.group(3) else None
-
-        # Prepare list of all unique player names
-        player_names = sorted(set(ipl["batter"].unique().tolist() + ipl["non-striker"].unique().tolist()))
+        season = int(match.group(3)) if match.group(3) else None
 
         # Normalize names
-        player1 = get_normalized_player_name(raw_player1, player_names)
-        player2 = get_normalized_player_name(raw_player2, player_names)
-
-        return get_pair_stats(player1, player2, season)
+        ipl = current_ipl_data()
+        partners = _names(ipl)["partners"]
+        player1 = get_normalized_player_name(raw_player1, partners)
+        player2 = get_normalized_player_name(raw_player2, partners)
+        if not player1 or not player2:
+            return f"Error:Could not find player matching '{raw_player1 if not player1 else raw_player2}'"
+
+        # A partnership is the same either way round; summarise (and cache) it in one order
+        player1, player2 = sorted([player1, player2])
+        return _cached(ipl, ("pair", player1, player2, season), lambda: get_pair_stats(player1, player2, season, ipl))
 
     except Exception as e:
         return f"Error: fetching pair stats: {str(e)}"
@@ -1,85 +1,47 @@
 import pandas as pd
-from src.data_loader import load_ipl_data
-
-ipl = load_ipl_data()
+from src.stats_cube import rollup
+from src.kernels import Segments
 
 def generate_batsman_phasewise_csv(df: pd.DataFrame):
     """
     Generate phase-wise batting stats per batsman, season, venue, and opponent team.
-    
-    Args:
-        input_csv (str): Path to the final IPL CSV file
-        output_csv (str): Path to save the generated batsman phase-wise CSV
-    """
-
-    # --- Define phase function ---
-    def get_phase(over):
-        if 1 <= over <= 6:
-            return "Powerplay"
-        elif 7 <= over <= 15:
-            return "Middle"
-        elif 16 <= over <= 20:
-            return "Death"
-        else:
-            return "Unknown"
 
-    # Ensure overs column is numeric and create phase column
-    df["overs"] = pd.to_numeric(df["overs"], errors="coerce")
-    df["phase"] = df["overs"].apply(get_phase)
-
-    # --- Batsman stats (per match for aggregation) ---
-    batsman_phase = (
-        df.groupby(["batter", "Season", "Venue", "BowlingTeam", "phase", "ID"])
-        .agg(
-            runs=("batsman_run", "sum"),
-            balls=("valid_ball", "sum"),
-            dismissals=("player_out", lambda x: (x.notna()).sum()),
-            fours=("batsman_run", lambda x: (x == 4).sum()),
-            sixes=("batsman_run", lambda x: (x == 6).sum())
-        )
-        .reset_index()
-    )
-
-    # Highest score match-wise
-    batsman_phase["highest_score"] = batsman_phase["runs"]
+    Args:
+        df (pd.DataFrame): Ball-by-ball IPL data
 
-    # Mark not outs
-    batsman_phase["not_out"] = batsman_phase.apply(
-        lambda x: 1 if (x["runs"] > 0 and x["dismissals"] == 0) else 0, axis=1
-    )
+    Returns:
+        pd.DataFrame: The batsman_team_phase_season table
+    """
 
-    # --- Aggregate phase-wise ---
-    batsman_stats = (
-        batsman_phase.groupby(["batter", "Season", "Venue", "BowlingTeam", "phase"])
-        .agg(
-            matches=("ID", "nunique"),
-            innings=("ID", "count"),
-            runs=("runs", "sum"),
-            balls=("balls", "sum"),
-            dismissals=("dismissals", "sum"),
-            not_outs=("not_out", "sum"),
-            fours=("fours", "sum"),
-            sixes=("sixes", "sum"),
-            fifties=("runs", lambda x: (x >= 50).sum()),
-            hundreds=("runs", lambda x: (x >= 100).sum()),
-            highest_score=("highest_score", "max"),
-        )
-        .reset_index()
-    )
+    # --- Batsman stats (per match for aggregation), rolled up from the stats cube ---
+    batsman_phase = rollup(df, "batting", by=["player", "Season", "Venue", "opponent", "phase", "ID"])
+    batsman_phase = batsman_phase.rename(columns={"player": "batter", "opponent": "BowlingTeam"})
+
+    # --- Aggregate phase-wise (one contiguous segment per group, no per-group lambdas) ---
+    keys = ["batter", "Season", "Venue", "BowlingTeam", "phase"]
+    groups = Segments(batsman_phase, keys)
+    runs = batsman_phase["runs"].to_numpy()
+
+    batsman_stats = groups.keys()
+    # Each row is one innings (the roll-up keeps ID), so matches == innings
+    batsman_stats["matches"] = groups.size()
+    batsman_stats["innings"] = groups.size()
+    for measure in ["runs", "balls", "dismissals"]:
+        batsman_stats[measure] = groups.sum(measure)
+    batsman_stats["not_outs"] = groups.count((runs > 0) & (batsman_phase["dismissals"].to_numpy() == 0))
+    batsman_stats["fours"] = groups.sum("fours")
+    batsman_stats["sixes"] = groups.sum("sixes")
+    batsman_stats["fifties"] = groups.count(runs >= 50)
+    batsman_stats["hundreds"] = groups.count(runs >= 100)
+    batsman_stats["highest_score"] = groups.max(runs)
 
     # Batting metrics
-    batsman_stats["average"] = batsman_stats.apply(
-        lambda x: round(x["runs"] / x["dismissals"], 2) if x["dismissals"] > 0 else None, axis=1
-    )
-    batsman_stats["strike_rate"] = batsman_stats.apply(
-        lambda x: round((x["runs"] / x["balls"]) * 100, 2) if x["balls"] > 0 else 0, axis=1
-    )
+    batsman_stats["average"] = (batsman_stats["runs"] / batsman_stats["dismissals"]).round(2).where(batsman_stats["dismissals"] > 0)
+    batsman_stats["strike_rate"] = (batsman_stats["runs"] / batsman_stats["balls"] * 100).round(2).where(batsman_stats["balls"] > 0, 0)
 
-    # Save CSV
-    batsman_stats.to_csv("IPL_Dataset//rag_knowledgebase//batsman_team_phase_season.csv", index=False)
-    print(f"csv generated successfully!")
+    return batsman_stats
 
 
-# Example usage:
 if __name__=="__main__":
-    generate_batsman_phasewise_csv(ipl)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["batsman_team_phase_season"])
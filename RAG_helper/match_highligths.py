@@ -31,11 +31,8 @@ def generate_match_highlights(ipl_df):
             "total_fours": total_fours
         })
 
-    df = pd.DataFrame(highlights)
-    df.to_csv("ipl_dataset//rag_knowledgebase//match_highlights.csv", index=False)
-    print("✅ match_highlights.csv generated successfully!")
+    return pd.DataFrame(highlights)
 
-# Run this function with your loaded IPL data
 if __name__ == "__main__":
-    df = pd.read_csv("ipl_dataset//final_ipl.csv",encoding='ISO-8859-1')
-    generate_match_highlights(df)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["match_highlights"])
@@ -0,0 +1,314 @@
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from src.data_loader import KNOWLEDGE_BASE_DIR, load_ipl_data
+from src.fact_tables import (
+    get_batting_innings, get_bowling_spells, get_delivery_flags, get_match_table, get_phase_partition,
+)
+from src.kernels import Segments
+from src.stats_cube import get_cube
+from core.logger import setup_logger
+
+from RAG_helper.batsman_team_phase_season import generate_batsman_phasewise_csv
+from RAG_helper.batting_phase_stats import generate_batting_phase_stats
+from RAG_helper.boundry_stats import generate_boundary_stats
+from RAG_helper.bowler_phase_team_season import generate_bowler_phasewise_csv
+from RAG_helper.bowler_vs_team import generate_bowling_stats
+from RAG_helper.bowling_phase_stat import generate_bowling_phase_stats
+from RAG_helper.match_highligths import generate_match_highlights
+from RAG_helper.player_boundry_stats import generate_boundary_stats_csv
+from RAG_helper.player_stats import calculate_player_stats
+from RAG_helper.player_vs_team import generate_player_batting_stats
+from RAG_helper.playoff_stats import update_playoff_stats
+from RAG_helper.powerplay_stats import generate_team_powerplay_stats
+from RAG_helper.season_summary import generate_season_summary
+from RAG_helper.team_records import generate_team_record
+from RAG_helper.team_vs_team import generate_team_vs_team_stats
+from RAG_helper.venue_stats import generate_venue_stats_per_season
+
+logger = setup_logger(__name__)
+
+# Generator name -> (function of the ball-by-ball frame returning the table, output file, grain).
+# The grain (kind, output column) says which rows of the output a changed match can affect:
+#   "match":  only the rows of that match ID,
+#   "season": only the rows of that match's season,
+#   "player": only the rows of players who appear in that match.
+GENERATORS = {
+    "batsman_team_phase_season": (generate_batsman_phasewise_csv, "batsman_team_phase_season.csv", ("season", "Season")),
+    "batting_phase_stats": (generate_batting_phase_stats, "batting_phase_stats.csv", ("player", "batter")),
+    "boundary_stats": (generate_boundary_stats, "boundary_stats1.csv", ("season", "Season")),
+    "bowler_team_phase_season": (generate_bowler_phasewise_csv, "bowler_team_phase_season.csv", ("season", "Season")),
+    "bowler_vs_team": (generate_bowling_stats, "bolwer_vs_team_season_venue.csv", ("season", "season")),
+    "bowling_phase_stats": (generate_bowling_phase_stats, "bowling_phase_stats.csv", ("player", "bowler")),
+    "match_highlights": (generate_match_highlights, "match_highlights.csv", ("match", "match_id")),
+    "player_boundary_stats": (generate_boundary_stats_csv, "player_boundary_stats.csv", ("player", "player")),
+    "player_stats": (calculate_player_stats, "player_stats.csv", ("player", "Player")),
+    "player_vs_team": (generate_player_batting_stats, "player_vs_team_season_venue.csv", ("season", "Season")),
+    "playoff_stats": (update_playoff_stats, "playoff_stats.csv", ("player", "player")),
+    "powerplay_stats": (generate_team_powerplay_stats, "powerplay_stats.csv", ("match", "ID")),
+    "season_summary": (generate_season_summary, "season_summary_final1.csv", ("season", "Season")),
+    "team_records": (generate_team_record, "team_records_seasonwise.csv", ("season", "season")),
+    "team_vs_team": (generate_team_vs_team_stats, "team_vs_team_season.csv", ("season", "season")),
+    "venue_stats": (generate_venue_stats_per_season, "venue_stats_season1.csv", ("season", "Season")),
+}
+
+# Per-generator record of the matches each output was built from, kept in the output folder
+MANIFEST_FILE = "kb_manifest.json"
+# Manifest entry: match content hash -> players in that version of the match (shared by all generators)
+MATCH_PLAYERS_KEY = "_match_players"
+# Columns naming a player who took part in a delivery
+ROLE_COLUMNS = ['batter', 'non-striker', 'bowler', 'player_out']
+
+# The frame every generator reads. Set before the pool starts so forked workers
+# inherit it (copy-on-write) instead of each loading the data again.
+_shared = {}
+
+
+def _warm_up(ipl):
+    """Build the derived tables the generators share, once, before the workers start."""
+    get_delivery_flags(ipl)
+    get_phase_partition(ipl)
+    get_match_table(ipl)
+    get_batting_innings(ipl)
+    get_bowling_spells(ipl)
+    get_cube(ipl, "batting")
+    get_cube(ipl, "bowling")
+
+
+def _init_worker(source):
+    # Only needed where workers are spawned rather than forked
+    if "ipl" not in _shared:
+        _shared["ipl"] = load_ipl_data(source)
+
+
+def write_table(table, path):
+    """Write ``table`` to the CSV ``path`` atomically (temp file, then rename)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    table.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def match_fingerprints(ipl):
+    """
+    Content hash and season of every match.
+
+    Returns:
+        dict: str(match ID) -> [hash of the match's deliveries (hex), season].
+    """
+    row_hashes = pd.util.hash_pandas_object(ipl, index=False).to_numpy().view(np.int64)
+    matches = Segments(ipl, ['ID'])
+    hashes = matches.sum(row_hashes).view(np.uint64)
+    return {
+        str(match_id): [format(int(digest), 'x'), int(season)]
+        for match_id, digest, season in zip(matches.first('ID'), hashes, matches.first('Season'))
+    }
+
+
+def match_players(ipl, fingerprints):
+    """
+    Players (in any role) of every match, keyed by the match's content hash.
+
+    Returns:
+        dict: hash (as in ``match_fingerprints``) -> sorted player names.
+    """
+    roles = pd.concat([
+        pd.DataFrame({'ID': ipl['ID'], 'player': ipl[column].astype(object)}) for column in ROLE_COLUMNS
+    ], ignore_index=True).dropna().drop_duplicates()
+    players = roles.groupby('ID')['player'].agg(lambda names: sorted(map(str, names)))
+    return {fingerprints[str(match_id)][0]: names for match_id, names in players.items()}
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, output_dir):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(manifest, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def plan_update(name, current, previous, output_dir, players_by_hash):
+    """
+    What generator ``name`` has to recompute, given the current and recorded match fingerprints.
+
+    A changed or removed match touches the partitions it falls in now *and* the
+    ones its recorded version fell in (its old season, its old players), so rows
+    built from the old version never survive.
+
+    Args:
+        players_by_hash (dict): Match content hash -> players, for current and recorded matches.
+
+    Returns:
+        "skip" when nothing it depends on changed, "full" when it must be rebuilt
+        from scratch, else (grain kind, set of partition values) to recompute.
+    """
+    _, filename, (kind, _) = GENERATORS[name]
+    if previous is None or not os.path.exists(os.path.join(output_dir, filename)):
+        return "full"
+
+    changed = {match_id for match_id, (digest, _) in current.items() if previous.get(match_id, [None])[0] != digest}
+    removed = set(previous) - set(current)
+    if not changed and not removed:
+        return "skip"
+
+    before = [previous[match_id] for match_id in changed | removed if match_id in previous]
+    after = [current[match_id] for match_id in changed]
+    if kind == "match":
+        return kind, changed | removed
+    if kind == "season":
+        return kind, {season for _, season in before + after}
+    # Without the players of a recorded version (older manifests), rebuild everything
+    if any(digest not in players_by_hash for digest, _ in before + after):
+        return "full"
+    return kind, {player for digest, _ in before + after for player in players_by_hash[digest]}
+
+
+def _partition_rows(ipl, kind, values):
+    """The deliveries needed to recompute the ``values`` partitions of a ``kind`` grain."""
+    if kind == "match":
+        return ipl[ipl['ID'].astype(str).isin(values)]
+    if kind == "season":
+        return ipl[ipl['Season'].astype(str).isin(values)]
+    involved = np.zeros(len(ipl), dtype=bool)
+    for column in ROLE_COLUMNS:
+        involved |= ipl[column].isin(values).to_numpy()
+    return ipl[involved]
+
+
+def run_generator(name, output_dir, plan="full"):
+    """
+    Run one generator on the shared frame and write its CSV.
+
+    With a (kind, values) ``plan`` only those partitions are recomputed, from
+    the deliveries they depend on, and merged into the existing CSV.
+
+    Returns:
+        tuple: (name, seconds taken, rows written).
+    """
+    generate, filename, (_, column) = GENERATORS[name]
+    path = os.path.join(output_dir, filename)
+    start = time.perf_counter()
+
+    if plan == "full":
+        table = generate(_shared["ipl"])
+    else:
+        kind, values = plan
+        values = {str(value) for value in values}
+        rows = _partition_rows(_shared["ipl"], kind, values)
+        fresh = generate(rows) if len(rows) else pd.DataFrame(columns=[column])
+        existing = pd.read_csv(path)
+        table = pd.concat([
+            existing[~existing[column].astype(str).isin(values)],
+            fresh[fresh[column].astype(str).isin(values)],
+        ], ignore_index=True)
+
+    write_table(table, path)
+    return name, time.perf_counter() - start, len(table)
+
+
+def run_pipeline(only=None, output_dir=KNOWLEDGE_BASE_DIR, workers=None, source="final", full=False):
+    """
+    Rebuild the knowledge-base CSVs in parallel from one load of the IPL data.
+
+    The data (and the tables derived from it) is loaded once in this process and
+    shared read-only with a process pool; each generator runs in a worker and
+    writes its CSV atomically to ``output_dir``.
+
+    Unless ``full`` is set, the build is incremental: matches whose deliveries
+    changed since the last run (per the manifest in ``output_dir``) are mapped
+    to the partitions of each generator's grain, and only those are recomputed.
+
+    Args:
+        only (list or None): Generator names to run (keys of GENERATORS); None runs all.
+        output_dir (str): Folder the CSVs are written to.
+        workers (int or None): Pool size; defaults to one per generator, capped at the CPU count.
+        source (str): Data source passed to load_ipl_data.
+        full (bool): Rebuild every output from scratch.
+
+    Returns:
+        dict: Generator name -> seconds taken, "up to date", or the exception it raised.
+    """
+    names = list(GENERATORS) if only is None else list(only)
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        raise ValueError(f"Unknown generators {unknown}. Choose from {list(GENERATORS)}.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    ipl = load_ipl_data(source)
+    if ipl.empty:
+        raise RuntimeError(f"No IPL data loaded for source '{source}'; knowledge base not rebuilt.")
+
+    manifest = load_manifest(output_dir)
+    current = match_fingerprints(ipl)
+    players_by_hash = {**manifest.get(MATCH_PLAYERS_KEY, {}), **match_players(ipl, current)}
+    plans = {
+        name: "full" if full else plan_update(name, current, manifest.get(name), output_dir, players_by_hash)
+        for name in names
+    }
+    results = {name: "up to date" for name, plan in plans.items() if plan == "skip"}
+    pending = [name for name in names if plans[name] != "skip"]
+
+    if any(plans[name] == "full" for name in pending):
+        _warm_up(ipl)
+    _shared["ipl"] = ipl
+    logger.info(f"Loaded and prepared {len(ipl)} deliveries in {time.perf_counter() - start:.2f}s.")
+
+    def record(name, seconds, rows):
+        results[name] = seconds
+        manifest[name] = current
+        scope = "all" if plans[name] == "full" else f"{len(plans[name][1])} {plans[name][0]} partition(s)"
+        logger.info(f"{name}: {rows} rows in {seconds:.2f}s ({scope})")
+
+    if len(pending) == 1:
+        record(*run_generator(pending[0], output_dir, plans[pending[0]]))
+    elif pending:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        workers = workers or min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(source,)) as pool:
+            futures = {pool.submit(run_generator, name, output_dir, plans[name]): name for name in pending}
+            for future in as_completed(futures):
+                try:
+                    record(*future.result())
+                except Exception as e:
+                    results[futures[future]] = e
+                    logger.exception(f"Generator '{futures[future]}' failed: {e}")
+
+    # Keep the players of every match version some output still reflects
+    recorded = {digest for name in GENERATORS if name in manifest for digest, _ in manifest[name].values()}
+    manifest[MATCH_PLAYERS_KEY] = {digest: players for digest, players in players_by_hash.items() if digest in recorded}
+    save_manifest(manifest, output_dir)
+
+    total = time.perf_counter() - start
+    print(f"📚 Knowledge base rebuilt in {total:.2f}s ({output_dir})")
+    for name in names:
+        outcome = results[name]
+        if isinstance(outcome, Exception):
+            print(f"  ❌ {name}: {outcome}")
+        elif isinstance(outcome, str):
+            print(f"  ⏭️ {name}: {outcome}")
+        else:
+            print(f"  ✅ {name}: {outcome:.2f}s")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the RAG knowledge-base CSVs.")
+    parser.add_argument("generators", nargs="*", help=f"Generators to run (default: all of {', '.join(GENERATORS)})")
+    parser.add_argument("--output", default=KNOWLEDGE_BASE_DIR, help="Output folder")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size")
+    parser.add_argument("--full", action="store_true", help="Rebuild every output instead of only what changed")
+    args = parser.parse_args()
+    run_pipeline(only=args.generators or None, output_dir=args.output, workers=args.workers, full=args.full)
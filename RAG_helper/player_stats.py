@@ -1,57 +1,50 @@
 import pandas as pd
 
-def calculate_player_stats(csv_path):
-    df = pd.read_csv(csv_path, encoding='ISO-8859-1')
+
+def calculate_player_stats(df):
     df = df.dropna(subset=["batter", "bowler"])
 
-    player_stats = {}
-
-    batters = df.groupby("batter")
-    bowlers = df.groupby("bowler")
-
-    all_players = set(df["batter"].unique()).union(set(df["bowler"].unique()))
-
-    for player in all_players:
-        # Batting stats
-        if player in batters.groups:
-            bdf = batters.get_group(player)
-            total_runs = bdf["batsman_run"].sum()
-            balls_faced = bdf["ballnumber"].count()
-            fours = (bdf["batsman_run"] == 4).sum()
-            sixes = (bdf["batsman_run"] == 6).sum()
-            matches = bdf["ID"].nunique()
-            innings = bdf["ID"].nunique()
-
-            player_match_runs = bdf.groupby("ID")["batsman_run"].sum()
-            fifties = player_match_runs[(player_match_runs >= 50) & (player_match_runs < 100)].count()
-            hundreds = player_match_runs[player_match_runs >= 100].count()
-
-            dismissals = df[(df["player_out"] == player)].shape[0]
-            strike_rate = (total_runs / balls_faced) * 100 if balls_faced else 0
-            batting_avg = (total_runs / dismissals) if dismissals else None
-        else:
-            total_runs = balls_faced = fours = sixes = matches = innings = strike_rate = batting_avg = dismissals = fifties = hundreds = 0
-
-       
-        player_stats[player] = {
-            "Matches": matches,
-            "Innings": innings,
-            "Runs": total_runs,
-            "BallsFaced": balls_faced,
-            "Fours": fours,
-            "Sixes": sixes,
-            "Dismissals": dismissals,
-            "50s": fifties,
-            "100s": hundreds,
-            "StrikeRate": round(strike_rate, 2) if strike_rate else 0,
-            "BattingAverage": round(batting_avg, 2) if batting_avg else None,
-        }
-
-    final_df = pd.DataFrame.from_dict(player_stats, orient='index').reset_index().rename(columns={"index": "Player"})
-    final_df.to_csv("IPL_Dataset//rag_knowledgebase//player_stats.csv", index=False)
-    print("✅ Player stats saved to 'player_stats.csv'")
-
-# Example usage:
-# calculate_player_stats("final_ipl.csv")
+    # Batting totals per batter (balls faced counts every delivery the batter was on strike for)
+    batting = pd.DataFrame({
+        'batter': df['batter'].astype(str),
+        'ID': df['ID'],
+        'runs': df['batsman_run'],
+        'balls': df['ballnumber'].notna(),
+        'fours': df['batsman_run'] == 4,
+        'sixes': df['batsman_run'] == 6,
+    })
+    batters = batting.groupby('batter')
+    stats = batters[['runs', 'balls', 'fours', 'sixes']].sum()
+    stats['matches'] = batters['ID'].nunique()
+
+    # Fifties and hundreds from per-match runs
+    match_runs = batting.groupby(['batter', 'ID'])['runs'].sum()
+    stats['fifties'] = ((match_runs >= 50) & (match_runs < 100)).groupby(level='batter').sum()
+    stats['hundreds'] = (match_runs >= 100).groupby(level='batter').sum()
+    stats['dismissals'] = df['player_out'].astype(str)[df['player_out'].notna()].value_counts().reindex(stats.index, fill_value=0)
+
+    # Every batter and bowler gets a row; bowlers who never batted have zero batting stats
+    players = sorted(set(stats.index) | set(df['bowler'].astype(str)))
+    stats = stats.reindex(players, fill_value=0)
+
+    strike_rate = (stats['runs'] / stats['balls'] * 100).where(stats['balls'] > 0, 0)
+    batting_avg = stats['runs'] / stats['dismissals'].where(stats['dismissals'] > 0)
+
+    return pd.DataFrame({
+        "Player": players,
+        "Matches": stats['matches'].to_numpy(),
+        "Innings": stats['matches'].to_numpy(),
+        "Runs": stats['runs'].to_numpy(),
+        "BallsFaced": stats['balls'].to_numpy(),
+        "Fours": stats['fours'].to_numpy(),
+        "Sixes": stats['sixes'].to_numpy(),
+        "Dismissals": stats['dismissals'].to_numpy(),
+        "50s": stats['fifties'].to_numpy(),
+        "100s": stats['hundreds'].to_numpy(),
+        "StrikeRate": strike_rate.round(2).to_numpy(),
+        "BattingAverage": batting_avg.round(2).where(batting_avg != 0).to_numpy(),
+    })
+
 if __name__=="__main__":
-    calculate_player_stats("IPL_Dataset//final_ipl.csv")
\ No newline at end of file
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["player_stats"])
@@ -1,35 +1,34 @@
 import pandas as pd
-from src.data_loader import load_ipl_data
+from src.fact_tables import get_batting_innings
+from src.stats_cube import rollup
+from src.kernels import Segments
 
 def generate_player_batting_stats(df):
     # Ensure correct column names exist
     required_cols = ['batter', 'Season', 'Venue', 'BattingTeam', 'BowlingTeam', 
-                     'batsman_run', 'ballnumber', 'player_out', 'isWicketDelivery', 'ID', 'date']
+                     'batsman_run', 'ballnumber', 'player_out', 'isWicketDelivery', 'ID', 'Date']
     for col in required_cols:
         if col not in df.columns:
             raise ValueError(f"Missing column: {col}")
 
-    # Step 1: Calculate per-innings runs for fifties/hundreds & highest score
-    innings_runs = df.groupby(['batter', 'Season', 'Venue', 'BowlingTeam', 'ID'])['batsman_run'].sum().reset_index()
-
-    # Step 2: Count fifties and hundreds
-    fifties_hundreds = innings_runs.groupby(['batter', 'Season', 'Venue', 'BowlingTeam']).agg(
-        fifties=('batsman_run', lambda x: ((x >= 50) & (x < 100)).sum()),
-        hundreds=('batsman_run', lambda x: (x >= 100).sum()),
-        highest_score=('batsman_run', 'max')
-    ).reset_index()
-
-    # Step 3: Main aggregation for totals
-    batting_stats = df.groupby(['batter', 'Season', 'Venue', 'BowlingTeam']).agg(
-        matches=('date', 'nunique'),          # Unique matches
-        innings=('ID', 'nunique'),      # Unique innings
-        runs=('batsman_run', 'sum'),
-        balls_faced=('ballnumber', 'count'),
-        dismissals=('player_out', lambda x: x.notnull().sum()),
-        not_outs=('player_out', lambda x: x.isnull().sum()),
-        fours=('batsman_run', lambda x: (x == 4).sum()),
-        sixes=('batsman_run', lambda x: (x == 6).sum())
-    ).reset_index()
+    # Step 1: Per-innings runs for fifties/hundreds & highest score
+    innings_runs = get_batting_innings(df).rename(columns={'opponent': 'BowlingTeam'})
+    runs = innings_runs['runs'].to_numpy()
+
+    # Step 2: Count fifties and hundreds (segment reductions over the sorted innings)
+    groups = Segments(innings_runs, ['batter', 'Season', 'Venue', 'BowlingTeam'])
+    fifties_hundreds = groups.keys()
+    fifties_hundreds['fifties'] = groups.count((runs >= 50) & (runs <= 99))
+    fifties_hundreds['hundreds'] = groups.count(runs >= 100)
+    fifties_hundreds['highest_score'] = groups.max(runs)
+
+    # Step 3: Main aggregation for totals (roll-up of the stats cube)
+    batting_stats = rollup(df, "batting", by=['player', 'Season', 'Venue', 'opponent'])
+    batting_stats = batting_stats.rename(columns={'player': 'batter', 'opponent': 'BowlingTeam', 'balls': 'balls_faced'})
+    batting_stats['innings'] = batting_stats['matches']
+    batting_stats['not_outs'] = batting_stats['innings'] - batting_stats['dismissals']
+    batting_stats = batting_stats[['batter', 'Season', 'Venue', 'BowlingTeam', 'matches', 'innings', 'runs',
+                                   'balls_faced', 'dismissals', 'not_outs', 'fours', 'sixes']]
 
     # Step 4: Merge fifties, hundreds, highest score
     batting_stats = batting_stats.merge(fifties_hundreds, 
@@ -37,19 +36,12 @@ def generate_player_batting_stats(df):
                                         how='left')
 
     # Step 5: Calculate average and strike rate
-    batting_stats['average'] = batting_stats.apply(
-        lambda x: round(x['runs'] / x['dismissals'], 2) if x['dismissals'] > 0 else None, axis=1
-    )
-    batting_stats['strike_rate'] = batting_stats.apply(
-        lambda x: round((x['runs'] / x['balls_faced']) * 100, 2) if x['balls_faced'] > 0 else 0, axis=1
-    )
+    batting_stats['average'] = (batting_stats['runs'] / batting_stats['dismissals']).round(2).where(batting_stats['dismissals'] > 0)
+    batting_stats['strike_rate'] = (batting_stats['runs'] / batting_stats['balls_faced'] * 100).round(2).where(batting_stats['balls_faced'] > 0, 0)
 
-    # Step 6: Save CSV
-    batting_stats.to_csv("IPL_Dataset//rag_knowledgebase//player_vs_team_season_venue.csv", index=False)
-    print(f" Player batting stats saved to")
+    return batting_stats
 
 
-# Example usage:
 if __name__ == "__main__":
- df = load_ipl_data()
- generate_player_batting_stats(df)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["player_vs_team"])
@@ -2,34 +2,38 @@ import pandas as pd
 
 def update_playoff_stats(df):
     playoff_matches = df[df["MatchNumber"].str.contains("Qualifier|Eliminator|Final", case=False, na=False)]
-    records = []
 
-    for player in playoff_matches["batter"].unique():
-        player_df = playoff_matches[playoff_matches["batter"] == player]
-        runs = player_df["batsman_run"].sum()
-        balls = player_df.shape[0]
-        strike_rate = (runs / balls) * 100 if balls else 0
+    # One grouped pass per role instead of two scans of the playoff rows per player
+    batting = playoff_matches.groupby("batter", observed=True).agg(
+        total_runs=("batsman_run", "sum"),
+        balls_faced=("batsman_run", "size"),
+    )
+    bowling = pd.DataFrame({
+        "bowler": playoff_matches["bowler"],
+        "wickets": (playoff_matches["isWicketDelivery"] == 1) & playoff_matches["player_out"].notnull(),
+        "runs_conceded": playoff_matches["total_run"],
+    }).groupby("bowler", observed=True).agg(
+        wickets=("wickets", "sum"),
+        runs_conceded=("runs_conceded", "sum"),
+        balls=("wickets", "size"),
+    )
 
-        # Bowling side for same player
-        bowling_df = playoff_matches[playoff_matches["bowler"] == player]
-        wickets = bowling_df[bowling_df["isWicketDelivery"] == 1]["player_out"].notnull().sum()
-        runs_conceded = bowling_df["total_run"].sum()
-        overs_bowled = bowling_df.shape[0] / 6
-        economy = runs_conceded / overs_bowled if overs_bowled else 0
+    # Players in order of their first playoff appearance as batter
+    players = pd.Index(playoff_matches["batter"].drop_duplicates())
+    batting = batting.reindex(players)
+    bowling = bowling.reindex(players, fill_value=0)
 
-        records.append({
-            "player": player,
-            "total_runs": runs,
-            "balls_faced": balls,
-            "strike_rate": round(strike_rate, 2),
-            "wickets": wickets,
-            "runs_conceded": runs_conceded,
-            "economy": round(economy, 2) if overs_bowled else None
-        })
-
-    return pd.DataFrame(records)
+    overs_bowled = bowling["balls"] / 6
+    return pd.DataFrame({
+        "player": players.astype(str),
+        "total_runs": batting["total_runs"].to_numpy(),
+        "balls_faced": batting["balls_faced"].to_numpy(),
+        "strike_rate": (batting["total_runs"] / batting["balls_faced"] * 100).round(2).to_numpy(),
+        "wickets": bowling["wickets"].to_numpy(),
+        "runs_conceded": bowling["runs_conceded"].to_numpy(),
+        "economy": (bowling["runs_conceded"] / overs_bowled).round(2).where(bowling["balls"] > 0).to_numpy(),
+    })
 
 if __name__ == "__main__":
-    df = pd.read_csv("IPL_Dataset/final_ipl.csv", encoding="ISO-8859-1")
-    playoff_stats_df = update_playoff_stats(df)
-    playoff_stats_df.to_csv("IPL_Dataset/rag_knowledgebase/playoff_stats.csv", index=False)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["playoff_stats"])
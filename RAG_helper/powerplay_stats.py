@@ -1,14 +1,8 @@
-import pandas as pd
+from src.fact_tables import get_phase_partition
 
-def generate_team_powerplay_stats(csv_path):
-    # Load the final IPL dataset
-    df = pd.read_csv(csv_path, encoding='ISO-8859-1')
-
-    # Ensure overs are numeric
-    df['overs'] = pd.to_numeric(df['overs'], errors='coerce')
-
-    # Filter only Powerplay overs (0.0 to 5.6)
-    powerplay_df = df[df['overs'] < 6]
+def generate_team_powerplay_stats(df):
+    # Powerplay deliveries are one precomputed slice of the frame; the shared frame is not modified
+    powerplay_df = get_phase_partition(df).rows(df, 'Powerplay')
 
     # Group by match and innings level
     group_cols = ['Season', 'ID', 'innings', 'BattingTeam', 'BowlingTeam', 'Venue']
@@ -31,9 +25,8 @@ def generate_team_powerplay_stats(csv_path):
         'powerplay_runs', 'powerplay_wickets'
     ]]
 
-    # Save to CSV
-    powerplay_stats.to_csv("IPL_Dataset//rag_knowledgebase//powerplay_stats.csv", index=False)
+    return powerplay_stats
 
-# Run as script
 if __name__ == "__main__":
-    generate_team_powerplay_stats("IPL_Dataset//final_ipl.csv")
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["powerplay_stats"])
@@ -5,12 +5,13 @@ from langchain_community.vectorstores import FAISS
 from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
 from dotenv import load_dotenv
+from src.data_loader import DATA_DIR, KNOWLEDGE_BASE_DIR
 
 load_dotenv()
 
 # === Configuration ===
-DATA_FOLDER = "IPL_Dataset/rag_knowledgebase"   # Folder containing all CSVs
-VECTOR_STORE_PATH = "IPL_Dataset/vectorstore"
+DATA_FOLDER = KNOWLEDGE_BASE_DIR   # Folder containing all CSVs
+VECTOR_STORE_PATH = os.path.join(DATA_DIR, "vectorstore")
 EMBEDDING_MODEL_NAME = "text-embedding-3-large"
 
 # === Convert a single CSV into Documents (row-based) ===
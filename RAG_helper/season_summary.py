@@ -1,5 +1,4 @@
 import pandas as pd
-from src.data_loader import load_ipl_data
 
 def generate_season_summary(df):
 
@@ -15,20 +14,20 @@ def generate_season_summary(df):
         total_boundary_runs = (total_fours * 4) + (total_sixes * 6)
 
         # Highest team total in a match
-        match_runs = season_df.groupby(['ID', 'BattingTeam'])['total_run'].sum().reset_index()
+        match_runs = season_df.groupby(['ID', 'BattingTeam'], observed=True)['total_run'].sum().reset_index()
         top_score_row = match_runs.loc[match_runs['total_run'].idxmax()]
         highest_score_team = top_score_row['BattingTeam']
         highest_score_runs = top_score_row['total_run']
         highest_score_match_id = top_score_row['ID']
 
         # Top batsman (Orange Cap)
-        top_batsman_stats = season_df.groupby('batter')['batsman_run'].sum().reset_index()
+        top_batsman_stats = season_df.groupby('batter', observed=True)['batsman_run'].sum().reset_index()
         top_batsman_stats = top_batsman_stats.sort_values(by='batsman_run', ascending=False).head(1)
         top_batsman = top_batsman_stats.iloc[0]['batter']
         top_batsman_runs = top_batsman_stats.iloc[0]['batsman_run']
 
         # Top bowler (Purple Cap)
-        top_bowler_stats = season_df[season_df['isWicketDelivery'] == 1].groupby('bowler')['player_out'].count().reset_index()
+        top_bowler_stats = season_df[season_df['isWicketDelivery'] == 1].groupby('bowler', observed=True)['player_out'].count().reset_index()
         top_bowler_stats = top_bowler_stats.sort_values(by='player_out', ascending=False).head(1)
         top_bowler = top_bowler_stats.iloc[0]['bowler']
         top_bowler_wickets = top_bowler_stats.iloc[0]['player_out']
@@ -58,14 +57,9 @@ def generate_season_summary(df):
             'Season Winner': winner
         })
 
-    summary_df = pd.DataFrame(summary)
+    return pd.DataFrame(summary)
 
-    # Save to CSV
-    summary_df.to_csv("IPL_Dataset//rag_knowledgebase//season_summary_final1.csv", index=False)
-    print(f"✅ Season summary saved to:")
 
-
-# Example usage
 if __name__=="__main__":
-    ipl = load_ipl_data()
-    generate_season_summary(ipl)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["season_summary"])
@@ -1,86 +1,65 @@
+import numpy as np
 import pandas as pd
-from src.data_loader import load_ipl_data
+from src.fact_tables import get_batting_innings, get_bowling_spells, get_match_table
 
 def generate_team_record(df):
-   
-    # Strip spaces from key columns
-    for col in ['BattingTeam', 'bowler', 'batter', 'WinningTeam', 'Team1', 'Team2']:
-        df[col] = df[col].str.strip()
-
-    teams = pd.unique(df['Team1'].tolist() + df['Team2'].tolist())
-    seasons = df['Season'].unique()
-    final_stats = []
-
-    for season in seasons:
-        season_df = df[df['Season'] == season]
-
-        for team in teams:
-            team_matches = season_df[(season_df['Team1'] == team) | (season_df['Team2'] == team)]
-            match_ids = team_matches['ID'].unique()
-            total_matches = len(match_ids)
-
-            # Wins
-            wins = season_df[season_df['WinningTeam'] == team]['ID'].nunique()
-
-            # No Result
-            decided_matches = season_df[~season_df['WinningTeam'].isna()]
-            no_result = total_matches - decided_matches[
-                (decided_matches['Team1'] == team) | (decided_matches['Team2'] == team)
-            ]['ID'].nunique()
-
-            # Losses
-            losses = total_matches - wins - no_result
-
-            # Win %
-            win_pct = round((wins / total_matches) * 100, 2) if total_matches > 0 else 0.0
-
-            # Runs scored
-            team_runs = season_df[season_df['BattingTeam'] == team].groupby('ID')['total_run'].sum().sum()
-
-            # Wickets taken
-            wickets_taken = season_df[
-                (season_df['isWicketDelivery'] == 1) &
-                ((season_df['Team1'] == team) | (season_df['Team2'] == team)) &
-                (season_df['BattingTeam'] != team)
-            ]
-            total_wickets = wickets_taken['player_out'].count()
-
-            # 50s and 100s
-            innings_runs = season_df[season_df['BattingTeam'] == team] \
-                .groupby(['ID', 'batter'])['batsman_run'].sum().reset_index()
-            fifties = innings_runs[(innings_runs['batsman_run'] >= 50) &
-                                   (innings_runs['batsman_run'] < 100)].shape[0]
-            hundreds = innings_runs[innings_runs['batsman_run'] >= 100].shape[0]
-
-            # 3W and 5W hauls
-            bowler_hauls = season_df[
-                (season_df['isWicketDelivery'] == 1) & (season_df['BattingTeam'] != team)
-            ].groupby(['ID', 'bowler'])['player_out'].count().reset_index()
-            threes = bowler_hauls[(bowler_hauls['player_out'] >= 3) &
-                                  (bowler_hauls['player_out'] < 5)].shape[0]
-            fives = bowler_hauls[bowler_hauls['player_out'] >= 5].shape[0]
-
-            final_stats.append({
-                'season': season,
-                'team': team,
-                'matches_played': total_matches,
-                'wins': wins,
-                'losses': losses,
-                'no_result': no_result,
-                'win_%': win_pct,
-                'total_runs_scored': team_runs,
-                'total_wickets_taken': total_wickets,
-                '50s': fifties,
-                '100s': hundreds,
-                '3w_hauls': threes,
-                '5w_hauls': fives
-            })
-
-    df_result = pd.DataFrame(final_stats)
-    df_result.to_csv("IPL_Dataset//rag_knowledgebase//team_records_seasonwise.csv", index=False)
-    print("✅ season-wise team_record.csv generated successfully.")
+    """
+    Season-wise record of every team: results, runs, wickets, 50s/100s and 3W/5W hauls.
+
+    Teams get a row only for the seasons they played in.
+
+    Args:
+        df (pd.DataFrame): Ball-by-ball IPL data
+
+    Returns:
+        pd.DataFrame: One row per (season, team)
+    """
+    keys = ['Season', 'team']
+
+    # Results: each match counted once for each of its two teams
+    matches = get_match_table(df)
+    sides = pd.concat([
+        pd.DataFrame({'Season': matches['Season'], 'team': matches[column].astype(str),
+                      'won': matches['WinningTeam'].astype(str) == matches[column].astype(str),
+                      'no_result': matches['WinningTeam'].isna()})
+        for column in ['Team1', 'Team2']
+    ])
+    records = sides.groupby(keys).agg(
+        matches_played=('won', 'size'), wins=('won', 'sum'), no_result=('no_result', 'sum'),
+    )
+
+    # Runs scored while batting; wickets (all dismissals) taken while bowling
+    runs = df.groupby(['Season', df['BattingTeam'].astype(str).rename('team')])['total_run'].sum()
+    dismissals = df[(df['isWicketDelivery'] == 1) & df['player_out'].notna()]
+    wickets = dismissals.groupby(['Season', dismissals['BowlingTeam'].astype(str).rename('team')]).size()
+
+    # 50s/100s from the batter-innings table, 3W/5W hauls from the bowling-spell table
+    innings = get_batting_innings(df).assign(team=lambda t: t['team'].astype(str))
+    fifties = innings['runs'].between(50, 99).groupby([innings['Season'], innings['team']]).sum()
+    hundreds = (innings['runs'] >= 100).groupby([innings['Season'], innings['team']]).sum()
+    spells = get_bowling_spells(df).assign(team=lambda t: t['team'].astype(str))
+    threes = spells['wickets'].between(3, 4).groupby([spells['Season'], spells['team']]).sum()
+    fives = (spells['wickets'] >= 5).groupby([spells['Season'], spells['team']]).sum()
+
+    for column, values in [('total_runs_scored', runs), ('total_wickets_taken', wickets), ('50s', fifties),
+                           ('100s', hundreds), ('3w_hauls', threes), ('5w_hauls', fives)]:
+        records[column] = values.reindex(records.index, fill_value=0).astype(np.int64)
+
+    records['losses'] = records['matches_played'] - records['wins'] - records['no_result']
+    records['win_%'] = (records['wins'] / records['matches_played'] * 100).round(2)
+
+    # Seasons, then teams, in order of first appearance in the data
+    records = records.reset_index()
+    season_order = {season: i for i, season in enumerate(df['Season'].unique())}
+    team_order = {team: i for i, team in enumerate(pd.unique(pd.concat([df['Team1'], df['Team2']]).astype(str)))}
+    records = records.iloc[np.lexsort((records['team'].map(team_order), records['Season'].map(season_order)))]
+
+    return records.rename(columns={'Season': 'season'})[[
+        'season', 'team', 'matches_played', 'wins', 'losses', 'no_result', 'win_%',
+        'total_runs_scored', 'total_wickets_taken', '50s', '100s', '3w_hauls', '5w_hauls',
+    ]].reset_index(drop=True)
 
 
 if __name__ == "__main__":
-    ipl = load_ipl_data()
-    generate_team_record(ipl)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["team_records"])
@@ -1,113 +1,116 @@
+import numpy as np
 import pandas as pd
-from src.data_loader import load_ipl_data
+from src.fact_tables import BOWLER_WICKET_KINDS, get_match_table
+
+KEYS = ['Season', 'team_pair']
+
+
+def _top_by_group(counts, name, value):
+    """The first ``name`` with the largest ``value`` per (Season, team_pair); ties go to the first name in sorted order."""
+    ranked = counts.sort_values(KEYS + [value], ascending=[True, True, False], kind='stable')
+    return ranked.groupby(KEYS, observed=True)[[name, value]].first()
+
 
 def generate_team_vs_team_stats(df):
+    """
+    Head-to-head statistics for every pair of teams that met in a season.
+
+    Args:
+        df (pd.DataFrame): Ball-by-ball IPL data (not modified)
+
+    Returns:
+        pd.DataFrame: One row per (season, team pair), team1/team2 in alphabetical order
+    """
+    # --- Unordered team pair, derived once per match ---
+    matches = get_match_table(df)
+    team1 = matches['Team1'].astype(object)
+    team2 = matches['Team2'].astype(object)
+    first, second = np.where(team1 <= team2, team1, team2), np.where(team1 <= team2, team2, team1)
+    pair_names = pd.Series(first, dtype=object) + '_vs_' + pd.Series(second, dtype=object)
+    pair = pd.Categorical(pair_names, categories=sorted(pair_names.unique()))
+
+    winner = matches['WinningTeam'].astype(object).to_numpy()
+    results = pd.DataFrame({
+        'Season': matches['Season'].to_numpy(), 'team_pair': pair,
+        'team1_wins': winner == first, 'team2_wins': winner == second,
+    })
+    stats = results.groupby(KEYS, observed=True).agg(
+        matches=('team1_wins', 'size'), team1_wins=('team1_wins', 'sum'), team2_wins=('team2_wins', 'sum'),
+    )
+    stats['no_result'] = stats['matches'] - (stats['team1_wins'] + stats['team2_wins'])
+    stats['team1_win_%'] = (stats['team1_wins'] / stats['matches'] * 100).round(2)
+    stats['team2_win_%'] = (stats['team2_wins'] / stats['matches'] * 100).round(2)
+
+    # --- Ball-level columns, keyed by the pair of the match each ball belongs to ---
+    pair_codes = pd.Series(pair.codes, index=matches['ID'].to_numpy())
+    batsman_run = pd.to_numeric(df['batsman_run'], errors='coerce').fillna(0)
+    total_run = pd.to_numeric(df['total_run'], errors='coerce').fillna(0)
+    balls = pd.DataFrame({
+        'Season': df['Season'],
+        'team_pair': pd.Categorical.from_codes(df['ID'].map(pair_codes).to_numpy(), pair.categories),
+        'ID': df['ID'],
+        'BattingTeam': df['BattingTeam'],
+        'batter': df['batter'],
+        'bowler': df['bowler'],
+        'batsman_run': batsman_run,
+        'total_run': total_run,
+        'four': batsman_run == 4,
+        'six': batsman_run == 6,
+        'dot_ball': total_run == 0,
+        'isBowlerWicket': df['player_out'].notnull() & df['kind'].isin(BOWLER_WICKET_KINDS),
+    })
+
+    totals = balls.groupby(KEYS, observed=True).agg(
+        balls=('total_run', 'size'), total_runs=('total_run', 'sum'), total_fours=('four', 'sum'),
+        total_sixes=('six', 'sum'), total_dot_balls=('dot_ball', 'sum'),
+    )
+    stats = stats.join(totals)
+    stats['strike_rate'] = (stats['total_runs'] / stats['balls'] * 100).round(2)
+    stats['run_rate'] = (stats['total_runs'] / (stats['balls'] / 6)).round(2)
+    stats['economy_rate'] = stats['run_rate']
+
+    # --- Batting records: innings totals and the top run scorer ---
+    innings = balls.groupby(KEYS + ['ID', 'BattingTeam'], observed=True)['total_run'].sum()
+    by_pair = innings.groupby(level=KEYS, observed=True)
+    stats['highest_score'] = by_pair.max()
+    stats['total_50s'] = innings.between(50, 99).groupby(level=KEYS, observed=True).sum()
+    stats['total_100s'] = (innings >= 100).groupby(level=KEYS, observed=True).sum()
+
+    batters = balls.groupby(KEYS + ['batter'], observed=True)['batsman_run'].sum().reset_index()
+    top_batsman = _top_by_group(batters, 'batter', 'batsman_run')
+    stats['top_batsman'] = top_batsman['batter'].astype(object)
+    stats['top_batsman_runs'] = top_batsman['batsman_run']
+
+    # --- Bowling records: spells and the leading wicket-taker ---
+    spells = balls.groupby(KEYS + ['ID', 'bowler'], observed=True)['isBowlerWicket'].sum()
+    stats['best_figures'] = spells.groupby(level=KEYS, observed=True).max()
+    stats['three_wicket_hauls'] = (spells >= 3).groupby(level=KEYS, observed=True).sum()
+    stats['five_wicket_hauls'] = (spells >= 5).groupby(level=KEYS, observed=True).sum()
+
+    wickets = (balls[balls['isBowlerWicket']].groupby(KEYS + ['bowler'], observed=True)
+               .size().rename('wickets').reset_index())
+    top_bowler = _top_by_group(wickets, 'bowler', 'wickets')
+    stats['most_wickets'] = top_bowler['wickets'].reindex(stats.index).fillna(0).astype(np.int64)
+    stats['top_bowler'] = top_bowler['bowler'].astype(object).reindex(stats.index)
+    stats['top_bowler'] = stats['top_bowler'].where(stats['top_bowler'].notna(), None)
+
+    stats = stats.reset_index()
+    teams = stats['team_pair'].astype(str).str.split('_vs_', n=1, expand=True)
+    stats['team1'], stats['team2'] = teams[0], teams[1]
+
+    return stats.rename(columns={'Season': 'season'})[[
+        'season', 'team1', 'team2', 'matches', 'team1_wins', 'team2_wins', 'no_result',
+        'team1_win_%', 'team2_win_%',
+        # Batting
+        'highest_score', 'total_50s', 'total_100s', 'total_fours', 'total_sixes', 'strike_rate', 'run_rate',
+        # Bowling
+        'most_wickets', 'top_bowler', 'best_figures', 'economy_rate', 'total_dot_balls',
+        'three_wicket_hauls', 'five_wicket_hauls',
+        # Top batter
+        'top_batsman', 'top_batsman_runs',
+    ]]
 
-    # Ensure numeric types
-    df['batsman_run'] = pd.to_numeric(df['batsman_run'], errors='coerce').fillna(0)
-    df['total_run'] = pd.to_numeric(df['total_run'], errors='coerce').fillna(0)
-    df['isWicketDelivery'] = df['isWicketDelivery'].astype(int)
-
-    # Clean text columns
-    for col in ['Team1', 'Team2', 'WinningTeam', 'BattingTeam', 'batter', 'bowler']:
-        df[col] = df[col].astype(str).str.strip()
-
-    # Extra columns
-    df['four'] = (df['batsman_run'] == 4).astype(int)
-    df['six'] = (df['batsman_run'] == 6).astype(int)
-    df['dot_ball'] = (df['total_run'] == 0).astype(int)
-
-    wicket_types = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
-    df['isBowlerWicket'] = df['player_out'].notnull() & df['kind'].isin(wicket_types)
-
-    # Create team pair
-    df['team_pair'] = df.apply(lambda x: '_vs_'.join(sorted([x['Team1'], x['Team2']])), axis=1)
-
-    team_stats = []
-
-    for (season, team_pair), group in df.groupby(['Season', 'team_pair']):
-        team1, team2 = team_pair.split('_vs_')
-        matches = group['ID'].nunique()
-
-        team1_wins = group[group['WinningTeam'] == team1]['ID'].nunique()
-        team2_wins = group[group['WinningTeam'] == team2]['ID'].nunique()
-        no_result = matches - (team1_wins + team2_wins)
-
-        team1_win_pct = round((team1_wins / matches) * 100, 2) if matches else 0
-        team2_win_pct = round((team2_wins / matches) * 100, 2) if matches else 0
-
-        # Batting records
-        match_scores = group.groupby(['ID', 'BattingTeam'])['total_run'].sum()
-        highest_score = match_scores.max()
-        total_50s = (match_scores.between(50, 99)).sum()
-        total_100s = (match_scores >= 100).sum()
-
-        total_fours = group['four'].sum()
-        total_sixes = group['six'].sum()
-
-        balls_faced = len(group)
-        total_runs = group['total_run'].sum()
-        strike_rate = round((total_runs / balls_faced) * 100, 2) if balls_faced else 0
-        run_rate = round(total_runs / (balls_faced / 6), 2) if balls_faced else 0
-
-        # Bowling records
-        bowler_wickets = group[group['isBowlerWicket']].groupby('bowler').size()
-        most_wickets = bowler_wickets.max() if not bowler_wickets.empty else 0
-        top_bowler = bowler_wickets.idxmax() if not bowler_wickets.empty else None
-
-        best_figures = group.groupby(['ID', 'bowler'])['isBowlerWicket'].sum().max()
-        total_dot_balls = group['dot_ball'].sum()
-
-        total_balls_bowled = len(group)
-        runs_conceded = group['total_run'].sum()
-        economy_rate = round(runs_conceded / (total_balls_bowled / 6), 2) if total_balls_bowled else 0
-
-        three_wicket_hauls = (group.groupby(['ID', 'bowler'])['isBowlerWicket'].sum() >= 3).sum()
-        five_wicket_hauls = (group.groupby(['ID', 'bowler'])['isBowlerWicket'].sum() >= 5).sum()
-
-        # Top batsman
-        batter_stats = group.groupby('batter')['batsman_run'].sum().sort_values(ascending=False)
-        top_batsman = batter_stats.index[0] if not batter_stats.empty else None
-        top_batsman_runs = batter_stats.iloc[0] if not batter_stats.empty else 0
-
-        team_stats.append({
-            'season': season,
-            'team1': team1,
-            'team2': team2,
-            'matches': matches,
-            'team1_wins': team1_wins,
-            'team2_wins': team2_wins,
-            'no_result': no_result,
-            'team1_win_%': team1_win_pct,
-            'team2_win_%': team2_win_pct,
-
-            # Batting
-            'highest_score': highest_score,
-            'total_50s': total_50s,
-            'total_100s': total_100s,
-            'total_fours': total_fours,
-            'total_sixes': total_sixes,
-            'strike_rate': strike_rate,
-            'run_rate': run_rate,
-
-            # Bowling
-            'most_wickets': most_wickets,
-            'top_bowler': top_bowler,
-            'best_figures': best_figures,
-            'economy_rate': economy_rate,
-            'total_dot_balls': total_dot_balls,
-            'three_wicket_hauls': three_wicket_hauls,
-            'five_wicket_hauls': five_wicket_hauls,
-
-            # Top batter
-            'top_batsman': top_batsman,
-            'top_batsman_runs': top_batsman_runs
-        })
-
-    result_df = pd.DataFrame(team_stats)
-    result_df.to_csv("IPL_Dataset/rag_knowledgebase/team_vs_team_season.csv", index=False)
-    print("✅ team_vs_team_seasonwise.csv generated successfully.")
 
 if __name__ == "__main__":
-    ipl = load_ipl_data()
-    generate_team_vs_team_stats(ipl)
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["team_vs_team"])
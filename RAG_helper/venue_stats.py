@@ -1,119 +1,91 @@
+import numpy as np
 import pandas as pd
-from src.data_loader import load_ipl_data
+from src.fact_tables import get_match_table
+
+KEYS = ["Season", "Venue"]
+
+
+def _top_five(totals, name, value, dtype=None):
+    """
+    Top 5 ``name`` per (Season, Venue) by ``value``, as lists of {name: ..., value: ...} records.
+
+    ``totals`` is indexed by (Season, Venue, name) in groupby order. Each group is
+    ranked with the same ``sort_values`` a per-venue groupby would run, on the
+    same dtype (a per-venue sum of ``dtype`` data stays ``dtype`` when it fits),
+    so ties, including a tie for 5th place, resolve exactly as before.
+    """
+    def ranked(group):
+        group = group.droplevel(KEYS)
+        if dtype is not None and np.iinfo(dtype).min <= group.min() and group.max() <= np.iinfo(dtype).max:
+            group = group.astype(dtype)
+        return [{name: str(player), value: int(total)} for player, total in group.sort_values(ascending=False).head(5).items()]
+
+    return totals.groupby(level=KEYS, observed=True).apply(ranked)
+
 
 def generate_venue_stats_per_season(df):
-    venue_stats = []
-
-    # Group by season + venue
-    for (season, venue), temp in df.groupby(["Season", "Venue"]):
-        total_matches = temp["ID"].nunique()
-
-        # first/second innings subsets for averages
-        first_innings = temp[temp["innings"] == 1]
-        second_innings = temp[temp["innings"] == 2]
-
-        # Initialize counters
-        bat1st_wins = 0
-        chasing_wins = 0
-        no_result = 0
-
-        # iterate per match to determine batting order and winner
-        for match_id, mdf in temp.groupby("ID"):
-            # get unique batting teams in order of appearance
-            teams = mdf["BattingTeam"].dropna().unique().tolist()
-
-            # if only one team present (abandoned / incomplete innings), treat as no result
-            if len(teams) < 2:
-                no_result += 1
-                continue
-
-            team1 = teams[0]   # batted first
-            team2 = teams[1]   # batted second (chasing)
-
-            # find winning team for this match (if present)
-            winners = mdf["WinningTeam"].dropna().unique().tolist()
-            if not winners:
-                # no winning team recorded -> no result / abandoned
-                no_result += 1
-                continue
-
-            winning_team = winners[0]
-
-            # categorize
-            if winning_team == team1:
-                bat1st_wins += 1
-            elif winning_team == team2:
-                chasing_wins += 1
-            else:
-                # a corner case: WinningTeam not equal to either batting team (data issue)
-                no_result += 1
-
-        bat1st_win_pct = round((bat1st_wins / total_matches) * 100, 2) if total_matches else 0.0
-        chasing_win_pct = round((chasing_wins / total_matches) * 100, 2) if total_matches else 0.0
-
-        # averages
-        avg_1st_innings_score = first_innings.groupby("ID")["total_run"].sum().mean()
-        avg_2nd_innings_score = second_innings.groupby("ID")["total_run"].sum().mean()
-
-        total_scores = temp.groupby("ID")["total_run"].sum()
-        highest_total = int(total_scores.max()) if not total_scores.empty else 0
-        lowest_total = int(total_scores.min()) if not total_scores.empty else 0
-
-        total_fours = int((temp["batsman_run"] == 4).sum())
-        total_sixes = int((temp["batsman_run"] == 6).sum())
-        total_runs = int(temp["total_run"].sum())
-
-        # Player milestones (fifties/hundreds) per match at this venue & season
-        player_scores = temp.groupby(["ID", "batter"])["batsman_run"].sum()
-        total_hundreds = int((player_scores >= 100).sum())
-        total_fifties = int(((player_scores >= 50) & (player_scores < 100)).sum())
-
-        # Top 5 batsmen (runs at this venue+season)
-        top_batsmen = (
-            temp.groupby("batter")["batsman_run"]
-            .sum()
-            .sort_values(ascending=False)
-            .head(5)
-            .reset_index()
-        )
-
-        # Top 5 bowlers (wickets)
-        top_bowlers = (
-            temp[temp["isWicketDelivery"] == 1]
-            .groupby("bowler")
-            .size()
-            .sort_values(ascending=False)
-            .head(5)
-            .reset_index(name="wickets")
-        )
-
-        venue_stats.append({
-            "Season": season,
-            "Venue": venue,
-            "total_matches": int(total_matches),
-            "bat1st_wins": bat1st_wins,
-            "chasing_wins": chasing_wins,
-            "no_result": no_result,
-            "bat1st_win_pct": bat1st_win_pct,
-            "chasing_win_pct": chasing_win_pct,
-            "avg_1st_innings_score": round(avg_1st_innings_score, 2) if not pd.isna(avg_1st_innings_score) else 0,
-            "avg_2nd_innings_score": round(avg_2nd_innings_score, 2) if not pd.isna(avg_2nd_innings_score) else 0,
-            "highest_total": highest_total,
-            "lowest_total": lowest_total,
-            "total_fours": total_fours,
-            "total_sixes": total_sixes,
-            "total_runs": total_runs,
-            "total_hundreds": total_hundreds,
-            "total_fifties": total_fifties,
-            "top_5_batsmen": top_batsmen.to_dict("records"),
-            "top_5_bowlers": top_bowlers.to_dict("records")
-        })
-
-    return pd.DataFrame(venue_stats)
+    """
+    Venue statistics per season: results batting first / chasing, innings averages,
+    totals, boundaries, milestones and the top 5 batsmen and bowlers.
+
+    Args:
+        df (pd.DataFrame): Ball-by-ball IPL data
+
+    Returns:
+        pd.DataFrame: One row per (Season, Venue)
+    """
+    # --- Per-match results (classified once on the match table) ---
+    matches = get_match_table(df).copy()
+    matches["total"] = df.groupby("ID")["total_run"].sum().reindex(matches["ID"]).to_numpy()
+    for result in ["bat_first", "chasing", "no_result"]:
+        matches[result] = matches["result"] == result
+
+    venues = matches.groupby(KEYS, observed=True)
+    stats = venues.agg(
+        total_matches=("ID", "size"),
+        bat1st_wins=("bat_first", "sum"),
+        chasing_wins=("chasing", "sum"),
+        no_result=("no_result", "sum"),
+        avg_1st_innings_score=("innings1_runs", "mean"),
+        avg_2nd_innings_score=("innings2_runs", "mean"),
+        highest_total=("total", "max"),
+        lowest_total=("total", "min"),
+    )
+    stats["bat1st_win_pct"] = (stats["bat1st_wins"] / stats["total_matches"] * 100).round(2)
+    stats["chasing_win_pct"] = (stats["chasing_wins"] / stats["total_matches"] * 100).round(2)
+    for column in ["avg_1st_innings_score", "avg_2nd_innings_score"]:
+        stats[column] = stats[column].round(2).fillna(0)
+
+    # --- Ball-level totals ---
+    balls = pd.DataFrame({
+        "Season": df["Season"], "Venue": df["Venue"],
+        "total_fours": df["batsman_run"] == 4, "total_sixes": df["batsman_run"] == 6, "total_runs": df["total_run"],
+    })
+    stats = stats.join(balls.groupby(KEYS, observed=True).sum())
+
+    # --- Player milestones per match, and the top 5 batsmen and bowlers ---
+    player_scores = df.groupby(KEYS + ["ID", "batter"], observed=True)["batsman_run"].sum().reset_index()
+    stats["total_hundreds"] = (player_scores["batsman_run"] >= 100).groupby([player_scores["Season"], player_scores["Venue"]], observed=True).sum()
+    stats["total_fifties"] = player_scores["batsman_run"].between(50, 99).groupby([player_scores["Season"], player_scores["Venue"]], observed=True).sum()
+
+    batsmen = df.groupby(KEYS + ["batter"], observed=True)["batsman_run"].sum()
+    wickets = df[df["isWicketDelivery"] == 1].groupby(KEYS + ["bowler"], observed=True).size()
+    stats["top_5_batsmen"] = _top_five(batsmen, "batter", "batsman_run", df["batsman_run"].dtype)
+    stats["top_5_bowlers"] = _top_five(wickets, "bowler", "wickets")
+    stats["top_5_bowlers"] = stats["top_5_bowlers"].apply(lambda top: top if isinstance(top, list) else [])
+
+    count_columns = ["total_matches", "bat1st_wins", "chasing_wins", "no_result", "highest_total", "lowest_total",
+                     "total_fours", "total_sixes", "total_runs", "total_hundreds", "total_fifties"]
+    stats[count_columns] = stats[count_columns].fillna(0).astype(np.int64)
+
+    return stats.reset_index()[[
+        "Season", "Venue", "total_matches", "bat1st_wins", "chasing_wins", "no_result",
+        "bat1st_win_pct", "chasing_win_pct", "avg_1st_innings_score", "avg_2nd_innings_score",
+        "highest_total", "lowest_total", "total_fours", "total_sixes", "total_runs",
+        "total_hundreds", "total_fifties", "top_5_batsmen", "top_5_bowlers",
+    ]]
 
 
 if __name__ == "__main__":
-    df = load_ipl_data()
-    venue_df = generate_venue_stats_per_season(df)
-    venue_df.to_csv("IPL_Dataset/rag_knowledgebase/venue_stats_season1.csv", index=False)
-    print("✅ venue_stats_per_season.csv generated successfully")
+    from RAG_helper.pipeline import run_pipeline
+    run_pipeline(only=["venue_stats"])
@@ -1,26 +1,337 @@
+import hashlib
+import os
+import weakref
+import numpy as np
 import pandas as pd
 import streamlit as st
 from core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-@st.cache_data
-def load_ipl_data():
+DATA_DIR = "ipl_dataset"
+FINAL_IPL_CSV = os.path.join(DATA_DIR, "final_ipl.csv")
+MATCH_CSV = os.path.join(DATA_DIR, "crick_ipl.csv")
+BALL_CSV = os.path.join(DATA_DIR, "crick_ipl_ball.csv")
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshot")
+# Output folder of the RAG_helper knowledge-base CSVs
+KNOWLEDGE_BASE_DIR = os.path.join(DATA_DIR, "rag_knowledgebase")
+# Bump when the layout of any snapshotted table changes so old snapshots are rebuilt.
+SNAPSHOT_VERSION = 3
+
+# "final" -> pre-joined final_ipl.csv, "split" -> crick_ipl_ball.csv joined with crick_ipl.csv on demand
+DATA_SOURCES = ("final", "split")
+
+# Match-level attributes repeated on every delivery of a match (the split source joins only these)
+MATCH_COLUMNS = [
+    'Season', 'Date', 'City', 'Venue', 'Team1', 'Team2', 'TossWinner', 'TossDecision',
+    'WinningTeam', 'WonBy', 'Margin', 'method', 'SuperOver', 'MatchNumber', 'Player_of_Match',
+]
+
+# String columns stored as categoricals; each group shares one dictionary so
+# columns in the same group can be compared with each other.
+PLAYER_COLUMNS = ['batter', 'bowler', 'non-striker', 'player_out', 'Player_of_Match']
+TEAM_COLUMNS = ['BattingTeam', 'BowlingTeam', 'Team1', 'Team2', 'WinningTeam', 'TossWinner']
+CATEGORY_COLUMNS = ['Venue', 'City', 'MatchNumber', 'kind', 'extra_type', 'TossDecision', 'WonBy', 'method', 'SuperOver']
+
+
+def source_fingerprint(paths):
+    """
+    Build a short key identifying the current version of the given source files.
+
+    The key changes whenever any file's size or modification time (or
+    SNAPSHOT_VERSION) changes, so a snapshot built from an older CSV is never
+    served after the CSV is replaced.
+    """
+    digest = hashlib.sha1(f"v{SNAPSHOT_VERSION};".encode())
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+def load_snapshot(name, source_paths, builder):
+    """
+    Return the table built by ``builder()``, cached as a Parquet snapshot.
+
+    The snapshot lives in ``SNAPSHOT_DIR`` and is keyed by the fingerprint of
+    ``source_paths``. It is rebuilt (and stale versions removed) when the sources
+    change. If Parquet support (pyarrow) is missing, the table is built every time.
+
+    Args:
+        name (str): Snapshot name, used as the file prefix.
+        source_paths (list): Files the table is derived from.
+        builder (callable): Zero-argument function returning a DataFrame.
+
+    Returns:
+        pd.DataFrame: The cached or freshly built table.
+    """
+    fingerprint = source_fingerprint(source_paths)
+    snapshot_path = os.path.join(SNAPSHOT_DIR, f"{name}-{fingerprint}.parquet")
+
+    if os.path.exists(snapshot_path):
+        try:
+            df = pd.read_parquet(snapshot_path, memory_map=True)
+            logger.info(f"Loaded '{name}' from snapshot {snapshot_path}.")
+            return df
+        except Exception as e:
+            logger.warning(f"Could not read snapshot {snapshot_path}, rebuilding: {e}")
+
+    df = builder()
+
     try:
-        logger.info("Starting to load IPL datasets...")
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        tmp_path = snapshot_path + ".tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, snapshot_path)
+        logger.info(f"Wrote snapshot for '{name}' to {snapshot_path}.")
+
+        for file in os.listdir(SNAPSHOT_DIR):
+            if file.startswith(f"{name}-") and file.endswith(".parquet") and file != os.path.basename(snapshot_path):
+                os.remove(os.path.join(SNAPSHOT_DIR, file))
+    except ImportError as e:
+        logger.warning(f"Parquet support not available, '{name}' will not be snapshotted: {e}")
+    except Exception as e:
+        logger.warning(f"Failed to write snapshot for '{name}': {e}")
+
+    return df
+
+
+def _shared_categorical(df, columns):
+    """Convert ``columns`` to categoricals (whitespace stripped) sharing one dictionary."""
+    columns = [col for col in columns if col in df.columns]
+    if not columns:
+        return
+
+    factorized = {}
+    for col in columns:
+        codes, uniques = pd.factorize(df[col])
+        factorized[col] = (codes, pd.Index(uniques.astype(str)).str.strip())
+
+    categories = pd.Index(sorted(set().union(*(labels for _, labels in factorized.values()))))
+    dtype = pd.CategoricalDtype(categories)
+
+    for col, (codes, labels) in factorized.items():
+        lookup = np.append(categories.get_indexer(labels), -1)  # factorize marks NaN as -1
+        df[col] = pd.Categorical.from_codes(lookup[codes], dtype=dtype)
+
+
+def compact_ipl_frame(df):
+    """
+    Shrink the ball-by-ball frame in memory.
+
+    String columns become categoricals (players and teams each share one
+    dictionary) and integer columns are downcast to the smallest integer type.
+
+    Args:
+        df (pd.DataFrame): Ball-by-ball IPL data.
+
+    Returns:
+        tuple: (compacted DataFrame, per-column report with bytes before/after/saved).
+    """
+    before = df.memory_usage(deep=True, index=False)
+    df = df.copy()
+
+    _shared_categorical(df, PLAYER_COLUMNS)
+    _shared_categorical(df, TEAM_COLUMNS)
+    for col in CATEGORY_COLUMNS:
+        _shared_categorical(df, [col])
+
+    for col in df.columns:
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+
+    after = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        'column': before.index,
+        'dtype': [str(df[col].dtype) for col in before.index],
+        'bytes_before': before.values,
+        'bytes_after': after.values,
+    })
+    report['bytes_saved'] = report['bytes_before'] - report['bytes_after']
+    report = report.sort_values('bytes_saved', ascending=False).reset_index(drop=True)
+
+    return df, report
+
+
+def _reshare_categories(df):
+    """
+    Give each column group of a frame compacted by compact_ipl_frame one shared dtype again, in place.
+
+    A Parquet snapshot stores every column's dictionary (in order), but each
+    column is read back with a dtype of its own, and an all-null column as
+    plain objects. Matching dictionaries only get their dtype swapped (the codes
+    are kept); any other group is re-factorized on its own columns. Returns
+    False, leaving ``df`` unchanged, if a column still holds raw strings (the
+    frame needs compacting).
+    """
+    groups = [PLAYER_COLUMNS, TEAM_COLUMNS] + [[col] for col in CATEGORY_COLUMNS]
+    groups = [columns for columns in ([col for col in group if col in df.columns] for group in groups) if columns]
+    if any(not isinstance(df[col].dtype, pd.CategoricalDtype) and df[col].notna().any()
+           for columns in groups for col in columns):
+        return False
+
+    for columns in groups:
+        dtype = df[columns[0]].dtype
+        if all(isinstance(df[col].dtype, pd.CategoricalDtype) and df[col].cat.categories.equals(dtype.categories)
+               for col in columns):
+            for col in columns[1:]:
+                if df[col].dtype is not dtype:
+                    df[col] = pd.Categorical.from_codes(df[col].cat.codes, dtype=dtype, validate=False)
+        else:
+            _shared_categorical(df, columns)
+    return True
+
 
-        match_df = pd.read_csv("ipl_dataset/crick_ipl.csv")
-        logger.info("Loaded match-level data.")
+def _compact_and_log(df):
+    df, memory_report = compact_ipl_frame(df)
+    logger.info(f"Compacted IPL data: {memory_report['bytes_saved'].sum() / 1e6:.1f} MB saved "
+                f"({memory_report['bytes_after'].sum() / 1e6:.1f} MB in memory).")
+    return df
 
-        ball_df = pd.read_csv("ipl_dataset/crick_ipl_ball.csv")
-        logger.info("Loaded ball-by-ball data.")
 
-        merged = ball_df.merge(match_df, on='ID')
-        logger.info("Successfully merged ball and match data.")
+# id(frame) -> (weakref to frame, {name: derived object})
+_DERIVED_CACHE = {}
+# id(frame) -> (weakref to frame, snapshot prefix, source files, fingerprint at load) for frames returned by load_ipl_data
+_LOADED_SOURCES = {}
 
 
-        ipl_df = pd.read_csv("ipl_dataset/final_ipl.csv", encoding='ISO-8859-1')
-        logger.info("Loaded final IPL summary data.")
+def _lookup(registry, ipl):
+    entry = registry.get(id(ipl))
+    return entry if entry is not None and entry[0]() is ipl else None
+
+
+def derived_from_frame(ipl, name, builder, persist=False):
+    """
+    Return ``builder(ipl)``, computed once per DataFrame object.
+
+    Indexes and summary tables derived from the ball-by-ball frame are cached
+    against the frame's identity, so every page and tool that receives the same
+    loaded frame shares one copy instead of rebuilding it per call.
+
+    Args:
+        ipl (pd.DataFrame): The frame the object is derived from.
+        name (str): Cache key for the derived object.
+        builder (callable): Function taking the frame and returning the derived object.
+        persist (bool): For DataFrame results of a frame returned by load_ipl_data,
+            also store the table as a snapshot next to the data snapshot.
+    """
+    entry = _lookup(_DERIVED_CACHE, ipl)
+    if entry is None:
+        for key in [key for key, (ref, _) in _DERIVED_CACHE.items() if ref() is None]:
+            del _DERIVED_CACHE[key]
+        entry = (weakref.ref(ipl), {})
+        _DERIVED_CACHE[id(ipl)] = entry
+
+    derived = entry[1]
+    if name not in derived:
+        logger.info(f"Building derived table '{name}' for a frame of {len(ipl)} rows.")
+        source = _lookup(_LOADED_SOURCES, ipl) if persist else None
+        if source is not None:
+            _, prefix, paths, _ = source
+            derived[name] = load_snapshot(f"{prefix}_{name}", paths, lambda: builder(ipl))
+        else:
+            derived[name] = builder(ipl)
+    return derived[name]
+
+
+def frame_fingerprint(ipl):
+    """
+    Fingerprint of the source files as they were when ``ipl`` was loaded: the data version of the frame.
+
+    Returns None for frames not returned by load_ipl_data.
+    """
+    source = _lookup(_LOADED_SOURCES, ipl)
+    return source[3] if source is not None else None
+
+
+class SplitIPLData:
+    """
+    Ball-by-ball rows and per-match attributes kept in separate tables.
+
+    Match attributes (teams, venue, season, result...) are stored once per match
+    and only joined onto the deliveries when a caller asks for them.
+    """
+
+    def __init__(self, ball_df, match_df):
+        self.balls = ball_df
+        self.matches = match_df
+
+    def frame(self, match_columns=None):
+        """
+        Join the requested match columns onto the ball-by-ball rows.
+
+        Args:
+            match_columns (list or None): Match-level columns to attach. None attaches all of them.
+
+        Returns:
+            pd.DataFrame: Ball rows with the match columns (and BowlingTeam, when both teams are attached).
+        """
+        if match_columns is None:
+            match_columns = list(self.matches.columns)
+        columns = ['ID'] + [col for col in match_columns if col != 'ID']
+
+        merged = self.balls.merge(self.matches[columns], on='ID', how='left')
+
+        if {'Team1', 'Team2', 'BattingTeam'}.issubset(merged.columns) and 'BowlingTeam' not in merged.columns:
+            merged['BowlingTeam'] = np.where(merged['BattingTeam'] == merged['Team1'], merged['Team2'], merged['Team1'])
+
+        return merged
+
+
+@st.cache_resource
+def load_split_ipl_data():
+    logger.info("Loading split ball/match IPL datasets...")
+
+    match_df = load_snapshot("crick_ipl", [MATCH_CSV], lambda: pd.read_csv(MATCH_CSV))
+    logger.info("Loaded match-level data.")
+
+    ball_df = load_snapshot("crick_ipl_ball", [BALL_CSV], lambda: pd.read_csv(BALL_CSV))
+    logger.info("Loaded ball-by-ball data.")
+
+    return SplitIPLData(ball_df, match_df)
+
+
+# Shared (not copied) across reruns so indexes derived from it stay valid; treat it as read-only.
+@st.cache_resource
+def load_ipl_data(source="final"):
+    """
+    Load the ball-by-ball IPL dataset with match attributes attached.
+
+    Args:
+        source (str): "final" reads the pre-joined final_ipl.csv (default).
+            "split" joins crick_ipl_ball.csv with crick_ipl.csv instead.
+
+    Returns:
+        pd.DataFrame: One row per delivery, or an empty frame if loading failed.
+    """
+    if source not in DATA_SOURCES:
+        raise ValueError(f"Unknown IPL data source '{source}'. Choose from {DATA_SOURCES}.")
+
+    try:
+        logger.info(f"Starting to load IPL datasets (source='{source}')...")
+
+        # Fingerprinted before reading, so a file replaced mid-load shows up as a newer version
+        source_paths = [BALL_CSV, MATCH_CSV] if source == "split" else [FINAL_IPL_CSV]
+        fingerprint = source_fingerprint(source_paths)
+
+        if source == "split":
+            ipl_df = load_split_ipl_data().frame(MATCH_COLUMNS)
+            logger.info("Joined ball and match data.")
+        else:
+            # The snapshot stores the compacted frame, dictionaries included
+            ipl_df = load_snapshot(
+                "final_ipl",
+                [FINAL_IPL_CSV],
+                lambda: _compact_and_log(pd.read_csv(FINAL_IPL_CSV, encoding='ISO-8859-1')),
+            )
+            logger.info("Loaded final IPL summary data.")
+
+        # A snapshot read only needs its dictionaries re-shared; anything else is compacted here
+        if not _reshare_categories(ipl_df):
+            ipl_df = _compact_and_log(ipl_df)
+
+        # Lets derived tables of this frame be snapshotted alongside it
+        _LOADED_SOURCES[id(ipl_df)] = (weakref.ref(ipl_df), source, source_paths, fingerprint)
 
         logger.info(" IPL data loading completed successfully.")
         return ipl_df
@@ -34,3 +345,20 @@ def load_ipl_data():
         logger.exception(f"Error while loading IPL data: {str(e)}")
         st.error("An unexpected error occurred while loading data.")
         return pd.DataFrame()  # or raise if appropriate
+
+
+def current_ipl_data(source="final"):
+    """
+    ``load_ipl_data(source)``, reloaded first if its source files changed since it was loaded.
+
+    ``load_ipl_data`` is cached for the life of the process; long-running callers
+    (the chatbot tools) use this so a replaced CSV is picked up on the next call.
+    """
+    ipl = load_ipl_data(source)
+    loaded = _lookup(_LOADED_SOURCES, ipl)
+    if loaded is not None and loaded[3] != source_fingerprint(loaded[2]):
+        logger.info(f"IPL source files changed since load (source='{source}'); reloading.")
+        load_split_ipl_data.clear()
+        load_ipl_data.clear()
+        ipl = load_ipl_data(source)
+    return ipl
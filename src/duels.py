@@ -0,0 +1,79 @@
+import numpy as np
+from src.data_loader import derived_from_frame
+from src.fact_tables import get_delivery_flags
+from src.kernels import segment_starts, segment_sum
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Per-duel counters, in the order they are stored
+DUEL_STATS = ['balls', 'runs', 'dismissals', 'dots', 'fours', 'sixes']
+
+
+class DuelMatrix:
+    """
+    Sparse batter x bowler matrix of head-to-head records.
+
+    Only pairs that actually met are stored. Each entry holds the duel totals and
+    the runs off every ball faced, in delivery order, as a view into one shared
+    int8 array, so rendering a duel is a dictionary lookup.
+    """
+
+    def __init__(self, ipl):
+        flags = get_delivery_flags(ipl)
+        faced = np.flatnonzero(flags['ball_faced'].to_numpy())
+        batter = ipl['batter'].cat.codes.to_numpy()[faced]
+        bowler = ipl['bowler'].cat.codes.to_numpy()[faced]
+
+        # Group balls faced by (batter, bowler), keeping delivery order inside each group
+        order = np.lexsort((faced, bowler, batter))
+        rows, batter, bowler = faced[order], batter[order], bowler[order]
+        starts = segment_starts(batter, bowler)
+        ends = np.append(starts[1:], len(rows))
+
+        self._ball_runs = ipl['batsman_run'].to_numpy()[rows].astype(np.int8)
+        counters = np.column_stack([
+            np.ones(len(rows), dtype=np.int32),
+            self._ball_runs.astype(np.int32),
+            flags['bowler_wicket'].to_numpy()[rows],
+            flags['dot_ball'].to_numpy()[rows],
+            flags['four'].to_numpy()[rows],
+            flags['six'].to_numpy()[rows],
+        ]).astype(np.int32)
+        totals = segment_sum(counters, starts).astype(np.int32)
+
+        batters = ipl['batter'].cat.categories
+        bowlers = ipl['bowler'].cat.categories
+        self._duels = {}
+        self._faced = {}
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            batter_name, bowler_name = batters[batter[start]], bowlers[bowler[start]]
+            self._duels[(batter_name, bowler_name)] = (totals[i], start, end)
+            self._faced.setdefault(batter_name, []).append(bowler_name)
+
+        logger.info(f"DuelMatrix built for {len(self._duels)} batter/bowler pairs.")
+
+    def get(self, batter, bowler):
+        """
+        Head-to-head record of ``batter`` against ``bowler``.
+
+        Returns:
+            dict or None: The DUEL_STATS counters plus ``ball_runs`` (runs off each
+            ball faced, in delivery order), or None if the two never met.
+        """
+        entry = self._duels.get((batter, bowler))
+        if entry is None:
+            return None
+        totals, start, end = entry
+        duel = dict(zip(DUEL_STATS, totals.tolist()))
+        duel['ball_runs'] = self._ball_runs[start:end]
+        return duel
+
+    def bowlers_faced(self, batter):
+        """Sorted names of the bowlers ``batter`` has faced at least one ball from."""
+        return self._faced.get(batter, [])
+
+
+def get_duel_matrix(ipl):
+    """Return the DuelMatrix for ``ipl``, building it on first use."""
+    return derived_from_frame(ipl, "duel_matrix", DuelMatrix)
@@ -0,0 +1,525 @@
+import numpy as np
+import pandas as pd
+from src.data_loader import MATCH_COLUMNS, derived_from_frame
+from src.kernels import innings_order, segment_starts, segment_sum
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+PLAYOFF_STAGES = ['Qualifier 1', 'Eliminator', 'Final', ' Semi Final', 'Semi Final', 'Qualifier 2', '3rd Place Play-Off']
+
+# --- Scoring conventions shared by every derived table ---
+# Dismissals credited to the bowler (run outs, retirements and obstructing the field are not)
+BOWLER_WICKET_KINDS = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
+# Extras that do not count as a legal ball / as a ball faced by the batter
+ILLEGAL_BALL_EXTRAS = ['wides', 'noballs']
+# Extras not charged to the bowler's runs conceded
+UNCHARGED_EXTRAS = ['byes', 'legbyes']
+# Match outcomes for the side batting first: won batting first, won chasing, or no
+# result (abandoned, no second innings, or a winner that batted in neither innings)
+MATCH_RESULTS = ['bat_first', 'chasing', 'no_result']
+# Innings phases as inclusive ranges of the 0-indexed ``overs`` column
+PHASE_OVERS = {'Powerplay': (0, 5), 'Middle': (6, 14), 'Death': (15, 19)}
+PHASES = list(PHASE_OVERS)
+# 0-indexed over -> position of its phase in PHASES (-1 for overs in no phase)
+OVER_PHASE_CODES = np.array([
+    next((code for code, (first, last) in enumerate(PHASE_OVERS.values()) if first <= over <= last), -1)
+    for over in range(max(last for _, last in PHASE_OVERS.values()) + 1)
+], dtype=np.int8)
+
+
+def build_delivery_flags(ipl):
+    """
+    Per-delivery scoring flags, aligned with the rows of ``ipl``.
+
+    Columns:
+        legal_ball: counts towards the bowler's balls/overs (not a wide or no-ball).
+        ball_faced: counts towards the batter's balls faced (not a wide).
+        four / six: boundary hit by the batter (fours that were run are excluded).
+        bowler_wicket: wicket credited to the bowler.
+        runs_conceded: runs charged to the bowler (byes and leg byes excluded).
+        dot_ball: legal ball with nothing charged to the bowler.
+        phase: position in PHASES of the delivery's phase (-1 if in none), as int8.
+    """
+    extra_type = ipl['extra_type'] if 'extra_type' in ipl.columns else pd.Series(np.nan, index=ipl.index)
+    ran_four = ipl['non_boundary'] == 1 if 'non_boundary' in ipl.columns else False
+
+    uncharged = np.where(extra_type.isin(UNCHARGED_EXTRAS), ipl['extras_run'], 0)
+    flags = pd.DataFrame({
+        'legal_ball': ~extra_type.isin(ILLEGAL_BALL_EXTRAS),
+        'ball_faced': extra_type != 'wides',
+        'four': (ipl['batsman_run'] == 4) & ~ran_four,
+        'six': ipl['batsman_run'] == 6,
+        'bowler_wicket': (ipl['isWicketDelivery'] == 1) & ipl['kind'].isin(BOWLER_WICKET_KINDS),
+        'runs_conceded': (ipl['total_run'] - uncharged).astype(np.int16),
+    }, index=ipl.index)
+    flags['dot_ball'] = flags['legal_ball'] & (flags['runs_conceded'] == 0)
+    flags['phase'] = phase_codes(ipl['overs'])
+    return flags
+
+
+def phase_codes(overs):
+    """Position in PHASES of each 0-indexed over's phase, or -1 if it is in none."""
+    overs = np.asarray(overs, dtype=np.int64)
+    in_range = (overs >= 0) & (overs < len(OVER_PHASE_CODES))
+    return np.where(in_range, OVER_PHASE_CODES[np.where(in_range, overs, 0)], -1).astype(np.int8)
+
+
+def phase_of_overs(overs):
+    """Phase of each 0-indexed over as a categorical over PHASES (missing if it is in none)."""
+    return pd.Categorical.from_codes(phase_codes(overs), PHASES)
+
+
+def get_delivery_flags(ipl):
+    """Return the per-delivery scoring flags for ``ipl``, building them on first use."""
+    return derived_from_frame(ipl, "delivery_flags", build_delivery_flags)
+
+
+class PhasePartition:
+    """
+    Deliveries grouped by phase: a stable sort of the rows on their phase code,
+    so each phase is one contiguous slice (in file order) of ``order``.
+
+    Built once per frame; a phase query then reads only that phase's rows
+    instead of range-filtering ``overs`` over the whole frame.
+    """
+
+    def __init__(self, ipl):
+        codes = get_delivery_flags(ipl)['phase'].to_numpy()
+        self.order = np.argsort(codes, kind='stable')
+        self.bounds = np.searchsorted(codes[self.order], np.arange(len(PHASES) + 1))
+
+    def positions(self, phase):
+        """Row positions of the deliveries bowled in ``phase`` (a PHASES name)."""
+        code = PHASES.index(phase)
+        return self.order[self.bounds[code]:self.bounds[code + 1]]
+
+    def rows(self, ipl, phase):
+        """Deliveries of the partitioned frame ``ipl`` bowled in ``phase``."""
+        return ipl.iloc[self.positions(phase)]
+
+
+def get_phase_partition(ipl):
+    """Return the PhasePartition for ``ipl``, building it on first use."""
+    return derived_from_frame(ipl, "phase_partition", PhasePartition)
+
+
+def build_match_table(ipl):
+    """
+    Collapse the ball-by-ball frame to one row per match.
+
+    Besides the match attributes (teams, venue, toss, result, stage...), each row
+    carries the batting team, runs and wickets of the first two innings, an
+    ``is_playoff`` flag derived from ``MatchNumber`` and the ``result`` (one of
+    MATCH_RESULTS) from the point of view of the side batting first.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+
+    Returns:
+        pd.DataFrame: One row per match ID, sorted by ID.
+    """
+    columns = [col for col in MATCH_COLUMNS if col in ipl.columns]
+    matches = ipl.groupby('ID', sort=True)[columns].first()
+
+    innings = (
+        ipl[ipl['innings'].isin([1, 2])]
+        .groupby(['ID', 'innings'], observed=True)
+        .agg(team=('BattingTeam', 'first'), runs=('total_run', 'sum'), wickets=('isWicketDelivery', 'sum'))
+        .unstack('innings')
+    )
+    innings.columns = [f'innings{number}_{measure}' for measure, number in innings.columns]
+    matches = matches.join(innings)
+
+    if {'WinningTeam', 'innings1_team', 'innings2_team'}.issubset(matches.columns):
+        winner = matches['WinningTeam'].astype(object)
+        decided = winner.notna() & matches['innings2_team'].notna()
+        matches['result'] = np.select(
+            [decided & (winner == matches['innings1_team'].astype(object)),
+             decided & (winner == matches['innings2_team'].astype(object))],
+            ['bat_first', 'chasing'], default='no_result',
+        )
+
+    if 'MatchNumber' in matches.columns:
+        matches['is_playoff'] = matches['MatchNumber'].astype(str).str.contains(
+            '|'.join(PLAYOFF_STAGES), case=False, na=False
+        )
+
+    logger.info(f"Match table built with {len(matches)} matches.")
+    return matches.reset_index()
+
+
+def get_match_table(ipl):
+    """Return the one-row-per-match table for ``ipl``, building it on first use."""
+    return derived_from_frame(ipl, "match_table", build_match_table)
+
+
+def head_to_head_matches(ipl, team1, team2):
+    """Rows of the match table for every game played between ``team1`` and ``team2``."""
+    matches = get_match_table(ipl)
+    return matches[((matches['Team1'] == team1) & (matches['Team2'] == team2)) |
+                   ((matches['Team1'] == team2) & (matches['Team2'] == team1))]
+
+
+def deliveries_for_matches(ipl, match_ids):
+    """Ball-by-ball rows belonging to ``match_ids``."""
+    return ipl[ipl['ID'].isin(match_ids)]
+
+
+def build_batting_innings(ipl):
+    """
+    One row per batter per innings.
+
+    Columns: ID, innings, batter, team, opponent, Season, Venue, batting_position,
+    runs, balls, fours, sixes, dismissed, dismissal_kind. Batters who only appeared
+    at the non-striker's end are included with zero balls. The batting position
+    is the order in which batters first appeared at either end.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+
+    Returns:
+        pd.DataFrame: Batter-innings table sorted by ID, innings and batting position.
+    """
+    flags = get_delivery_flags(ipl)
+    keys = ['ID', 'innings', 'batter']
+
+    scored = pd.DataFrame({
+        'ID': ipl['ID'], 'innings': ipl['innings'], 'batter': ipl['batter'],
+        'runs': ipl['batsman_run'].astype(np.int32), 'balls': flags['ball_faced'],
+        'fours': flags['four'], 'sixes': flags['six'],
+    }).groupby(keys, observed=True).sum()
+
+    # Chronological delivery number, so first appearances do not depend on file order
+    sequence = np.empty(len(ipl), dtype=np.int64)
+    sequence[np.lexsort((np.arange(len(ipl)), ipl['ballnumber'].to_numpy(), ipl['overs'].to_numpy()))] = np.arange(len(ipl))
+    appearances = pd.concat([
+        pd.DataFrame({'ID': ipl['ID'].to_numpy(), 'innings': ipl['innings'].to_numpy(),
+                      'batter': ipl[column].to_numpy(), 'order': sequence * 2 + end})
+        for end, column in enumerate(['batter', 'non-striker'])
+        if column in ipl.columns
+    ])
+    innings = appearances.groupby(keys, observed=True)['order'].min().to_frame()
+    innings = innings.join(scored)
+    innings[scored.columns] = innings[scored.columns].fillna(0).astype(np.int32)
+
+    outs = ipl.loc[ipl['player_out'].notna(), ['ID', 'innings', 'player_out', 'kind']]
+    outs = outs.rename(columns={'player_out': 'batter', 'kind': 'dismissal_kind'}).drop_duplicates(keys)
+    innings = innings.join(outs.set_index(keys))
+    innings['dismissed'] = innings['dismissal_kind'].notna()
+
+    innings = innings.reset_index()
+    innings['batting_position'] = innings.groupby(['ID', 'innings'])['order'].rank(method='first').astype(np.int8)
+
+    sides = ipl.groupby(['ID', 'innings'], observed=True)[['BattingTeam', 'BowlingTeam']].first()
+    sides.columns = ['team', 'opponent']
+    innings = innings.join(sides, on=['ID', 'innings'])
+    innings = innings.join(get_match_table(ipl).set_index('ID')[['Season', 'Venue']], on='ID')
+
+    innings['batter'] = innings['batter'].astype(str)
+    innings = innings.sort_values(['ID', 'innings', 'batting_position']).reset_index(drop=True)
+    logger.info(f"Batting innings table built with {len(innings)} innings.")
+    return innings[['ID', 'innings', 'batter', 'team', 'opponent', 'Season', 'Venue', 'batting_position',
+                    'runs', 'balls', 'fours', 'sixes', 'dismissed', 'dismissal_kind']]
+
+
+def get_batting_innings(ipl):
+    """Return the batter-innings table for ``ipl`` (snapshotted with the loaded data)."""
+    return derived_from_frame(ipl, "batting_innings", build_batting_innings, persist=True)
+
+
+def build_bowling_spells(ipl):
+    """
+    One row per bowler per innings.
+
+    Columns: ID, innings, bowler, team, opponent, Season, Venue, overs, balls,
+    legal_balls, runs_conceded, wickets, dots, maidens, and for each phase in
+    ``PHASE_OVERS`` the legal balls, runs conceded, wickets and maidens bowled in
+    it (e.g. ``powerplay_balls``). A maiden is an over in which the bowler bowled
+    six legal balls and conceded nothing.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+
+    Returns:
+        pd.DataFrame: Bowling-spell table sorted by ID, innings and bowler.
+    """
+    flags = get_delivery_flags(ipl)
+    keys = ['ID', 'innings', 'bowler']
+
+    # --- Per-over figures first, so maidens and phases come from real overs ---
+    overs = pd.DataFrame({
+        'ID': ipl['ID'], 'innings': ipl['innings'], 'bowler': ipl['bowler'], 'over': ipl['overs'],
+        'balls': np.ones(len(ipl), dtype=np.int32), 'legal_balls': flags['legal_ball'],
+        'runs_conceded': flags['runs_conceded'].astype(np.int32), 'wickets': flags['bowler_wicket'],
+        'dots': flags['dot_ball'],
+    }).groupby(keys + ['over'], observed=True).sum().reset_index()
+    overs['maidens'] = (overs['legal_balls'] >= 6) & (overs['runs_conceded'] == 0)
+    overs['overs'] = 1
+
+    totals = ['overs', 'balls', 'legal_balls', 'runs_conceded', 'wickets', 'dots', 'maidens']
+    spells = overs.groupby(keys, observed=True)[totals].sum()
+
+    overs['phase'] = phase_of_overs(overs['over'])
+    by_phase = (
+        overs[overs['phase'].notna()]
+        .groupby(keys + ['phase'], observed=True)[['legal_balls', 'runs_conceded', 'wickets', 'maidens']]
+        .sum()
+        .rename(columns={'legal_balls': 'balls', 'runs_conceded': 'runs'})
+        .unstack('phase')
+    )
+    by_phase.columns = [f'{phase.lower()}_{measure}' for measure, phase in by_phase.columns]
+    phase_columns = [f'{name.lower()}_{measure}' for name in PHASES for measure in ['balls', 'runs', 'wickets', 'maidens']]
+    spells = spells.join(by_phase.reindex(columns=phase_columns)).fillna(0).astype(np.int32)
+    spells = spells.reset_index()
+
+    sides = ipl.groupby(['ID', 'innings'], observed=True)[['BowlingTeam', 'BattingTeam']].first()
+    sides.columns = ['team', 'opponent']
+    spells = spells.join(sides, on=['ID', 'innings'])
+    spells = spells.join(get_match_table(ipl).set_index('ID')[['Season', 'Venue']], on='ID')
+
+    spells['bowler'] = spells['bowler'].astype(str)
+    spells = spells.sort_values(keys).reset_index(drop=True)
+    logger.info(f"Bowling spell table built with {len(spells)} spells.")
+    return spells[['ID', 'innings', 'bowler', 'team', 'opponent', 'Season', 'Venue'] + totals + phase_columns]
+
+
+def get_bowling_spells(ipl):
+    """Return the bowling-spell table for ``ipl`` (snapshotted with the loaded data)."""
+    return derived_from_frame(ipl, "bowling_spells", build_bowling_spells, persist=True)
+
+
+def build_partnerships(ipl):
+    """
+    One row per partnership stint.
+
+    A stint is a run of consecutive deliveries in an innings with the same two
+    batters at the crease. Columns: ID, innings, Season, team, wicket (the
+    partnership's wicket number), player1 and player2 (names in sorted order),
+    runs (including extras), balls (faced, i.e. excluding wides), player1_runs,
+    player2_runs, start_over and end_over (0-indexed).
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+
+    Returns:
+        pd.DataFrame: Partnership table in delivery order.
+    """
+    flags = get_delivery_flags(ipl)
+
+    # Deliveries in chronological order within each innings
+    order = innings_order(ipl)
+    match_id = ipl['ID'].to_numpy()[order]
+    innings = ipl['innings'].to_numpy()[order]
+    batter = ipl['batter'].cat.codes.to_numpy()[order]
+    non_striker = ipl['non-striker'].cat.codes.to_numpy()[order]
+    low, high = np.minimum(batter, non_striker), np.maximum(batter, non_striker)
+
+    # A new stint starts on a new innings or when the pair at the crease changes
+    new_innings = np.zeros(len(order), dtype=bool)
+    new_innings[segment_starts(match_id, innings)] = True
+    starts = segment_starts(match_id, innings, low, high)
+    ends = np.append(starts[1:], len(order)) - 1
+
+    # Wickets fallen in the innings before each delivery
+    wicket = ipl['isWicketDelivery'].to_numpy()[order].astype(np.int32)
+    fallen = np.cumsum(wicket)
+    fallen -= np.maximum.accumulate(np.where(new_innings, fallen - wicket, 0))
+    fallen -= wicket
+
+    batsman_run = ipl['batsman_run'].to_numpy()[order].astype(np.int32)
+    low_runs = np.where(batter == low, batsman_run, 0)
+    overs = ipl['overs'].to_numpy()[order]
+    players = ipl['batter'].cat.categories
+
+    partnerships = pd.DataFrame({
+        'ID': match_id[starts],
+        'innings': innings[starts],
+        'wicket': fallen[starts] + 1,
+        'player1': players[low[starts]],
+        'player2': players[high[starts]],
+        'runs': segment_sum(ipl['total_run'].to_numpy()[order], starts).astype(np.int32),
+        'balls': segment_sum(flags['ball_faced'].to_numpy()[order], starts).astype(np.int32),
+        'player1_runs': segment_sum(low_runs, starts).astype(np.int32),
+        'player2_runs': segment_sum(batsman_run - low_runs, starts).astype(np.int32),
+        'start_over': overs[starts],
+        'end_over': overs[ends],
+    })
+    sides = ipl.groupby(['ID', 'innings'], observed=True)['BattingTeam'].first().rename('team')
+    partnerships = partnerships.join(sides, on=['ID', 'innings'])
+    partnerships = partnerships.join(get_match_table(ipl).set_index('ID')['Season'], on='ID')
+
+    logger.info(f"Partnership table built with {len(partnerships)} partnerships.")
+    return partnerships[['ID', 'innings', 'Season', 'team', 'wicket', 'player1', 'player2', 'runs', 'balls',
+                         'player1_runs', 'player2_runs', 'start_over', 'end_over']]
+
+
+def get_partnerships(ipl):
+    """Return the partnership table for ``ipl`` (snapshotted with the loaded data)."""
+    return derived_from_frame(ipl, "partnerships", build_partnerships, persist=True)
+
+
+def pair_partnerships(ipl, player1, player2):
+    """Partnerships between ``player1`` and ``player2`` (in either order), via a pair index."""
+    partnerships = get_partnerships(ipl)
+    pairs = derived_from_frame(ipl, "partnership_pairs",
+                               lambda df: partnerships.groupby(['player1', 'player2'], observed=True).indices)
+    return partnerships.iloc[pairs.get(tuple(sorted([player1, player2])), [])]
+
+
+def highest_partnerships(ipl, n=10, season=None):
+    """The ``n`` highest partnerships, optionally for one season."""
+    partnerships = get_partnerships(ipl)
+    if season is not None:
+        partnerships = partnerships[partnerships['Season'] == int(season)]
+    return partnerships.nlargest(n, 'runs')
+
+
+def best_figures(spells, by):
+    """
+    Best bowling figures ("wickets/runs") per group of a bowling-spell table.
+
+    Args:
+        spells (pd.DataFrame): Rows of the bowling-spell table.
+        by (str or list): Column(s) to report the best spell for.
+
+    Returns:
+        tuple: (figures as "w/r" strings, wickets of the best spell), both indexed by ``by``.
+    """
+    best = (
+        spells.sort_values(['wickets', 'runs_conceded'], ascending=[False, True])
+        .groupby(by, observed=True)
+        .head(1)
+        .set_index(by)
+    )
+    return best['wickets'].astype(str) + "/" + best['runs_conceded'].astype(str), best['wickets']
+
+
+def career_from_tables(innings, spells):
+    """
+    Career batting and bowling aggregates, one row per player.
+
+    Uses the scoring conventions of ``build_delivery_flags``: balls faced exclude
+    wides, balls bowled exclude wides and no-balls, runs conceded exclude byes and
+    leg byes, and wickets are the dismissals credited to the bowler.
+
+    Args:
+        innings (pd.DataFrame): Rows of the batter-innings table to aggregate.
+        spells (pd.DataFrame): Rows of the bowling-spell table to aggregate.
+
+    Returns:
+        pd.DataFrame: One row per player with batting, bowling and team columns.
+    """
+    # --- Batting: career totals over the batter-innings table ---
+    innings = innings.rename(columns={'batter': 'player'})
+    innings['fifty'] = innings['runs'].between(50, 99)
+    innings['hundred'] = innings['runs'] >= 100
+
+    batting = innings.groupby('player').agg(
+        batting_innings=('ID', 'size'),
+        runs=('runs', 'sum'),
+        balls_faced=('balls', 'sum'),
+        fours=('fours', 'sum'),
+        sixes=('sixes', 'sum'),
+        highest_score=('runs', 'max'),
+        fifties=('fifty', 'sum'),
+        hundreds=('hundred', 'sum'),
+        dismissals=('dismissed', 'sum'),
+    )
+
+    # --- Bowling: career totals over the bowling-spell table ---
+    spells = spells.rename(columns={'bowler': 'player'})
+    spells['three_wkts'] = spells['wickets'] >= 3
+    spells['five_wkts'] = spells['wickets'] >= 5
+
+    bowling = spells.groupby('player').agg(
+        bowling_innings=('ID', 'size'),
+        balls_bowled=('legal_balls', 'sum'),
+        runs_conceded=('runs_conceded', 'sum'),
+        wickets=('wickets', 'sum'),
+        maidens=('maidens', 'sum'),
+        three_wicket_hauls=('three_wkts', 'sum'),
+        five_wicket_hauls=('five_wkts', 'sum'),
+    )
+    bowling['best_bowling'], bowling['best_match_wickets'] = best_figures(spells, 'player')
+
+    # --- Matches and teams across batting (either end) and bowling appearances ---
+    appearances = pd.concat([
+        pd.DataFrame({'player': table['player'], 'ID': table['ID'], 'team': table['team'].astype(str)})
+        for table in [innings, spells]
+    ])
+    matches = appearances.groupby('player')['ID'].nunique().rename('matches')
+    teams = (
+        appearances[['player', 'team']].drop_duplicates()
+        .sort_values('team')
+        .groupby('player')['team']
+        .agg(', '.join)
+        .rename('teams')
+    )
+
+    career = pd.concat([matches, teams], axis=1).join(batting).join(bowling)
+
+    count_columns = list(batting.columns) + [col for col in bowling.columns if col != 'best_bowling']
+    career[count_columns] = career[count_columns].fillna(0).astype(np.int64)
+
+    career['strike_rate'] = (career['runs'] / career['balls_faced'] * 100).where(career['balls_faced'] > 0, 0.0)
+    career['batting_average'] = career['runs'] / career['dismissals'].where(career['dismissals'] > 0)
+    career['economy'] = (career['runs_conceded'] / (career['balls_bowled'] / 6)).where(career['balls_bowled'] > 0, 0.0)
+    career['bowling_average'] = career['runs_conceded'] / career['wickets'].where(career['wickets'] > 0)
+
+    career.index.name = 'player'
+    return career.reset_index()
+
+
+def build_career_table(ipl):
+    """Career aggregates over the whole batter-innings and bowling-spell tables of ``ipl``."""
+    career = career_from_tables(get_batting_innings(ipl), get_bowling_spells(ipl))
+    logger.info(f"Career table built for {len(career)} players.")
+    return career
+
+
+def get_career_table(ipl):
+    """Return the per-player career table for ``ipl`` (snapshotted with the loaded data)."""
+    return derived_from_frame(ipl, "career_table", build_career_table, persist=True)
+
+
+def get_career_stats(ipl, player):
+    """Career row of ``player`` as a Series, or None if the player never batted or bowled."""
+    career = get_career_stats_batch(ipl, [player])
+    if career.empty:
+        return None
+    return career.iloc[0]
+
+
+def get_career_stats_batch(ipl, players, seasons=None, opponent=None):
+    """
+    Career rows of many players at once, optionally for some seasons or one opponent.
+
+    Without filters the rows come straight from the career table; with filters
+    they are aggregated in one grouped pass over the matching innings and spells.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+        players (list): Player names.
+        seasons (int or list or None): Season(s) to include.
+        opponent (str or None): Only innings and spells against this team.
+
+    Returns:
+        pd.DataFrame: Career columns indexed by player, in the order of ``players``.
+            Players with no matching innings or spells are left out.
+    """
+    players = list(dict.fromkeys(players))
+    if seasons is None and opponent is None:
+        career = derived_from_frame(ipl, "career_by_player", lambda df: get_career_table(df).set_index('player'))
+    else:
+        seasons = list(seasons) if isinstance(seasons, (list, tuple, set)) else seasons
+        tables = []
+        for table, column in [(get_batting_innings(ipl), 'batter'), (get_bowling_spells(ipl), 'bowler')]:
+            mask = table[column].isin(players)
+            if seasons is not None:
+                mask &= table['Season'].isin(seasons if isinstance(seasons, list) else [seasons])
+            if opponent is not None:
+                mask &= table['opponent'] == opponent
+            tables.append(table[mask])
+        career = career_from_tables(*tables).set_index('player')
+    return career.loc[[player for player in players if player in career.index]]
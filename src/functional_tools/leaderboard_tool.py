@@ -1,35 +1,37 @@
-# 🧠 GENAI FUNCTION — Used by LangChain Agent
-def get_leaderboard_summary(query: str, ipl_df) -> str:
+import re
+from src.query_engine import top
+from src.sqlite_backend import as_ipl_frame
+
+def parse_leaderboard_query(query: str):
+    """Return (board, season) for a leaderboard question: board is "batting", "bowling" or None."""
     query = query.lower()
 
     # Extract season if available
-    import re
     season_match = re.search(r'\b(20\d{2})\b', query)
     season = int(season_match.group(1)) if season_match else None
 
-    filtered_df = ipl_df[ipl_df["Season"] == season] if season else ipl_df
-
     if "bat" in query or "run" in query:
-        top_batsmen = (
-            filtered_df.groupby("batter")["batsman_run"]
-            .sum()
-            .sort_values(ascending=False)
-            .head(10)
-        )
+        return "batting", season
+    if "bowl" in query or "wicket" in query:
+        return "bowling", season
+    return None, season
+
+
+# 🧠 GENAI FUNCTION — Used by LangChain Agent
+def get_leaderboard_summary(query: str, ipl_df) -> str:
+    board, season = parse_leaderboard_query(query)
+    ipl_df = as_ipl_frame(ipl_df, seasons=[season] if season else None)
+
+    if board == "batting":
+        top_batsmen = top(ipl_df, "batting", "runs", 10, seasons=season)
         result = "🏏 Top Batsmen:\n"
-        for i, (player, runs) in enumerate(top_batsmen.items(), 1):
+        for i, (player, runs) in enumerate(zip(top_batsmen["player"], top_batsmen["runs"]), 1):
             result += f"{i}. {player}: {runs} runs\n"
 
-    elif "bowl" in query or "wicket" in query:
-        wickets_df = filtered_df[filtered_df["isWicketDelivery"] == 1]
-        top_bowlers = (
-            wickets_df.groupby("bowler")["player_out"]
-            .count()
-            .sort_values(ascending=False)
-            .head(10)
-        )
+    elif board == "bowling":
+        top_bowlers = top(ipl_df, "bowling", "wickets", 10, seasons=season)
         result = "🎯 Top Bowlers:\n"
-        for i, (player, wkts) in enumerate(top_bowlers.items(), 1):
+        for i, (player, wkts) in enumerate(zip(top_bowlers["player"], top_bowlers["wickets"]), 1):
             result += f"{i}. {player}: {wkts} wickets\n"
 
     else:
@@ -1,31 +1,35 @@
 # src/functional_tools/pair_stats_tool.py
 
 from src.data_loader import load_ipl_data
-ipl=load_ipl_data()
+from src.fact_tables import pair_partnerships
+from src.sqlite_backend import as_ipl_frame
 
-def get_pair_stats(player1, player2, season=None):
-    df = ipl.copy()
+def get_pair_stats(player1, player2, season=None, ipl=None):
+    if ipl is None:
+        ipl = load_ipl_data()
+    # Whole matches: a partnership's wicket number counts the wickets that fell before it
+    ipl = as_ipl_frame(ipl, players=[player1, player2], whole_matches=True)
+    # Every stint the two batted together, looked up by the (unordered) pair
+    pair_df = pair_partnerships(ipl, player1, player2)
 
     if season:
-        df = df[df["Season"] == int(season)]
-
-    # Filter for both players involved in same partnership
-    pair_df = df[(df["batter"].isin([player1, player2])) & (df["non-striker"].isin([player1, player2]))]
+        pair_df = pair_df[pair_df["Season"] == int(season)]
 
     if pair_df.empty:
         return f"No partnership data found for {player1} and {player2} in season {season or 'all seasons'}."
 
-    total_runs = pair_df["batsman_run"].sum()
-    balls_faced = pair_df.shape[0]
+    total_runs = pair_df["runs"].sum()
+    balls_faced = pair_df["balls"].sum()
     avg_runs_per_ball = round(total_runs / balls_faced, 2) if balls_faced else 0
+    best = pair_df.loc[pair_df["runs"].idxmax()]
 
     pair_stats = f"""👬 **Pair Stats: {player1} & {player2}**
                     - Total Runs Together: {total_runs}
                     - Balls Faced Together: {balls_faced}
                     - Average Runs per Ball: {avg_runs_per_ball}
+                    - Partnerships: {len(pair_df)} (50+: {(pair_df["runs"] >= 50).sum()})
+                    - Highest Partnership: {best["runs"]} ({best["balls"]} balls, wicket {best["wicket"]})
                     - Matches Played Together: {pair_df["ID"].nunique()}
                     - Season: {season or 'Overall'}"""
 
     return pair_stats
-
-
@@ -1,40 +1,51 @@
-import pandas as pd
-from src.data_loader import load_ipl_data
+import re
+from src.fact_tables import PHASE_OVERS
+from src.over_prefix import INNINGS_OVERS
+from src.query_engine import over_range_totals
+from src.sqlite_backend import as_ipl_frame
+
+# "overs 12-16", "over 12 to 16" (1-indexed, inclusive)
+OVER_WINDOW = re.compile(r"overs?\s*(\d+)\s*(?:-|to)\s*(\d+)$", re.IGNORECASE)
+
+
+def parse_over_window(phase):
+    """
+    The 0-indexed (first, last) overs of a phase name or an "overs 12-16" window, and its label.
+
+    Returns:
+        tuple: ((first, last), label), or (None, None) if ``phase`` is neither.
+    """
+    phase = phase.strip()
+    names = {name.lower(): name for name in PHASE_OVERS}
+    name = re.sub(r"\s+overs?$", "", phase, flags=re.IGNORECASE).lower()  # "Death Overs" -> "death"
+    if name in names:
+        return PHASE_OVERS[names[name]], f"{name.title()} Overs"
+    window = OVER_WINDOW.match(phase)
+    if window:
+        first, last = int(window.group(1)), int(window.group(2))
+        return (first - 1, last - 1), f"Overs {first}-{last}"
+    return None, None
 
 
 def get_phase_wise_performance(player_name, phase, season, df):
-    # Phase mapping based on overs
-    phase_map = {
-        'powerplay': (0, 5),
-        'middle': (6, 15),
-        'death': (16, 20)
-    }
-
-    phase = phase.lower()
-    if phase not in phase_map:
-        return f"Invalid phase: {phase}. Choose from Powerplay, Middle, or Death."
-
-    over_start, over_end = phase_map[phase]
-
-    if season:
-        df = df[df["Season"] == season]
-
-    # Filter by overs
-    df_phase = df[(df["overs"] >= over_start) & (df["overs"] <= over_end)]
-
-    # Batting
-    batting_df = df_phase[df_phase["batter"] == player_name]
-    runs = batting_df["batsman_run"].sum()
-    balls = batting_df.shape[0]
-    dismissals = batting_df[batting_df["player_out"] == player_name].shape[0]
-
-    # Bowling
-    bowling_df = df_phase[df_phase["bowler"] == player_name]
-    balls_bowled = bowling_df.shape[0]
-    wickets = bowling_df[bowling_df["isWicketDelivery"] == 1].shape[0]
-    runs_conceded = bowling_df["total_run"].sum()
-
-    result = f"📊 {player_name}'s performance in **{phase.title()} Overs**"
+    # Phases (0-indexed overs) are defined once in PHASE_OVERS; any other window is answered the same way
+    overs, label = parse_over_window(phase)
+    if overs is None:
+        return f"Invalid phase: {phase}. Choose from Powerplay, Middle, Death, or an over range like 'overs 12-16'."
+
+    df = as_ipl_frame(df, players=[player_name])
+    try:
+        # Batting
+        batting = over_range_totals(df, "batting", player_name, overs, seasons=season or None)
+        # Bowling
+        bowling = over_range_totals(df, "bowling", player_name, overs, seasons=season or None)
+    except ValueError:
+        return f"Invalid over range: {phase}. Overs run from 1 to {INNINGS_OVERS}."
+
+    runs, balls, dismissals = batting["runs"], batting["balls"], batting["dismissals"]
+    balls_bowled, runs_conceded, wickets = bowling["legal_balls"], bowling["runs_conceded"], bowling["wickets"]
+
+    result = f"📊 {player_name}'s performance in **{label}**"
     result += f"\n\n🟢 **Batting:**\n- Runs: {runs}\n- Balls: {balls}\n- Dismissals: {dismissals}"
     result += f"\n\n🔵 **Bowling:**\n- Balls Bowled: {balls_bowled}\n- Runs Conceded: {runs_conceded}\n- Wickets: {wickets}"
 
@@ -42,4 +53,3 @@ def get_phase_wise_performance(player_name, phase, season, df):
         result += f"\n\n🗓️ Season: {season}"
 
     return result
-
@@ -1,52 +1,56 @@
 import re
 import pandas as pd
+from src.fact_tables import get_career_stats_batch
+from src.sqlite_backend import as_ipl_frame
+
+# Columns shown for each player in a comparison
+COMPARISON_COLUMNS = [
+    'matches', 'teams', 'runs', 'balls_faced', 'strike_rate', 'fours', 'sixes', 'highest_score',
+    'fifties', 'hundreds', 'wickets', 'best_match_wickets', 'economy', 'five_wicket_hauls',
+]
+
+
+def get_player_comparison_table(players, ipl_df, season=None, opponent=None) -> pd.DataFrame:
+    """
+    Comparison columns for many players, computed in one grouped pass.
+
+    Args:
+        players (list): Player names.
+        ipl_df (pd.DataFrame or SQLiteIPLStore): The IPL dataset.
+        season (int or list or None): Restrict to these season(s).
+        opponent (str or None): Restrict to innings and spells against this team.
+
+    Returns:
+        pd.DataFrame: One row per player with data, indexed by player name.
+    """
+    players = [player.strip() for player in players]
+    ipl_df = as_ipl_frame(ipl_df, players=players)
+    return get_career_stats_batch(ipl_df, players, seasons=season, opponent=opponent)[COMPARISON_COLUMNS]
+
 
 def get_player_comparison(player1: str, player2: str, ipl_df) -> str:
     players = [player1.strip(), player2.strip()]
+    table = get_player_comparison_table(players, ipl_df)
 
     result = "🧍‍♂️ **IPL Player Comparison**\n\n"
 
     for player in players:
-        batting_df = ipl_df[ipl_df['batter'] == player]
-        bowling_df = ipl_df[ipl_df['bowler'] == player]
-        full_df = pd.concat([batting_df, bowling_df]).drop_duplicates()
-
-        if full_df.empty:
+        if player not in table.index:
             result += f"❌ No data available for **{player}**.\n\n"
             continue
 
-        # Batting stats
-        total_runs = batting_df['batsman_run'].sum()
-        total_balls = batting_df.shape[0]
-        strike_rate = (total_runs / total_balls) * 100 if total_balls else 0
-        total_fours = batting_df[batting_df['batsman_run'] == 4].shape[0]
-        total_sixes = batting_df[batting_df['batsman_run'] == 6].shape[0]
-        match_runs = batting_df.groupby("ID")["batsman_run"].sum()
-        fifties = match_runs[(match_runs >= 50) & (match_runs < 100)].count()
-        hundreds = match_runs[match_runs >= 100].count()
-        highest_score = match_runs.max() if not match_runs.empty else 0
-
-        # Bowling stats
-        dismissals = bowling_df[bowling_df["isWicketDelivery"] == 1]
-        total_wickets = dismissals["player_out"].notnull().sum()
-        best_bowling = dismissals.groupby("ID")["player_out"].count().max() if not dismissals.empty else 0
-        five_wkt_hauls = (dismissals.groupby("ID")["player_out"].count() >= 5).sum()
-
-        # Teams and matches
-        teams = set(batting_df['BattingTeam'].dropna().unique()) | set(bowling_df['BowlingTeam'].dropna().unique())
-        total_matches = full_df['ID'].nunique()
-
+        stats = table.loc[player]
         result += (
             f"🔹 **{player}**\n"
-            f"• Matches: {total_matches}\n"
-            f"• Teams: {', '.join(teams) if teams else 'N/A'}\n\n"
+            f"• Matches: {stats['matches']}\n"
+            f"• Teams: {stats['teams'] if stats['teams'] else 'N/A'}\n\n"
             f"**Batting:**\n"
-            f"→ Runs: {total_runs}, Balls: {total_balls}, SR: {strike_rate:.2f}\n"
-            f"→ 4s: {total_fours}, 6s: {total_sixes}\n"
-            f"→ Highest Score: {highest_score}, 50s: {fifties}, 100s: {hundreds}\n\n"
+            f"→ Runs: {stats['runs']}, Balls: {stats['balls_faced']}, SR: {stats['strike_rate']:.2f}\n"
+            f"→ 4s: {stats['fours']}, 6s: {stats['sixes']}\n"
+            f"→ Highest Score: {stats['highest_score']}, 50s: {stats['fifties']}, 100s: {stats['hundreds']}\n\n"
             f"**Bowling:**\n"
-            f"→ Wickets: {total_wickets}, Best in Match: {best_bowling} wkts\n"
-            f"→ 5-Wicket Hauls: {five_wkt_hauls}\n\n"
+            f"→ Wickets: {stats['wickets']}, Best in Match: {stats['best_match_wickets']} wkts\n"
+            f"→ Economy: {stats['economy']:.2f}, 5-Wicket Hauls: {stats['five_wicket_hauls']}\n\n"
         )
 
     return result
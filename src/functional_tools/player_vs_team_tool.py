@@ -1,6 +1,8 @@
 from langchain.tools import tool
 import pandas as pd
 from src.utils import normalize_team_name
+from src.query_engine import totals
+from src.sqlite_backend import as_ipl_frame
 
 # 🔍 Core Logic Function
 def get_player_vs_team_summary(player_name, team_name, season, df):
@@ -11,32 +13,27 @@ def get_player_vs_team_summary(player_name, team_name, season, df):
         player_name (str): Name of the player (e.g., "Virat Kohli").
         team_name (str): Name of the opponent team (e.g., "Chennai Super Kings").
         season (int or None): IPL season year (e.g., 2020) or None for overall.
-        df (pd.DataFrame): The IPL dataset.
+        df (pd.DataFrame or SQLiteIPLStore): The IPL dataset.
     
     Returns:
         str: Formatted performance summary.
     """
-    
-    # ✅ Filter the dataset by season (if provided)
-    if season:
-        df = df[df['Season'] == season]
+    df = as_ipl_frame(df, players=[player_name])
+    filters = dict(player=player_name, opponent=team_name, seasons=season or None)
 
     # Batting Performance
-
-    batting_df = df[(df['batter'] == player_name) & (df['BowlingTeam'] == team_name)]
-    
-    total_runs = batting_df['batsman_run'].sum()
-    balls_faced = batting_df.shape[0]
-    dismissals = batting_df[batting_df['player_out'] == player_name].shape[0]
-    strike_rate = round((total_runs / balls_faced) * 100, 2) if balls_faced > 0 else "N/A"
+    batting = totals(df, "batting", **filters)
+    total_runs = batting['runs']
+    balls_faced = batting['balls']
+    dismissals = batting['dismissals']
+    strike_rate = round(batting['strike_rate'], 2) if batting['strike_rate'] is not None else "N/A"
 
     #  Bowling Performance
-    bowling_df = df[(df['bowler'] == player_name) & (df['BattingTeam'] == team_name)]
-
-    runs_conceded = bowling_df['total_run'].sum()
-    wickets = bowling_df[bowling_df['isWicketDelivery'] == 1].shape[0]
-    balls_bowled = bowling_df.shape[0]
-    economy = round((runs_conceded / (balls_bowled / 6)), 2) if balls_bowled > 0 else "N/A"
+    bowling = totals(df, "bowling", **filters)
+    runs_conceded = bowling['runs_conceded']
+    wickets = bowling['wickets']
+    balls_bowled = bowling['legal_balls']
+    economy = round(bowling['economy'], 2) if bowling['economy'] is not None else "N/A"
 
     #  Format the Output
     
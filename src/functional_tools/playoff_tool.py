@@ -1,44 +1,44 @@
 import pandas as pd
 from src.utils import normalize_team_name
+from src.fact_tables import get_match_table
+from src.query_engine import totals
+from src.sqlite_backend import as_ipl_frame
 
 def get_playoff_performance(player_or_team_name: str, df: pd.DataFrame) -> str:
-    playoff_keywords = ['Qualifier 1', 'Eliminator', 'Final',' Semi Final', 'Semi Final', 'Qualifier 2', '3rd Place Play-Off']
-
     # Normalize team/player name
     player_or_team_name_normalized = normalize_team_name(player_or_team_name)
-    
-    # Filter playoff matches
-    playoff_df = df[df["MatchNumber"].str.contains('|'.join(playoff_keywords), case=False, na=False)]
+    df = as_ipl_frame(df, players=[player_or_team_name_normalized], teams=[player_or_team_name_normalized])
+
+    # Playoff matches (one row per match)
+    matches = get_match_table(df)
+    playoff_matches = matches[matches["is_playoff"]]
 
     # Check if input is team or player based on occurrence
-    is_team = player_or_team_name_normalized in df['BattingTeam'].unique() or player_or_team_name_normalized in df['Team1'].unique()
+    is_team = player_or_team_name_normalized in set(matches['Team1']) | set(matches['Team2'])
 
     result = f"📊 **Playoff Performance for {player_or_team_name_normalized}**\n"
 
     if is_team:
-        team_df = playoff_df[
-            (playoff_df["BattingTeam"] == player_or_team_name_normalized) | 
-            (playoff_df["Team1"] == player_or_team_name_normalized) |
-            (playoff_df["Team2"] == player_or_team_name_normalized)
+        team_matches = playoff_matches[
+            (playoff_matches["Team1"] == player_or_team_name_normalized) |
+            (playoff_matches["Team2"] == player_or_team_name_normalized)
         ]
-        matches_played = team_df["ID"].nunique()
-        wins = team_df[team_df["WinningTeam"] == player_or_team_name_normalized]["ID"].nunique()
+        matches_played = len(team_matches)
+        wins = (team_matches["WinningTeam"] == player_or_team_name_normalized).sum()
         losses = matches_played - wins
 
         result += f"\n🏏 Team Stats:\n- Matches: {matches_played}\n- Wins: {wins}\n- Losses: {losses}"
 
     else:
+        filters = dict(player=player_or_team_name_normalized, stage="playoff")
+
         # Player Batting
-        batting_df = playoff_df[playoff_df["batter"] == player_or_team_name_normalized]
-        runs = batting_df["batsman_run"].sum()
-        balls = batting_df.shape[0]
-        dismissals = batting_df[batting_df["player_out"] == player_or_team_name_normalized].shape[0]
+        batting = totals(df, "batting", **filters)
+        runs, balls, dismissals = batting["runs"], batting["balls"], batting["dismissals"]
 
         # Player Bowling
-        bowling_df = playoff_df[playoff_df["bowler"] == player_or_team_name_normalized]
-        balls_bowled = bowling_df.shape[0]
-        runs_conceded = bowling_df["total_run"].sum()
-        wickets = bowling_df[bowling_df["isWicketDelivery"] == 1].shape[0]
+        bowling = totals(df, "bowling", **filters)
+        balls_bowled, runs_conceded, wickets = bowling["legal_balls"], bowling["runs_conceded"], bowling["wickets"]
 
         result += f"\n\n🟢 **Batting:**\n- Runs: {runs}\n- Balls: {balls}\n- Dismissals: {dismissals}"
         result += f"\n\n🔵 **Bowling:**\n- Balls Bowled: {balls_bowled}\n- Runs Conceded: {runs_conceded}\n- Wickets: {wickets}"
@@ -1,30 +1,33 @@
 import pandas as pd
+from src.fact_tables import head_to_head_matches, get_batting_innings
+from src.query_engine import top
+from src.sqlite_backend import as_ipl_frame
 
 # 🧠 GENAI FUNCTION — Used by LangChain Agent
 def get_team_vs_team_summary(team1: str, team2: str, ipl: pd.DataFrame) -> str:
-    matches = ipl[((ipl['Team1'] == team1) & (ipl['Team2'] == team2)) |
-                  ((ipl['Team1'] == team2) & (ipl['Team2'] == team1))]
+    ipl = as_ipl_frame(ipl, teams=[team1, team2])
+    h2h = head_to_head_matches(ipl, team1, team2)
 
-    if matches.empty:
+    if h2h.empty:
         return f"No head-to-head records found between {team1} and {team2}."
 
-    total_matches = matches['ID'].nunique()
-    team1_wins = matches[matches['WinningTeam'] == team1]['ID'].nunique()
-    team2_wins = matches[matches['WinningTeam'] == team2]['ID'].nunique()
+    total_matches = len(h2h)
+    team1_wins = (h2h['WinningTeam'] == team1).sum()
+    team2_wins = (h2h['WinningTeam'] == team2).sum()
 
-    top_batsmen_df = matches.groupby('batter')['batsman_run'].sum().sort_values(ascending=False).head(5)
+    top_batsmen_df = top(ipl, "batting", "runs", 5, match_ids=h2h['ID']).set_index('player')['runs']
     top_batsmen_text = "\n".join([f"{i+1}. {name} ({runs} runs)" for i, (name, runs) in enumerate(top_batsmen_df.items())])
 
-    dismissals = matches[matches['isWicketDelivery'] == 1]
-    top_bowlers_df = dismissals[dismissals['player_out'].notnull()].groupby('bowler')['player_out'].count().sort_values(ascending=False).head(5)
+    top_bowlers_df = top(ipl, "bowling", "wickets", 5, match_ids=h2h['ID']).set_index('player')['wickets']
     top_bowlers_text = "\n".join([f"{i+1}. {name} ({wkts} wickets)" for i, (name, wkts) in enumerate(top_bowlers_df.items())])
 
-    highest_score = matches.groupby('ID')['total_run'].sum().max()
+    highest_score = int(h2h[['innings1_runs', 'innings2_runs']].max().max())
 
-    match_scores = matches.groupby(['ID', 'batter'])['batsman_run'].sum().reset_index()
-    top_individual = match_scores.sort_values(by='batsman_run', ascending=False).iloc[0]
+    innings = get_batting_innings(ipl)
+    match_scores = innings[innings['ID'].isin(h2h['ID'])]
+    top_individual = match_scores.sort_values(by='runs', ascending=False).iloc[0]
     best_batsman = top_individual['batter']
-    best_score = top_individual['batsman_run']
+    best_score = top_individual['runs']
 
     summary = (
         f"🏏 Head-to-Head: {team1} vs {team2}\n\n"
@@ -1,11 +1,28 @@
+import re
 import pandas as pd
+from src.fact_tables import get_match_table
+from src.sqlite_backend import as_ipl_frame
+
+def parse_tournament_scope(query: str):
+    """Return the season (int) a tournament question asks about, "all" for every season, or None."""
+    season_match = re.search(r'\b(20\d{2})\b', query)
+    if season_match:
+        return int(season_match.group(1))
+    if re.search(r'\ball\b', query.lower()):
+        return "all"
+    return None
+
 
 def get_tournament_summary(season: str, ipl_df) -> str:
     try:
+        scope = season.strip()
+        ipl_df = as_ipl_frame(ipl_df, seasons=None if scope.lower() == "all" else [int(scope)])
+        matches = get_match_table(ipl_df)
+
         # ✅ Case 1: Summary across all seasons
         if season.lower().strip() == "all":
             winners = (
-                ipl_df.dropna(subset=["WinningTeam"])
+                matches.dropna(subset=["WinningTeam"])
                 .sort_values(["Season", "Date"])
                 .groupby("Season")
                 .tail(1)[["Season", "WinningTeam"]]
@@ -16,22 +33,19 @@ def get_tournament_summary(season: str, ipl_df) -> str:
 
         # ✅ Case 2: Single season summary
         season = int(season.strip())
-        season_df = ipl_df[ipl_df["Season"] == season].copy()
+        season_matches = matches[matches["Season"] == season].copy()
 
-        if season_df.empty:
+        if season_matches.empty:
             return f"No data found for the {season} IPL season."
 
-        total_matches = season_df["ID"].nunique()
-
-        # Most used venue
-        venues = season_df["Venue"].value_counts()
-        most_used_venue = venues.idxmax() if not venues.empty else "Unknown"
+        season_df = ipl_df[ipl_df["Season"] == season]
+        total_matches = len(season_matches)
 
         # Convert to datetime safely
-        season_df["Date"] = pd.to_datetime(season_df["Date"], errors="coerce")
+        season_matches["Date"] = pd.to_datetime(season_matches["Date"], errors="coerce")
 
         # ✅ Pick last match with a valid winner
-        completed_matches = season_df.dropna(subset=["WinningTeam"])
+        completed_matches = season_matches.dropna(subset=["WinningTeam"])
         if completed_matches.empty:
             return f"IPL {season} season data is incomplete (no winner recorded)."
 
@@ -43,7 +57,7 @@ def get_tournament_summary(season: str, ipl_df) -> str:
 
         # Orange Cap
         top_batsman_stats = (
-            season_df.groupby("batter")["batsman_run"].sum().sort_values(ascending=False)
+            season_df.groupby("batter", observed=True)["batsman_run"].sum().sort_values(ascending=False)
         )
         top_batsman = top_batsman_stats.index[0]
         top_batsman_runs = top_batsman_stats.values[0]
@@ -51,7 +65,7 @@ def get_tournament_summary(season: str, ipl_df) -> str:
         # Purple Cap
         top_bowler_stats = (
             season_df[season_df["isWicketDelivery"] == 1]
-            .groupby("bowler")["player_out"]
+            .groupby("bowler", observed=True)["player_out"]
             .count()
             .sort_values(ascending=False)
         )
@@ -1,42 +1,40 @@
+from src.fact_tables import get_match_table
+from src.query_engine import totals, top
+from src.sqlite_backend import as_ipl_frame
 
 # 🧠-GENAI FUNCTION — Used by LangChain Agent
 def get_venue_summary(ipl, venue_query: str) -> str:
     venue = venue_query.strip()
+    ipl = as_ipl_frame(ipl, venue=venue)
 
-    df = ipl[ipl['Venue'].str.lower() == venue.lower()]
-    if df.empty:
+    all_matches = get_match_table(ipl)
+    matches = all_matches[all_matches['Venue'].str.lower() == venue.lower()]
+    if matches.empty:
         return f"No data found for venue '{venue}'."
 
-    total_matches = df['ID'].nunique()
+    venue_name = matches['Venue'].iloc[0]
+    total_matches = len(matches)
 
     # Innings-wise average scores
-    first_innings = df[df['innings'] == 1].groupby('ID')['total_run'].sum()
-    second_innings = df[df['innings'] == 2].groupby('ID')['total_run'].sum()
-    avg_score_1 = first_innings.mean()
-    avg_score_2 = second_innings.mean()
+    avg_score_1 = matches['innings1_runs'].mean()
+    avg_score_2 = matches['innings2_runs'].mean()
 
     # Total runs, 4s, and 6s
-    total_runs = df['batsman_run'].sum()
-    total_fours = df[df['batsman_run'] == 4].shape[0]
-    total_sixes = df[df['batsman_run'] == 6].shape[0]
+    batting = totals(ipl, "batting", venue=venue_name)
+    total_runs, total_fours, total_sixes = batting['runs'], batting['fours'], batting['sixes']
 
     # Match win analysis
-    match_results = df.groupby('ID').agg({
-        'BattingTeam': 'first',
-        'WinningTeam': 'first',
-        'innings': 'max'
-    }).reset_index()
-    bat_first_win = match_results[match_results['WinningTeam'] == match_results['BattingTeam']].shape[0]
-    chase_win = total_matches - bat_first_win
+    bat_first_win = (matches['result'] == 'bat_first').sum()
+    chase_win = (matches['result'] == 'chasing').sum()
 
     # Top 5 teams by win
-    team_wins = df.groupby('WinningTeam')['ID'].nunique().sort_values(ascending=False).head(3)
+    team_wins = matches.groupby('WinningTeam', observed=True)['ID'].nunique().sort_values(ascending=False).head(3)
 
     # Top 5 batsmen
-    top_batsmen = df.groupby('batter')['batsman_run'].sum().sort_values(ascending=False).head(5)
+    top_batsmen = top(ipl, "batting", "runs", 5, venue=venue_name).set_index('player')['runs']
 
     # Top 5 bowlers
-    top_bowlers = df[df['isWicketDelivery'] == 1].groupby('bowler')['player_out'].count().sort_values(ascending=False).head(5)
+    top_bowlers = top(ipl, "bowling", "wickets", 5, venue=venue_name).set_index('player')['wickets']
 
     return (
         f"🏟️ **Venue Summary: {venue}**\n\n"
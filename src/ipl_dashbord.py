@@ -3,6 +3,11 @@ import pandas as pd
 from PIL import Image
 from src.utils import autoplay_video, get_image_path
 from src.data_loader import load_ipl_data
+from src.player_index import get_player_index
+from src.fact_tables import get_bowling_spells, best_figures
+from src.duels import get_duel_matrix
+from src.over_prefix import INNINGS_OVERS
+from src.query_engine import over_range_totals
 from src.plots import plot_run_distribution, plot_ball_timeline
 from src.leaderboard import leaderboard_dashboard
 from src.player_summary import player_summary_page
@@ -22,15 +27,13 @@ class IPLDashboard:
     def __init__(self):
         try:
             logger.info("Initializing IPLDashboard and loading data...")
+            # Names and venues are already stripped and stored as categoricals by the loader.
             self.ipl = load_ipl_data()
+            self.index = get_player_index(self.ipl)
+            self.duels = get_duel_matrix(self.ipl)
 
-            self.ipl['Venue'] = self.ipl['Venue'].astype(str).str.strip()
-            self.ipl['batter'] = self.ipl['batter'].astype(str).str.strip()
-            self.ipl['bowler'] = self.ipl['bowler'].astype(str).str.strip()
-            self.ipl['player_out'] = self.ipl['player_out'].astype(str).str.strip()
-
-            self.batsmen = sorted(self.ipl['batter'].unique())
-            self.bowlers = sorted(self.ipl['bowler'].unique())
+            self.batsmen = self.index.players("batter")
+            self.bowlers = self.index.players("bowler")
             logger.info("Initialization completed successfully.")
 
         except Exception as e:
@@ -80,11 +83,11 @@ class IPLDashboard:
 
      ### Batsman Record.
     def get_batsman_record(self, batsman):
-        df = self.ipl[self.ipl['batter'] == batsman]
-        grouped = df.groupby('BowlingTeam')['batsman_run'].sum().sort_values(ascending=False).reset_index()
-        grouped['No_Of_fours'] = df[df['batsman_run'] == 4].groupby('BowlingTeam')['batsman_run'].count().reindex(grouped['BowlingTeam']).values
-        grouped['No_Of_sixes'] = df[df['batsman_run'] == 6].groupby('BowlingTeam')['batsman_run'].count().reindex(grouped['BowlingTeam']).values
-        grouped['ball_played'] = df.groupby('BowlingTeam')['ballnumber'].count().reindex(grouped['BowlingTeam']).values
+        df = self.index.rows(self.ipl, batsman, "batter")
+        grouped = df.groupby('BowlingTeam', observed=True)['batsman_run'].sum().sort_values(ascending=False).reset_index()
+        grouped['No_Of_fours'] = df[df['batsman_run'] == 4].groupby('BowlingTeam', observed=True)['batsman_run'].count().reindex(grouped['BowlingTeam']).values
+        grouped['No_Of_sixes'] = df[df['batsman_run'] == 6].groupby('BowlingTeam', observed=True)['batsman_run'].count().reindex(grouped['BowlingTeam']).values
+        grouped['ball_played'] = df.groupby('BowlingTeam', observed=True)['ballnumber'].count().reindex(grouped['BowlingTeam']).values
         grouped['Strike_rate'] = (grouped['batsman_run'] / grouped['ball_played']) * 100
 
         total_runs = grouped['batsman_run'].sum()
@@ -94,41 +97,21 @@ class IPLDashboard:
 
     ## Bowller record.
     def get_bowler_record(self, bowler):
-        df = self.ipl[self.ipl['bowler'] == bowler]
-
-        # Valid wickets only
-        wickets_df = df[(df['isWicketDelivery'] == 1) & (df['player_out'].notna()) & (df['player_out'] != '')]
-
-        # Total wickets per team
-        grouped = wickets_df.groupby('BattingTeam')['player_out'].count().sort_values(ascending=False).reset_index()
-        grouped.columns = ['BattingTeam', 'Wickets']
-
-        # Balls and runs for economy
-        grouped['Balls'] = df.groupby('BattingTeam')['ballnumber'].count().reindex(grouped['BattingTeam']).values
-        grouped['Runs'] = df.groupby('BattingTeam')['total_run'].sum().reindex(grouped['BattingTeam']).values
+        spells = get_bowling_spells(self.ipl)
+        spells = spells[spells['bowler'] == bowler]
+
+        # Wickets, balls and runs per opposing team
+        grouped = spells.groupby('opponent', observed=True).agg(
+            Wickets=('wickets', 'sum'), Balls=('legal_balls', 'sum'), Runs=('runs_conceded', 'sum')
+        )
+        grouped = grouped[grouped['Wickets'] > 0].sort_values('Wickets', ascending=False)
         grouped['Economy'] = (grouped['Runs'] / grouped['Balls']) * 6
 
         # 🔥 Best bowling in a match vs each team (wickets/runs)
-        match_stats = df.groupby(['BattingTeam', 'ID']).agg(
-            runs_in_match=('total_run', 'sum'),
-            balls_in_match=('ballnumber', 'count')
-        ).reset_index()
-
-        match_wickets = wickets_df.groupby(['BattingTeam', 'ID'])['player_out'].count().reset_index(name='wickets_in_match')
-
-        match_combined = pd.merge(match_stats, match_wickets, on=['BattingTeam', 'ID'], how='left').fillna(0)
-        match_combined['wickets_in_match'] = match_combined['wickets_in_match'].astype(int)
-
-        # Get best figures per team
-        best_figures = match_combined.sort_values(['BattingTeam', 'wickets_in_match', 'runs_in_match'], ascending=[True, False, True]) \
-                                 .drop_duplicates('BattingTeam')[['BattingTeam', 'wickets_in_match', 'runs_in_match']]
+        grouped['Best Bowling'] = best_figures(spells, 'opponent')[0]
 
-        best_figures['Best Bowling'] = best_figures['wickets_in_match'].astype(str) + "/" + best_figures['runs_in_match'].astype(str)
-
-        # Merge with grouped
-        grouped = grouped.merge(best_figures[['BattingTeam', 'Best Bowling']], on='BattingTeam', how='left')
-
-        return grouped
+        grouped.index.name = 'BattingTeam'
+        return grouped.reset_index()
 
     def team_analysis(self, team):
         try:
@@ -156,9 +139,9 @@ class IPLDashboard:
                 col2.image(img_path, caption=selected_player, width=120)
 
             # Batting Data
-            batter_df = self.ipl[self.ipl['batter'] == selected_player]
+            batter_df = self.index.rows(self.ipl, selected_player, "batter")
             batting_summary = (
-                batter_df.groupby('BowlingTeam')
+                batter_df.groupby('BowlingTeam', observed=True)
                 .agg(Matches=('ID', 'nunique'), Runs=('batsman_run', 'sum'), Balls=('ballnumber', 'count'))
                 .reset_index()
             )
@@ -177,7 +160,7 @@ class IPLDashboard:
                 st.info(f"ℹ️ No batting data available for {selected_player}.")
 
             # Bowling Data
-            bowling_df = self.ipl[self.ipl['bowler'] == selected_player]
+            bowling_df = self.index.rows(self.ipl, selected_player, "bowler")
             
             if not bowling_df.empty:
                 st.subheader(f"🎯 Bowling Record of {selected_player}")
@@ -198,6 +181,18 @@ class IPLDashboard:
             else:
                 st.info(f"ℹ️ {selected_player} has not bowled in the IPL data.")
 
+            # Any over window, answered from the per-over prefix sums
+            st.subheader(f"⏱️ {selected_player} by Over Window")
+            first, last = st.slider("Overs", 1, INNINGS_OVERS, (1, 6), key="over_window")
+            batting = over_range_totals(self.ipl, "batting", selected_player, (first - 1, last - 1))
+            bowling = over_range_totals(self.ipl, "bowling", selected_player, (first - 1, last - 1))
+
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Runs", batting['runs'])
+            col2.metric("Strike Rate", round(batting['strike_rate'], 2) if batting['strike_rate'] is not None else "-")
+            col3.metric("Wickets", bowling['wickets'])
+            col4.metric("Economy", round(bowling['economy'], 2) if bowling['economy'] is not None else "-")
+
             # Pie Chart: Run % vs Each Team
             if not batting_summary.empty:
                 st.markdown(f"### 🥧 {selected_player} Run Contribution vs Each Team")
@@ -219,14 +214,14 @@ class IPLDashboard:
     def show_duel(self, batsman, bowler):
         try:
             logger.info(f"Showing duel: {batsman} vs {bowler}")
-            duel_df = self.ipl[(self.ipl['batter'] == batsman) & (self.ipl['bowler'] == bowler)]
-            if duel_df.empty:
+            duel = self.duels.get(batsman, bowler)
+            if duel is None:
                 st.warning("❌ No data found for this player combination.")
                 return
 
-            runs = duel_df['batsman_run'].sum()
-            balls = duel_df.shape[0]
-            outs = duel_df[duel_df['player_out'] == batsman].shape[0]
+            runs = duel['runs']
+            balls = duel['balls']
+            outs = duel['dismissals']
             sr = (runs / balls * 100) if balls > 0 else 0
 
             st.subheader(f"🎯 {batsman} vs {bowler}")
@@ -246,6 +241,7 @@ class IPLDashboard:
             col3.metric("Dismissals", outs)
             col4.metric("Strike Rate", round(sr, 2))
 
+            duel_df = pd.DataFrame({'batsman_run': duel['ball_runs']})
             plot_run_distribution(duel_df)
             plot_ball_timeline(duel_df)
         except Exception as e:
@@ -273,7 +269,7 @@ class IPLDashboard:
 
             elif option == '⚔️-Player vs Bowler Duel':
                 batsman = st.sidebar.selectbox("Select Batsman", self.batsmen)
-                bowler = st.sidebar.selectbox("Select Bowler", self.bowlers)
+                bowler = st.sidebar.selectbox("Select Bowler", self.duels.bowlers_faced(batsman))
                 if st.sidebar.button("\U0001F3AF Show Duel Record"):
                     self.show_duel(batsman, bowler)
 
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+from src.data_loader import derived_from_frame
+
+# Per-segment reductions over rows sorted so that every group is one contiguous
+# run. Sorting happens once; each reduction is then a single np.*.reduceat call
+# instead of a Python function per group.
+
+
+def sort_codes(column):
+    """
+    Integer codes ordering ``column`` the way ``groupby(sort=True)`` does.
+
+    Categoricals use their category order, numbers their value and anything
+    else its sorted unique values. Missing values get -1.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy()
+    if pd.api.types.is_numeric_dtype(column) and not column.isna().any():
+        return column.to_numpy()
+    return pd.factorize(column, sort=True)[0]
+
+
+def segment_starts(*keys):
+    """
+    Start positions of the runs of equal keys in already sorted key arrays.
+
+    Args:
+        *keys (np.ndarray): Equal-length arrays; a new segment starts wherever any of them changes.
+
+    Returns:
+        np.ndarray: Index of the first row of each segment.
+    """
+    n = len(keys[0]) if keys else 0
+    if n == 0:
+        return np.zeros(0, dtype=np.intp)
+    new_segment = np.zeros(n, dtype=bool)
+    new_segment[0] = True
+    for key in keys:
+        key = np.asarray(key)
+        new_segment[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(new_segment)
+
+
+def segment_sum(values, starts):
+    """Sum of ``values`` over each segment (booleans are counted). Integers sum as int64."""
+    values = np.asarray(values)
+    if values.dtype == bool or np.issubdtype(values.dtype, np.integer):
+        values = values.astype(np.int64)
+    if len(starts) == 0:
+        return np.zeros((0,) + values.shape[1:], dtype=values.dtype)
+    return np.add.reduceat(values, starts, axis=0)
+
+
+def segment_max(values, starts):
+    """Maximum of ``values`` over each segment."""
+    values = np.asarray(values)
+    if len(starts) == 0:
+        return np.zeros(0, dtype=values.dtype)
+    return np.maximum.reduceat(values, starts)
+
+
+def segment_min(values, starts):
+    """Minimum of ``values`` over each segment."""
+    values = np.asarray(values)
+    if len(starts) == 0:
+        return np.zeros(0, dtype=values.dtype)
+    return np.minimum.reduceat(values, starts)
+
+
+def segment_sizes(starts, n):
+    """Number of rows in each segment of an ``n``-row array."""
+    return np.diff(np.append(starts, n))
+
+
+def coded_sum(codes, values, n_groups):
+    """Sum of ``values`` per integer group code in [0, n_groups), via bincount; codes need not be sorted."""
+    return np.bincount(codes, weights=np.asarray(values, dtype=np.float64), minlength=n_groups)
+
+
+class Segments:
+    """
+    Rows of a frame grouped by ``keys`` into contiguous segments.
+
+    A drop-in for ``frame.groupby(keys, observed=True)`` aggregations: the rows
+    are sorted once (stable, so rows keep their order inside a group) and
+    ``sum``/``count``/``max``/``min``/``first`` are single reduceat calls.
+    Groups come out in the order ``groupby`` would return them; rows with a
+    missing key are dropped, as ``groupby`` does.
+    """
+
+    def __init__(self, frame, keys, presorted=False):
+        self.keys_columns = list(keys)
+        codes = [sort_codes(frame[key]) for key in self.keys_columns]
+        rows = np.flatnonzero(frame[self.keys_columns].notna().all(axis=1).to_numpy())
+        if not presorted:
+            rows = rows[np.lexsort([code[rows] for code in reversed(codes)])]
+        self.order = rows
+        self.starts = segment_starts(*(code[rows] for code in codes))
+        self._frame = frame
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _sorted(self, values):
+        if isinstance(values, str):
+            values = self._frame[values]
+        return np.asarray(values)[self.order]
+
+    def keys(self):
+        """The key columns, one row per segment, as a DataFrame."""
+        first_rows = self.order[self.starts]
+        return self._frame[self.keys_columns].iloc[first_rows].reset_index(drop=True)
+
+    def size(self):
+        return segment_sizes(self.starts, len(self.order))
+
+    def sum(self, values):
+        """Per-segment sum of a column name or an array aligned with the frame."""
+        return segment_sum(self._sorted(values), self.starts)
+
+    def count(self, mask):
+        """Per-segment number of rows where ``mask`` is true."""
+        return segment_sum(self._sorted(mask).astype(bool), self.starts)
+
+    def max(self, values):
+        return segment_max(self._sorted(values), self.starts)
+
+    def min(self, values):
+        return segment_min(self._sorted(values), self.starts)
+
+    def first(self, values):
+        return self._sorted(values)[self.starts]
+
+
+def innings_order(ipl):
+    """
+    Row positions of ``ipl`` in delivery order: by ID, innings, over, ball, then file order.
+
+    Computed once per frame.
+    """
+    return derived_from_frame(ipl, "innings_order", lambda df: np.lexsort((
+        np.arange(len(df)), df['ballnumber'].to_numpy(), df['overs'].to_numpy(),
+        df['innings'].to_numpy(), df['ID'].to_numpy(),
+    )))
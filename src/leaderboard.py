@@ -1,6 +1,6 @@
-import pandas as pd
 import streamlit as st
 import altair as alt
+from src.leaderboard_store import get_leaderboard_store
 from core.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -9,8 +9,9 @@ def leaderboard_dashboard(ipl, season=None):
     try:
         st.markdown("## 🏆 IPL Leaderboard Dashboard")
 
-        # 🎯 Season filtering
-        available_seasons = sorted(ipl["Season"].dropna().unique())
+        # 🎯 Season filtering (leaderboards for every season are precomputed)
+        store = get_leaderboard_store(ipl)
+        available_seasons = store.seasons
         logger.info("Available seasons extracted successfully.")
 
         # If season is passed (from agent), use it — else show selector
@@ -21,22 +22,20 @@ def leaderboard_dashboard(ipl, season=None):
             selected_season = st.selectbox("📅 Select Season", available_seasons)
             logger.info(f"Season selected by user: {selected_season}")
 
-        # Filter data
-        season_df = ipl[ipl["Season"] == selected_season]
-
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        # Only the selected view is rendered (st.tabs would build all six on every rerun)
+        view = st.radio("📊 Leaderboard", [
             "🏏 Top Run Scorers", "🎯 Top Wicket Takers", "💥 Most Sixes",
             "🎯 Most Fours", "🚀 Best Strike Rate", "🛡️ Best Economy"
-        ])
+        ], horizontal=True)
 
         # 1️⃣ Top Run Scorers
-        with tab1:
+        if view == "🏏 Top Run Scorers":
             try:
-                top_runs = season_df.groupby("batter")["batsman_run"].sum().sort_values(ascending=False).head(10).reset_index()
+                top_runs = store.board("runs", selected_season)
                 chart = alt.Chart(top_runs).mark_bar(color="#3498DB").encode(
-                    x=alt.X("batsman_run:Q", title="Runs"),
+                    x=alt.X("runs:Q", title="Runs"),
                     y=alt.Y("batter:N", sort='-x', title="Batsman"),
-                    tooltip=["batter", "batsman_run"]
+                    tooltip=["batter", "runs"]
                 ).properties(title=f"🏏 Top Run Scorers - {selected_season}", height=450)
                 st.altair_chart(chart, use_container_width=True)
             except Exception as e:
@@ -44,13 +43,13 @@ def leaderboard_dashboard(ipl, season=None):
                 st.error("Error loading Top Run Scorers.")
 
         # 2️⃣ Top Wicket Takers
-        with tab2:
+        elif view == "🎯 Top Wicket Takers":
             try:
-                top_wickets = season_df[season_df['player_out'].notna()].groupby("bowler")["player_out"].count().sort_values(ascending=False).head(10).reset_index()
+                top_wickets = store.board("wickets", selected_season)
                 chart = alt.Chart(top_wickets).mark_bar(color="#E74C3C").encode(
-                    x=alt.X("player_out:Q", title="Wickets"),
+                    x=alt.X("wickets:Q", title="Wickets"),
                     y=alt.Y("bowler:N", sort='-x', title="Bowler"),
-                    tooltip=["bowler", "player_out"]
+                    tooltip=["bowler", "wickets"]
                 ).properties(title=f"🎯 Most Wickets - {selected_season}", height=450)
                 st.altair_chart(chart, use_container_width=True)
             except Exception as e:
@@ -58,9 +57,9 @@ def leaderboard_dashboard(ipl, season=None):
                 st.error("Error loading Wicket Takers.")
 
         # 3️⃣ Most Sixes
-        with tab3:
+        elif view == "💥 Most Sixes":
             try:
-                sixes = season_df[season_df['batsman_run'] == 6].groupby("batter").size().sort_values(ascending=False).head(10).reset_index(name='sixes')
+                sixes = store.board("sixes", selected_season)
                 chart = alt.Chart(sixes).mark_bar(color="#9B59B6").encode(
                     x=alt.X("sixes:Q", title="Sixes"),
                     y=alt.Y("batter:N", sort='-x'),
@@ -72,9 +71,9 @@ def leaderboard_dashboard(ipl, season=None):
                 st.error("Error loading Most Sixes.")
 
         # 4️⃣ Most Fours
-        with tab4:
+        elif view == "🎯 Most Fours":
             try:
-                fours = season_df[season_df['batsman_run'] == 4].groupby("batter").size().sort_values(ascending=False).head(10).reset_index(name='fours')
+                fours = store.board("fours", selected_season)
                 chart = alt.Chart(fours).mark_bar(color="#F39C12").encode(
                     x=alt.X("fours:Q", title="Fours"),
                     y=alt.Y("batter:N", sort='-x'),
@@ -86,35 +85,17 @@ def leaderboard_dashboard(ipl, season=None):
                 st.error("Error loading Most Fours.")
 
         # 5️⃣ Best Strike Rate
-        with tab5:
+        elif view == "🚀 Best Strike Rate":
             try:
-                balls = season_df.groupby("batter")["ballnumber"].count()
-                runs = season_df.groupby("batter")["batsman_run"].sum()
-                strike_rate_df = pd.DataFrame({
-                    "batter": runs.index,
-                    "runs": runs.values,
-                    "balls": balls.values,
-                    "strike_rate": (runs.values / balls.values) * 100
-                })
-                filtered = strike_rate_df[strike_rate_df["balls"] > 100].sort_values("strike_rate", ascending=False).head(10)
-                st.dataframe(filtered.reset_index(drop=True), use_container_width=True)
+                st.dataframe(store.board("strike_rate", selected_season), use_container_width=True)
             except Exception as e:
                 logger.exception("Failed to calculate Best Strike Rate.")
                 st.error("Error calculating Strike Rate.")
 
         # 6️⃣ Best Economy
-        with tab6:
+        elif view == "🛡️ Best Economy":
             try:
-                total_runs = season_df.groupby("bowler")["batsman_run"].sum()
-                total_balls = season_df.groupby("bowler")["ballnumber"].count()
-                economy_df = pd.DataFrame({
-                    "bowler": total_runs.index,
-                    "runs_conceded": total_runs.values,
-                    "balls": total_balls.values,
-                    "economy": total_runs.values / (total_balls.values / 6)
-                })
-                filtered = economy_df[economy_df["balls"] > 100].sort_values("economy").head(10)
-                st.dataframe(filtered.reset_index(drop=True), use_container_width=True)
+                st.dataframe(store.board("economy", selected_season), use_container_width=True)
             except Exception as e:
                 logger.exception("Failed to calculate Best Economy.")
                 st.error("Error calculating Economy.")
@@ -0,0 +1,103 @@
+import pandas as pd
+from src.data_loader import derived_from_frame
+from src.fact_tables import get_batting_innings, get_bowling_spells
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+TOP_N = 10
+# Minimum balls faced / bowled to qualify for the strike-rate and economy boards
+MIN_BALLS = {"strike_rate": 100, "economy": 100}
+
+# Board name -> (player column, ranking column, ascending, columns shown)
+BOARDS = {
+    "runs": ("batter", "runs", False, ["batter", "runs"]),
+    "wickets": ("bowler", "wickets", False, ["bowler", "wickets"]),
+    "sixes": ("batter", "sixes", False, ["batter", "sixes"]),
+    "fours": ("batter", "fours", False, ["batter", "fours"]),
+    "strike_rate": ("batter", "strike_rate", False, ["batter", "runs", "balls", "strike_rate"]),
+    "economy": ("bowler", "economy", True, ["bowler", "runs_conceded", "balls", "economy"]),
+}
+
+
+def build_season_player_totals(ipl):
+    """
+    Batting and bowling totals per (Season, player).
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+
+    Returns:
+        tuple: (batting totals with runs/balls/fours/sixes, bowling totals with
+        wickets/balls/runs_conceded), each with a Season column.
+    """
+    batting = (
+        get_batting_innings(ipl)
+        .groupby(['Season', 'batter'], observed=True)[['runs', 'balls', 'fours', 'sixes']]
+        .sum()
+        .reset_index()
+    )
+    bowling = (
+        get_bowling_spells(ipl)[['Season', 'bowler', 'wickets', 'legal_balls', 'runs_conceded']]
+        .rename(columns={'legal_balls': 'balls'})
+        .groupby(['Season', 'bowler'], observed=True)
+        .sum()
+        .reset_index()
+    )
+    return batting, bowling
+
+
+def _rank(totals, board, top_n, min_balls):
+    player, metric, ascending, columns = BOARDS[board]
+    if board in min_balls:
+        totals = totals[totals['balls'] > min_balls[board]]
+    return (
+        totals.sort_values([metric, player], ascending=[ascending, True])
+        .head(top_n)[columns]
+        .reset_index(drop=True)
+    )
+
+
+class LeaderboardStore:
+    """
+    Top-N leaderboards for every season and for all seasons, computed once.
+
+    ``board(name, season)`` is a dictionary lookup; ``season=None`` means all
+    seasons.
+    """
+
+    def __init__(self, ipl, top_n=TOP_N, min_balls=None):
+        min_balls = {**MIN_BALLS, **(min_balls or {})}
+        batting, bowling = build_season_player_totals(ipl)
+
+        batting['strike_rate'] = batting['runs'] / batting['balls'] * 100
+        bowling['economy'] = bowling['runs_conceded'] / (bowling['balls'] / 6)
+        all_time = (
+            batting.groupby('batter')[['runs', 'balls', 'fours', 'sixes']].sum().reset_index(),
+            bowling.groupby('bowler')[['wickets', 'balls', 'runs_conceded']].sum().reset_index(),
+        )
+        all_time[0]['strike_rate'] = all_time[0]['runs'] / all_time[0]['balls'] * 100
+        all_time[1]['economy'] = all_time[1]['runs_conceded'] / (all_time[1]['balls'] / 6)
+
+        partitions = {None: all_time}
+        for season in sorted(set(batting['Season']) | set(bowling['Season'])):
+            partitions[int(season)] = (batting[batting['Season'] == season], bowling[bowling['Season'] == season])
+
+        self.seasons = [season for season in partitions if season is not None]
+        self._boards = {
+            (season, board): _rank(bat if BOARDS[board][0] == 'batter' else bowl, board, top_n, min_balls)
+            for season, (bat, bowl) in partitions.items()
+            for board in BOARDS
+        }
+        logger.info(f"Leaderboards precomputed for {len(self.seasons)} seasons.")
+
+    def board(self, name, season=None):
+        """Top-N table of board ``name`` for ``season`` (None for all seasons)."""
+        return self._boards.get((season, name), pd.DataFrame(columns=BOARDS[name][3]))
+
+
+def get_leaderboard_store(ipl, top_n=TOP_N, min_balls=None):
+    """Return the LeaderboardStore for ``ipl`` and these settings, building it on first use."""
+    settings = {**MIN_BALLS, **(min_balls or {})}
+    name = f"leaderboards:{top_n}:" + ",".join(f"{key}={value}" for key, value in sorted(settings.items()))
+    return derived_from_frame(ipl, name, lambda df: LeaderboardStore(df, top_n, settings))
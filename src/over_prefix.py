@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from src.data_loader import derived_from_frame
+from src.kernels import segment_starts, segment_sum
+from src.stats_cube import BATTING_MEASURES, BOWLING_MEASURES, ROLES, delivery_measures
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 0-indexed overs of an innings; over ranges are inclusive (first, last) pairs within it
+INNINGS_OVERS = 20
+PREFIX_MEASURES = {'batting': BATTING_MEASURES, 'bowling': BOWLING_MEASURES}
+
+
+def check_over_range(overs):
+    """Return ``overs`` as an int (first, last) pair, raising ValueError if it is not a range of 0-indexed overs."""
+    first, last = (int(over) for over in overs)
+    if not 0 <= first <= last < INNINGS_OVERS:
+        raise ValueError(f"Invalid over range {overs}: expected 0 <= first <= last <= {INNINGS_OVERS - 1} (0-indexed).")
+    return first, last
+
+
+class OverPrefixSums:
+    """
+    Cumulative per-over measures of every player, per season and over the career.
+
+    For each role, ``prefix[k, o]`` holds the measures summed over overs 0..o-1
+    of key k, so the measures of any contiguous over range come from two rows and
+    a subtraction, whatever the range and however many deliveries it covers.
+    """
+
+    def __init__(self, ipl):
+        self._tables = {role: self._build(ipl, role) for role in ROLES}
+        logger.info(f"Over prefix sums built for {len(self._tables['batting']['career'])} batters and "
+                    f"{len(self._tables['bowling']['career'])} bowlers.")
+
+    @staticmethod
+    def _build(ipl, role):
+        measures = PREFIX_MEASURES[role]
+        parts = [
+            pd.DataFrame({'player': player, 'Season': ipl['Season'], 'over': ipl['overs'], **columns})
+            for player, columns in delivery_measures(ipl, role)
+        ]
+        deliveries = pd.concat(parts, ignore_index=True).dropna(subset=['player'])
+        deliveries = deliveries[deliveries['over'].between(0, INNINGS_OVERS - 1)]
+        per_over = deliveries.groupby(['player', 'Season', 'over'], observed=True)[measures].sum()
+
+        # --- Dense (player-season, over, measure) array, then running totals along the overs ---
+        keys = per_over.index.droplevel('over').unique()
+        dense = np.zeros((len(keys), INNINGS_OVERS, len(measures)), dtype=np.int64)
+        dense[keys.get_indexer(per_over.index.droplevel('over')),
+              per_over.index.get_level_values('over').to_numpy()] = per_over.to_numpy()
+
+        players = keys.get_level_values('player').astype(str)
+        starts = segment_starts(pd.factorize(players)[0])
+        career = segment_sum(dense, starts)
+
+        def running(totals):
+            return np.concatenate([np.zeros_like(totals[:, :1]), totals.cumsum(axis=1)], axis=1)
+
+        return {
+            'seasons': {(player, int(season)): k for k, (player, season) in enumerate(zip(players, keys.get_level_values('Season')))},
+            'career': {player: i for i, player in enumerate(players[starts])},
+            'season_prefix': running(dense),
+            'career_prefix': running(career),
+        }
+
+    def totals(self, role, player, overs, seasons=None):
+        """
+        ``role`` measures of ``player`` in an over range.
+
+        Args:
+            role (str): "batting" or "bowling".
+            player (str): Batter / bowler name.
+            overs (tuple): Inclusive (first, last) range of 0-indexed overs.
+            seasons (list or None): Seasons to include; None for the whole career.
+
+        Returns:
+            dict: PREFIX_MEASURES[role] -> int (all zero if the player has no deliveries there).
+        """
+        first, last = check_over_range(overs)
+        table = self._tables[role]
+        if seasons is None:
+            rows = [table['career'][player]] if player in table['career'] else []
+            prefix = table['career_prefix']
+        else:
+            rows = [table['seasons'][key] for key in ((player, int(season)) for season in seasons) if key in table['seasons']]
+            prefix = table['season_prefix']
+
+        total = (prefix[rows, last + 1] - prefix[rows, first]).sum(axis=0)
+        return {measure: int(value) for measure, value in zip(PREFIX_MEASURES[role], total)}
+
+
+def get_over_prefix_sums(ipl):
+    """Return the OverPrefixSums for ``ipl``, building them on first use."""
+    return derived_from_frame(ipl, "over_prefix_sums", OverPrefixSums)
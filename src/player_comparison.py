@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 from src.utils import get_image_path
+from src.player_index import get_player_index
+from src.fact_tables import get_career_stats
 from core.logger import setup_logger
 import re
 
@@ -9,14 +11,15 @@ logger = setup_logger(__name__)
 def player_detailed_comparison(ipl, bat1=None, bat2=None, bowl1=None, bowl2=None):
     try:
         st.header("⚖️ Player Career Comparison", divider='rainbow')
+        index = get_player_index(ipl)
         tab1, tab2 = st.tabs(["🧢 Batsman Comparison", "🎯 Bowler Comparison"])
 
         # ---------------------- 🧢 Batsman Comparison --------------------------
         with tab1:
             try:
                 col1, col2 = st.columns(2)
-                p1 = bat1 if bat1 else col1.selectbox("Select Batsman 1", sorted(ipl['batter'].unique()), key="bat1")
-                p2 = bat2 if bat2 else col2.selectbox("Select Batsman 2", sorted(ipl['batter'].unique()), key="bat2")
+                p1 = bat1 if bat1 else col1.selectbox("Select Batsman 1", index.players("batter"), key="bat1")
+                p2 = bat2 if bat2 else col2.selectbox("Select Batsman 2", index.players("batter"), key="bat2")
 
                 logger.info(f"Selected batsmen: {p1} vs {p2}")
 
@@ -25,36 +28,27 @@ def player_detailed_comparison(ipl, bat1=None, bat2=None, bowl1=None, bowl2=None
                     logger.warning("Same batsman selected for both sides.")
                     return
 
-                df1 = ipl[ipl['batter'] == p1]
-                df2 = ipl[ipl['batter'] == p2]
-
-                def get_batsman_stats(df, player):
+                def get_batsman_stats(player):
                     try:
-                        total_runs = df['batsman_run'].sum()
-                        balls = df.shape[0]
-                        fours = df[df['batsman_run'] == 4].shape[0]
-                        sixes = df[df['batsman_run'] == 6].shape[0]
-                        innings = df['ID'].nunique()
-                        strike_rate = (total_runs / balls) * 100 if balls > 0 else 0
-                        fifties = df.groupby('ID')['batsman_run'].sum()
-                        num_50s = fifties[(fifties >= 50) & (fifties < 100)].count()
-                        num_100s = fifties[fifties >= 100].count()
+                        stats = get_career_stats(ipl, player)
+                        if stats is None:
+                            return {"player": player}
                         return {
                             "player": player,
-                            "innings": innings,
-                            "runs": total_runs,
-                            "strike_rate": round(strike_rate, 2),
-                            "fours": fours,
-                            "sixes": sixes,
-                            "50s": num_50s,
-                            "100s": num_100s
+                            "innings": stats['batting_innings'],
+                            "runs": stats['runs'],
+                            "strike_rate": round(stats['strike_rate'], 2),
+                            "fours": stats['fours'],
+                            "sixes": stats['sixes'],
+                            "50s": stats['fifties'],
+                            "100s": stats['hundreds']
                         }
                     except Exception as e:
                         logger.exception(f"Error calculating stats for batsman {player}: {e}")
                         return {}
 
-                stats1 = get_batsman_stats(df1, p1)
-                stats2 = get_batsman_stats(df2, p2)
+                stats1 = get_batsman_stats(p1)
+                stats2 = get_batsman_stats(p2)
 
                 st.markdown("### 📊 Batsman Stats Side-by-Side")
                 c1, c2 = st.columns(2)
@@ -78,8 +72,8 @@ def player_detailed_comparison(ipl, bat1=None, bat2=None, bowl1=None, bowl2=None
         with tab2:
             try:
                 col1, col2 = st.columns(2)
-                p1 = bowl1 if bowl1 else col1.selectbox("Select Bowler 1", sorted(ipl['bowler'].unique()), key="bowl1")
-                p2 = bowl2 if bowl2 else col2.selectbox("Select Bowler 2", sorted(ipl['bowler'].unique()), key="bowl2")
+                p1 = bowl1 if bowl1 else col1.selectbox("Select Bowler 1", index.players("bowler"), key="bowl1")
+                p2 = bowl2 if bowl2 else col2.selectbox("Select Bowler 2", index.players("bowler"), key="bowl2")
 
                 logger.info(f"Selected bowlers: {p1} vs {p2}")
 
@@ -88,34 +82,25 @@ def player_detailed_comparison(ipl, bat1=None, bat2=None, bowl1=None, bowl2=None
                     logger.warning("Same bowler selected for both sides.")
                     return
 
-                df1 = ipl[ipl['bowler'] == p1]
-                df2 = ipl[ipl['bowler'] == p2]
-
-                def get_bowler_stats(df, player):
+                def get_bowler_stats(player):
                     try:
-                        innings = df['ID'].nunique()
-                        balls = df['ballnumber'].count()
-                        overs = balls / 6
-                        runs_conceded = df['batsman_run'].sum()
-                        wickets = df[df['isWicketDelivery'] == 1].shape[0]
-                        economy = (runs_conceded / overs) if overs > 0 else 0
-                        five_wkts = df[df['isWicketDelivery'] == 1].groupby('ID').size()
-                        five_wkts = five_wkts[five_wkts >= 5].count()
-
+                        stats = get_career_stats(ipl, player)
+                        if stats is None:
+                            return {"player": player}
                         return {
                             "player": player,
-                            "innings": innings,
-                            "overs": round(overs, 1),
-                            "wickets": wickets,
-                            "economy": round(economy, 2),
-                            "5w_hauls": five_wkts
+                            "innings": stats['bowling_innings'],
+                            "overs": round(stats['balls_bowled'] / 6, 1),
+                            "wickets": stats['wickets'],
+                            "economy": round(stats['economy'], 2),
+                            "5w_hauls": stats['five_wicket_hauls']
                         }
                     except Exception as e:
                         logger.exception(f"Error calculating stats for bowler {player}: {e}")
                         return {}
 
-                stats1 = get_bowler_stats(df1, p1)
-                stats2 = get_bowler_stats(df2, p2)
+                stats1 = get_bowler_stats(p1)
+                stats2 = get_bowler_stats(p2)
 
                 st.markdown("### 📊 Bowler Stats Side-by-Side")
                 c1, c2 = st.columns(2)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+from src.data_loader import derived_from_frame
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Role name -> ball-by-ball column holding the player for that role
+PLAYER_ROLES = {
+    "batter": "batter",
+    "bowler": "bowler",
+    "non_striker": "non-striker",
+    "dismissed": "player_out",
+}
+
+_NO_ROWS = np.array([], dtype=np.intp)
+
+
+def _group_positions(column):
+    """Map every value of ``column`` to the (ascending) row positions holding it."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))
+        starts = np.searchsorted(codes[order], 0)  # skip NaN rows (code -1)
+        bounds = starts + np.concatenate(([0], np.cumsum(counts)))
+        return {
+            name: order[bounds[i]:bounds[i + 1]]
+            for i, name in enumerate(column.cat.categories)
+            if counts[i] > 0
+        }
+    return column.groupby(column, sort=False).indices
+
+
+class PlayerIndex:
+    """
+    Row positions of each player in the ball-by-ball frame, per role.
+
+    Built once per frame, so fetching a player's deliveries costs
+    O(rows for that player) instead of a boolean scan over every IPL delivery.
+    """
+
+    def __init__(self, ipl):
+        self.n_rows = len(ipl)
+        self._positions = {
+            role: _group_positions(ipl[column]) if column in ipl.columns else {}
+            for role, column in PLAYER_ROLES.items()
+        }
+        logger.info(f"PlayerIndex built for {len(self._positions['batter'])} batters and "
+                    f"{len(self._positions['bowler'])} bowlers.")
+
+    def positions(self, player, role="batter"):
+        """Row positions where ``player`` appears in ``role`` (empty array if never)."""
+        return self._positions[role].get(player, _NO_ROWS)
+
+    def rows(self, ipl, player, role="batter"):
+        """Deliveries of the indexed frame ``ipl`` where ``player`` appears in ``role``."""
+        return ipl.iloc[self.positions(player, role)]
+
+    def count(self, player, role="batter"):
+        return len(self.positions(player, role))
+
+    def players(self, role="batter"):
+        """Sorted names of every player who appears in ``role``."""
+        return sorted(self._positions[role])
+
+
+def get_player_index(ipl):
+    """Return the PlayerIndex for ``ipl``, building it on first use."""
+    return derived_from_frame(ipl, "player_index", PlayerIndex)
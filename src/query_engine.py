@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+from src.fact_tables import PHASE_OVERS, get_match_table
+from src.player_index import get_player_index
+from src.stats_cube import (
+    BATTING_MEASURES, BOWLING_MEASURES, ROLES,
+    aggregate_cube, build_batting_cube, build_bowling_cube, get_cube,
+)
+from src.leaderboard_store import BOARDS, TOP_N, get_leaderboard_store
+from src.over_prefix import PREFIX_MEASURES, get_over_prefix_sums
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MEASURES = {'batting': BATTING_MEASURES + ['matches'], 'bowling': BOWLING_MEASURES + ['matches']}
+# Rates derived from the measures (NaN when the denominator is zero)
+RATES = {'batting': ['strike_rate', 'average'], 'bowling': ['economy', 'average']}
+STAGES = ('league', 'playoff')
+
+
+def _as_list(value):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set, pd.Series, np.ndarray)):
+        return list(value)
+    return [value]
+
+
+def _phase_for_overs(overs):
+    """The PHASE_OVERS name covering exactly ``overs`` (first, last), else None."""
+    for name, bounds in PHASE_OVERS.items():
+        if tuple(overs) == bounds:
+            return name
+    return None
+
+
+def _add_rates(result, role):
+    if role == 'batting':
+        result['strike_rate'] = (result['runs'] / result['balls'] * 100).where(result['balls'] > 0)
+        result['average'] = (result['runs'] / result['dismissals']).where(result['dismissals'] > 0)
+    else:
+        result['economy'] = (result['runs_conceded'] / result['legal_balls'] * 6).where(result['legal_balls'] > 0)
+        result['average'] = (result['runs_conceded'] / result['wickets']).where(result['wickets'] > 0)
+    return result
+
+
+def _delivery_cube(ipl, role, player, overs):
+    """Cube of just the deliveries in ``overs`` (and of ``player``, via the PlayerIndex, if given)."""
+    if player is not None:
+        index = get_player_index(ipl)
+        roles = ['batter', 'dismissed'] if role == 'batting' else ['bowler']
+        rows = ipl.iloc[np.unique(np.concatenate([index.positions(player, name) for name in roles]))]
+    else:
+        rows = ipl
+    rows = rows[rows['overs'].between(*overs)]
+    return (build_batting_cube if role == 'batting' else build_bowling_cube)(rows)
+
+
+def query(ipl, role, by=(), player=None, seasons=None, team=None, opponent=None, venue=None,
+          phase=None, overs=None, stage=None, match_ids=None):
+    """
+    Batting or bowling measures for any combination of filters.
+
+    Every filter is optional (None means "all"). Queries are answered from the
+    stats cube; an over range that is not a whole phase is answered from the
+    matching deliveries only (a player's rows come from the PlayerIndex). For a
+    player's totals over an over range, ``over_range_totals`` is constant-time.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+        role (str): "batting" or "bowling".
+        by (list): Cube dimensions to group by (e.g. ['player']); empty for one row of totals.
+        player (str): Batter / bowler name.
+        seasons (int or list): Season(s) to include.
+        team (str): The player's team. opponent (str): The opposing team.
+        venue (str): Exact venue name.
+        phase (str): A PHASE_OVERS name ("Powerplay", "Middle", "Death"), any case.
+        overs (tuple): Inclusive (first, last) range of 0-indexed overs.
+        stage (str): "league" or "playoff".
+        match_ids (list): Restrict to these match IDs.
+
+    Returns:
+        pd.DataFrame: The ``by`` columns, integer MEASURES[role] and float RATES[role].
+    """
+    if role not in ROLES:
+        raise ValueError(f"Unknown role '{role}'. Choose from {ROLES}.")
+    if stage is not None and stage not in STAGES:
+        raise ValueError(f"Unknown stage '{stage}'. Choose from {STAGES}.")
+
+    if phase is not None:
+        names = {name.lower(): name for name in PHASE_OVERS}
+        if phase.lower() not in names:
+            raise ValueError(f"Unknown phase '{phase}'. Choose from {list(PHASE_OVERS)}.")
+        phase = names[phase.lower()]
+    if overs is not None and phase is None and _phase_for_overs(overs) is not None:
+        phase, overs = _phase_for_overs(overs), None
+
+    if stage is not None:
+        matches = get_match_table(ipl)
+        playoff = matches['is_playoff'] if stage == 'playoff' else ~matches['is_playoff']
+        stage_ids = matches.loc[playoff, 'ID']
+        match_ids = stage_ids if match_ids is None else np.intersect1d(stage_ids, _as_list(match_ids))
+
+    where = {
+        'player': player, 'Season': _as_list(seasons), 'team': team, 'opponent': opponent,
+        'Venue': venue, 'phase': phase, 'ID': _as_list(match_ids),
+    }
+
+    if overs is None:
+        cube = get_cube(ipl, role)
+    else:
+        logger.info(f"Over range {overs} is not a phase; querying deliveries directly.")
+        cube = _delivery_cube(ipl, role, player, overs)
+
+    result = aggregate_cube(cube, role, by, where)
+    result[MEASURES[role]] = result[MEASURES[role]].astype(np.int64)
+    return _add_rates(result, role)
+
+
+def totals(ipl, role, **filters):
+    """
+    Totals of ``query(ipl, role, **filters)`` as a dict of Python numbers.
+
+    Measures are ints; rates are floats, or None when undefined.
+    """
+    return _as_dict(query(ipl, role, **filters).iloc[0], role, MEASURES[role])
+
+
+def _as_dict(row, role, measures):
+    result = {measure: int(row[measure]) for measure in measures}
+    result.update({rate: None if pd.isna(row[rate]) else float(row[rate]) for rate in RATES[role]})
+    return result
+
+
+def over_range_totals(ipl, role, player, overs, seasons=None):
+    """
+    A player's ``role`` measures and rates over any contiguous range of overs.
+
+    Answered in constant time from the per-over prefix sums (see OverPrefixSums),
+    so e.g. overs 12-16 cost the same as a whole phase. ``matches`` is not
+    available this way; use ``totals(..., overs=...)`` when it is needed.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data.
+        role (str): "batting" or "bowling".
+        player (str): Batter / bowler name.
+        overs (tuple): Inclusive (first, last) range of 0-indexed overs.
+        seasons (int or list): Season(s) to include; None for all.
+
+    Returns:
+        dict: PREFIX_MEASURES[role] as ints and RATES[role] as floats (None when undefined).
+    """
+    if role not in ROLES:
+        raise ValueError(f"Unknown role '{role}'. Choose from {ROLES}.")
+    measures = get_over_prefix_sums(ipl).totals(role, player, overs, _as_list(seasons))
+    row = _add_rates(pd.DataFrame([measures]), role).iloc[0]
+    return _as_dict(row, role, PREFIX_MEASURES[role])
+
+
+def top(ipl, role, measure, n=10, **filters):
+    """
+    The ``n`` players with the highest ``measure``, as a (player, measure) frame.
+
+    Season-only queries for runs, wickets, fours and sixes are served from the
+    precomputed leaderboards; everything else is a cube roll-up.
+    """
+    seasons = _as_list(filters.get('seasons'))
+    only_season = all(value is None for key, value in filters.items() if key != 'seasons')
+    if measure in ('runs', 'wickets', 'fours', 'sixes') and only_season and (seasons is None or len(seasons) == 1) and n <= TOP_N:
+        ranked = get_leaderboard_store(ipl).board(measure, seasons[0] if seasons else None)
+        return ranked.rename(columns={BOARDS[measure][0]: 'player'})[['player', measure]].head(n)
+
+    result = query(ipl, role, by=['player'], **filters)
+    return result.sort_values([measure, 'player'], ascending=[False, True]).head(n)[['player', measure]].reset_index(drop=True)
@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_MAXSIZE = 512
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of tool results.
+
+    Keys are tuples of already-normalised arguments. Every lookup carries the
+    data version (e.g. the snapshot fingerprint) of the frame the result is
+    computed from, either passed in or returned by the ``version`` callable;
+    when it changes, every cached result is dropped first.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, version=None):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._version = version
+        self._current_version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _check_version(self, version):
+        if version != self._current_version:
+            if self._entries:
+                logger.info(f"Data version changed ({self._current_version} -> {version}); clearing {len(self._entries)} cached results.")
+            self._entries.clear()
+            self._current_version = version
+
+    def get_or_compute(self, key, compute, version=None):
+        """
+        Return the cached result for ``key``, or ``compute()`` it and cache it.
+
+        A computed result is only stored if the cache is still at ``version`` when
+        ``compute()`` returns, so a result built from older data never outlives a
+        newer version seen meanwhile.
+
+        Args:
+            key (tuple): Hashable, normalised arguments (including the tool name).
+            compute (callable): Zero-argument function producing the result.
+            version: Data version ``compute`` works on; defaults to calling the
+                ``version`` callable given to the constructor.
+        """
+        with self._lock:
+            if version is None and self._version is not None:
+                version = self._version()
+            self._check_version(version)
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        result = compute()
+
+        with self._lock:
+            if version != self._current_version:
+                return result
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Hit/miss counters and current size, as a dict."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                    'maxsize': self.maxsize, 'version': self._current_version}
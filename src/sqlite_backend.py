@@ -0,0 +1,208 @@
+import os
+import sqlite3
+import pandas as pd
+from src.data_loader import (
+    DATA_DIR, FINAL_IPL_CSV, BALL_CSV, MATCH_CSV,
+    compact_ipl_frame, load_ipl_data, source_fingerprint,
+)
+from src.fact_tables import get_match_table
+from src.result_cache import ResultCache
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SQLITE_PATH = os.path.join(DATA_DIR, "ipl.sqlite")
+SOURCE_PATHS = {"final": [FINAL_IPL_CSV], "split": [BALL_CSV, MATCH_CSV]}
+# Bump when the tables or indexes change so stores built by older code are rebuilt.
+STORE_VERSION = 3
+# Compacted frames kept per store, one per fetched scope
+FRAME_CACHE_SIZE = 16
+
+# Index name -> indexed columns. The player indexes carry the columns the usual
+# per-player aggregates read, so those queries never touch the table itself.
+INDEXES = {
+    "idx_deliveries_batter": ["batter", "Season", "BowlingTeam", "batsman_run", "extra_type"],
+    "idx_deliveries_bowler": ["bowler", "Season", "BattingTeam", "total_run", "extras_run", "extra_type", "isWicketDelivery"],
+    "idx_deliveries_non_striker": ["non-striker"],
+    "idx_deliveries_player_out": ["player_out"],
+    "idx_deliveries_season": ["Season"],
+    "idx_deliveries_venue": ["Venue"],
+    # One per team column, so "Team1 IN (...) OR Team2 IN (...)" can use both
+    "idx_deliveries_team1": ["Team1"],
+    "idx_deliveries_team2": ["Team2"],
+    "idx_deliveries_innings": ["ID", "innings"],
+}
+# Columns looked up case-insensitively; they are indexed with the same collation
+# (SQLite only uses an index whose collation matches the comparison)
+NOCASE_COLUMNS = ["Venue"]
+# Columns a player can appear in; a player's scope is every row naming them
+PLAYER_ROLE_COLUMNS = ["batter", "non-striker", "bowler", "player_out"]
+
+
+def _quoted(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _indexed(column):
+    return _quoted(column) + (" COLLATE NOCASE" if column in NOCASE_COLUMNS else "")
+
+
+def _store_fingerprint(source):
+    """Fingerprint of the source files and the store layout a store of ``source`` is built from."""
+    return f"{source_fingerprint(SOURCE_PATHS[source])}-v{STORE_VERSION}"
+
+
+def _as_text(df):
+    """Categoricals as plain object columns (missing values as None) for ``to_sql``."""
+    df = df.copy()
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+    return df
+
+
+def build_sqlite_store(path=SQLITE_PATH, source="final"):
+    """
+    Write the ball-by-ball and match tables of ``load_ipl_data(source)`` to SQLite.
+
+    The database is written to a temporary file and moved into place, so readers
+    never see a half-built store. Deliveries keep their file order as the rowid.
+
+    Args:
+        path (str): Database file to (re)create.
+        source (str): Data source passed to load_ipl_data.
+
+    Returns:
+        str: The database path.
+    """
+    ipl = load_ipl_data(source)
+    if ipl.empty:
+        raise RuntimeError(f"No IPL data loaded for source '{source}'; SQLite store not built.")
+
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    with sqlite3.connect(tmp_path) as conn:
+        _as_text(ipl).to_sql("deliveries", conn, index=False, chunksize=50_000)
+        _as_text(get_match_table(ipl)).to_sql("matches", conn, index=False)
+        for name, columns in INDEXES.items():
+            conn.execute(f"CREATE INDEX {name} ON deliveries ({', '.join(map(_indexed, columns))})")
+        conn.execute("CREATE UNIQUE INDEX idx_matches_id ON matches (ID)")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO meta VALUES ('source', ?), ('fingerprint', ?)",
+                     (source, _store_fingerprint(source)))
+        conn.execute("ANALYZE")
+    conn.close()
+
+    os.replace(tmp_path, path)
+    logger.info(f"Wrote SQLite store with {len(ipl)} deliveries to {path}.")
+    return path
+
+
+class SQLiteIPLStore:
+    """
+    Read-only view of the IPL data kept in a SQLite file.
+
+    Rows are fetched through the indexes and returned as compacted frames with
+    the columns of ``load_ipl_data``, so any tool taking the IPL frame can run on
+    just the slice of deliveries it needs (see ``as_ipl_frame``). The frame of
+    each scope is kept and returned again, so tables derived from it are built
+    once; treat it as read-only.
+    """
+
+    def __init__(self, path=SQLITE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._frames = ResultCache(maxsize=FRAME_CACHE_SIZE)
+
+    def query(self, sql, params=()):
+        """Run an ad-hoc SELECT and return the result as a DataFrame."""
+        return pd.read_sql_query(sql, self._conn, params=params)
+
+    def fingerprint(self):
+        """Fingerprint of the source files and store layout the store was built from."""
+        return self._conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    def deliveries(self, players=None, teams=None, venue=None, seasons=None, whole_matches=False):
+        """
+        Deliveries in the given scope, in file order.
+
+        Args:
+            players (list or None): Rows naming any of these players (any role)...
+            teams (list or None): ...or from matches any of these teams played in.
+            venue (str or None): Only matches at this venue (case-insensitive).
+            seasons (list or None): Only these seasons.
+            whole_matches (bool): Every delivery of the matches a player in ``players``
+                appears in, not just the rows naming them (for tables that need the
+                whole innings, such as partnerships and the wickets before them).
+
+        Returns:
+            pd.DataFrame: Compacted ball-by-ball rows (all rows when no scope is given).
+        """
+        key = (
+            tuple(sorted(set(players or []))), tuple(sorted(set(teams or []))),
+            venue.strip() if venue else None, tuple(sorted({int(season) for season in seasons or []})),
+            bool(whole_matches and players),
+        )
+        return self._frames.get_or_compute(key, lambda: self._fetch(*key))
+
+    def _fetch(self, players, teams, venue, seasons, whole_matches):
+        involving, conditions, params = [], [], []
+        if players:
+            marks = ", ".join("?" * len(players))
+            involving += [f"{_quoted(col)} IN ({marks})" for col in PLAYER_ROLE_COLUMNS]
+            params += list(players) * len(PLAYER_ROLE_COLUMNS)
+        if teams:
+            marks = ", ".join("?" * len(teams))
+            involving += [f"Team1 IN ({marks})", f"Team2 IN ({marks})"]
+            params += list(teams) * 2
+        if involving:
+            involving = " OR ".join(involving)
+            conditions.append(f"ID IN (SELECT ID FROM deliveries WHERE {involving})" if whole_matches else f"({involving})")
+        if venue:
+            conditions.append("Venue = ? COLLATE NOCASE")
+            params.append(venue)
+        if seasons:
+            conditions.append(f"Season IN ({', '.join('?' * len(seasons))})")
+            params += list(seasons)
+
+        sql = "SELECT * FROM deliveries"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        rows = self.query(sql + " ORDER BY rowid", params)
+        logger.info(f"Fetched {len(rows)} deliveries from {self.path}.")
+        return compact_ipl_frame(rows)[0]
+
+
+def open_sqlite_store(path=SQLITE_PATH, source="final"):
+    """
+    Return a SQLiteIPLStore for ``path``, (re)building it if missing or built from older data.
+    """
+    fingerprint = _store_fingerprint(source)
+    if os.path.exists(path):
+        store = SQLiteIPLStore(path)
+        try:
+            if store.fingerprint() == fingerprint:
+                return store
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read SQLite store {path}, rebuilding: {e}")
+        store.close()
+        logger.info(f"SQLite store {path} is stale; rebuilding.")
+    build_sqlite_store(path, source)
+    return SQLiteIPLStore(path)
+
+
+def as_ipl_frame(ipl, **scope):
+    """
+    The IPL frame a tool should work on.
+
+    DataFrames are returned unchanged; for a SQLiteIPLStore only the deliveries
+    in ``scope`` (see ``SQLiteIPLStore.deliveries``) are loaded.
+    """
+    if isinstance(ipl, SQLiteIPLStore):
+        return ipl.deliveries(**scope)
+    return ipl
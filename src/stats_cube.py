@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+from src.data_loader import derived_from_frame
+from src.fact_tables import PHASES, get_delivery_flags, get_match_table
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Finest grain of the cube: one row per player, innings and phase.
+# Season, Venue, team and opponent are attributes of (ID, innings) carried on every row.
+# Rows are stored phase-major, so the cells of each phase are one contiguous slice.
+CUBE_DIMENSIONS = ['player', 'ID', 'innings', 'phase', 'Season', 'Venue', 'team', 'opponent']
+
+# Additive measures per role
+BATTING_MEASURES = ['runs', 'balls', 'fours', 'sixes', 'dots', 'dismissals']
+BOWLING_MEASURES = ['deliveries', 'legal_balls', 'runs_conceded', 'wickets', 'dots']
+ROLES = ('batting', 'bowling')
+
+
+def _cube(ipl, players, team_column, opponent_column, measures):
+    """Sum per-delivery ``measures`` to the cube grain for the given player column(s)."""
+    phase = pd.Categorical.from_codes(get_delivery_flags(ipl)['phase'].to_numpy(), PHASES)
+    parts = [
+        pd.DataFrame({'player': player, 'ID': ipl['ID'], 'innings': ipl['innings'], 'phase': phase, **columns})
+        for player, columns in players
+    ]
+    # dropna=False keeps deliveries outside every phase in the totals
+    cube = (
+        pd.concat(parts, ignore_index=True)
+        .dropna(subset=['player'])
+        .groupby(['player', 'ID', 'innings', 'phase'], observed=True, dropna=False)[measures]
+        .sum()
+        .astype(np.int32)
+        .reset_index()
+    )
+
+    sides = ipl.groupby(['ID', 'innings'], observed=True)[[team_column, opponent_column]].first()
+    sides.columns = ['team', 'opponent']
+    cube = cube.join(sides, on=['ID', 'innings'])
+    cube = cube.join(get_match_table(ipl).set_index('ID')[['Season', 'Venue']], on='ID')
+
+    cube['player'] = cube['player'].astype(str)
+    cube = cube.iloc[np.argsort(cube['phase'].cat.codes.to_numpy(), kind='stable')].reset_index(drop=True)
+    return cube[CUBE_DIMENSIONS + measures]
+
+
+def delivery_measures(ipl, role):
+    """
+    Per-delivery ``role`` measures as (player column, {measure: values}) parts.
+
+    Summing every part per player gives that player's measures; the cube and the
+    over prefix sums are both built from these. Batting dismissals are credited
+    to the batter who was out, striker or not.
+    """
+    flags = get_delivery_flags(ipl)
+    if role == 'batting':
+        zeros = np.zeros(len(ipl), dtype=np.int32)
+        faced = {
+            'runs': ipl['batsman_run'].astype(np.int32), 'balls': flags['ball_faced'],
+            'fours': flags['four'], 'sixes': flags['six'],
+            'dots': flags['ball_faced'] & (ipl['batsman_run'] == 0), 'dismissals': zeros,
+        }
+        out = {measure: zeros for measure in BATTING_MEASURES}
+        out['dismissals'] = ipl['player_out'].notna()
+        return [(ipl['batter'], faced), (ipl['player_out'], out)]
+
+    bowled = {
+        'deliveries': np.ones(len(ipl), dtype=np.int32), 'legal_balls': flags['legal_ball'],
+        'runs_conceded': flags['runs_conceded'], 'wickets': flags['bowler_wicket'], 'dots': flags['dot_ball'],
+    }
+    return [(ipl['bowler'], bowled)]
+
+
+def build_batting_cube(ipl):
+    """
+    Batting measures (runs, balls faced, 4s, 6s, dots, dismissals) at the cube grain.
+    """
+    cube = _cube(ipl, delivery_measures(ipl, 'batting'), 'BattingTeam', 'BowlingTeam', BATTING_MEASURES)
+    logger.info(f"Batting cube built with {len(cube)} cells.")
+    return cube
+
+
+def build_bowling_cube(ipl):
+    """
+    Bowling measures (deliveries, legal balls, runs conceded, wickets, dots) at the cube grain.
+    """
+    cube = _cube(ipl, delivery_measures(ipl, 'bowling'), 'BowlingTeam', 'BattingTeam', BOWLING_MEASURES)
+    logger.info(f"Bowling cube built with {len(cube)} cells.")
+    return cube
+
+
+def get_cube(ipl, role):
+    """Return the ``role`` ("batting" or "bowling") cube for ``ipl`` (snapshotted with the loaded data)."""
+    if role not in ROLES:
+        raise ValueError(f"Unknown cube role '{role}'. Choose from {ROLES}.")
+    builder = build_batting_cube if role == 'batting' else build_bowling_cube
+    return derived_from_frame(ipl, f"{role}_cube", builder, persist=True)
+
+
+def rollup(ipl, role, by=(), where=None):
+    """
+    Roll the cube up to the dimensions in ``by``.
+
+    Args:
+        ipl (pd.DataFrame): Ball-by-ball IPL data the cube is built from.
+        role (str): "batting" or "bowling".
+        by (list): Dimensions to keep (any of CUBE_DIMENSIONS); empty for grand totals.
+        where (dict or None): Dimension -> value (or list of values) to filter on
+            first. None values are ignored, so optional filters can be passed as is.
+
+    Returns:
+        pd.DataFrame: The summed measures per group, plus ``matches`` (distinct match IDs).
+    """
+    return aggregate_cube(get_cube(ipl, role), role, by, where)
+
+
+def _values(value):
+    return list(value) if isinstance(value, (list, tuple, set, pd.Series, np.ndarray)) else [value]
+
+
+def phase_cells(cube, phases):
+    """Rows of a (phase-major) cube in ``phases``, read as one contiguous slice per phase."""
+    codes = cube['phase'].cat.codes.to_numpy()
+    slices = [
+        cube.iloc[np.searchsorted(codes, code, 'left'):np.searchsorted(codes, code, 'right')]
+        for code in sorted({PHASES.index(phase) for phase in phases if phase in PHASES})
+    ]
+    return pd.concat(slices) if len(slices) > 1 else slices[0] if slices else cube.iloc[:0]
+
+
+def aggregate_cube(cube, role, by=(), where=None):
+    """Filter and sum an already built ``role`` cube; see ``rollup`` for the arguments."""
+    measures = BATTING_MEASURES if role == 'batting' else BOWLING_MEASURES
+
+    if where:
+        where = dict(where)
+        if where.get('phase') is not None:
+            cube = phase_cells(cube, _values(where.pop('phase')))
+        mask = np.ones(len(cube), dtype=bool)
+        for column, value in where.items():
+            if value is None:
+                continue
+            mask &= cube[column].isin(_values(value)).to_numpy()
+        cube = cube[mask]
+
+    by = list(by)
+    if not by:
+        totals = cube[measures].sum().to_frame().T
+        totals['matches'] = cube['ID'].nunique()
+        return totals
+
+    grouped = cube.groupby(by, observed=True)
+    result = grouped[measures].sum()
+    result['matches'] = grouped['ID'].nunique()
+    return result.reset_index()
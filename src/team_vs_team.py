@@ -5,6 +5,7 @@ import seaborn as sns
 import altair as alt
 import os
 from PIL import Image
+from src.fact_tables import head_to_head_matches, deliveries_for_matches
 from core.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -25,17 +26,16 @@ def team_vs_team_analysis(ipl, team1, team2):
             if os.path.exists(logo2_path):
                 col2.image(Image.open(logo2_path), caption=team2, width=150)
 
-        # Filter matches between the teams
-        df = ipl[((ipl['Team1'] == team1) & (ipl['Team2'] == team2)) |
-                 ((ipl['Team1'] == team2) & (ipl['Team2'] == team1))]
+        # Matches between the teams (one row per match), then their deliveries
+        matches = head_to_head_matches(ipl, team1, team2)
+        df = deliveries_for_matches(ipl, matches['ID'])
 
-        total_matches = df['ID'].nunique()
+        total_matches = len(matches)
         st.subheader(f"📅 Total Matches Played: {total_matches}")
 
         # Wins
-        win_df = df[['ID', 'WinningTeam']].drop_duplicates()
-        team1_wins = win_df[win_df['WinningTeam'] == team1].shape[0]
-        team2_wins = win_df[win_df['WinningTeam'] == team2].shape[0]
+        team1_wins = (matches['WinningTeam'] == team1).sum()
+        team2_wins = (matches['WinningTeam'] == team2).sum()
 
         col1, col2 = st.columns(2)
         col1.metric(f"{team1} Wins", team1_wins)
@@ -50,19 +50,19 @@ def team_vs_team_analysis(ipl, team1, team2):
 
         # Total Runs
         st.subheader("🏏 Total Runs Scored")
-        run_summary = df.groupby('BattingTeam')['total_run'].sum().reset_index()
+        run_summary = df.groupby('BattingTeam', observed=True)['total_run'].sum().reset_index()
         st.bar_chart(run_summary.set_index('BattingTeam'))
 
         # Top Batsmen
         top_batsmen = df[df['BattingTeam'].isin([team1, team2])] \
-            .groupby('batter')['batsman_run'].sum() \
+            .groupby('batter', observed=True)['batsman_run'].sum() \
             .sort_values(ascending=False).head(5).reset_index()
         st.subheader("🔥 Top Batsmen")
         st.dataframe(top_batsmen)
 
         # Top Bowlers
         top_bowlers = df[df['isWicketDelivery'] == 1] \
-            .groupby('bowler')['player_out'].count() \
+            .groupby('bowler', observed=True)['player_out'].count() \
             .sort_values(ascending=False).head(5).reset_index()
         st.subheader("🎯 Top Bowlers")
         st.dataframe(top_bowlers)
@@ -70,7 +70,7 @@ def team_vs_team_analysis(ipl, team1, team2):
         # Yearly Runs Trend
         if 'Season' in df.columns:
             st.subheader("📊 Yearly Runs Trend")
-            trend = df.groupby(['Season', 'BattingTeam'])['total_run'].sum().reset_index()
+            trend = df.groupby(['Season', 'BattingTeam'], observed=True)['total_run'].sum().reset_index()
             chart = alt.Chart(trend).mark_line(point=True).encode(
                 x='Season:O',
                 y='total_run:Q',
@@ -81,7 +81,7 @@ def team_vs_team_analysis(ipl, team1, team2):
 
         # Strike Rate
         st.subheader("⚔️ Top Rivalry Batsman Strike Rates (min 30 balls)")
-        strike_df = df.groupby('batter').agg(
+        strike_df = df.groupby('batter', observed=True).agg(
             runs=('batsman_run', 'sum'),
             balls=('ballnumber', 'count')
         ).reset_index()
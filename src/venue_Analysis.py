@@ -1,6 +1,7 @@
 import os
 import pandas as pd
 import streamlit as st
+from src.fact_tables import get_match_table
 from core.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -9,11 +10,14 @@ def venue_analysis_page(ipl):
     try:
         st.header("📍 Venue Analysis", divider='rainbow')
 
+        all_matches = get_match_table(ipl)
+
         selected_venue = st.session_state.get("selected_venue")
         if not selected_venue:
-            venues = sorted(ipl['Venue'].dropna().unique())
+            venues = sorted(all_matches['Venue'].dropna().unique())
             selected_venue = st.selectbox("Select Venue", venues)
 
+        matches = all_matches[all_matches['Venue'] == selected_venue]
         df = ipl[ipl['Venue'] == selected_venue]
 
         if df.empty:
@@ -31,7 +35,7 @@ def venue_analysis_page(ipl):
 
         # Basic Stats
         st.subheader(f"🏟️ Stats for {selected_venue}")
-        total_matches = df['ID'].nunique()
+        total_matches = len(matches)
         total_runs = df['total_run'].sum()
 
         col1, col2 = st.columns(2)
@@ -46,11 +50,10 @@ def venue_analysis_page(ipl):
         st.subheader("🎯 Matches Played by Teams at this Venue")
         try:
             team_matches_df = pd.concat([
-                df[['ID', 'Team1']].rename(columns={'Team1': 'Team'}),
-                df[['ID', 'Team2']].rename(columns={'Team2': 'Team'})
+                matches[['ID', 'Team1']].rename(columns={'Team1': 'Team'}),
+                matches[['ID', 'Team2']].rename(columns={'Team2': 'Team'})
             ])
-            team_matches_df = team_matches_df.drop_duplicates()
-            team_match_counts = team_matches_df.groupby('Team')['ID'].nunique().reset_index()
+            team_match_counts = team_matches_df.groupby('Team', observed=True)['ID'].nunique().reset_index()
             team_match_counts.columns = ['Team', 'Matches Played']
             team_match_counts = team_match_counts.sort_values(by='Matches Played', ascending=False)
             st.dataframe(team_match_counts, use_container_width=True)
@@ -71,7 +74,7 @@ def venue_analysis_page(ipl):
         st.subheader("🧢 Top Run Scorers")
         try:
             run_col = 'batsman_run' if 'batsman_run' in df.columns else 'total_run'
-            top_scorers = df.groupby('batter')[run_col].sum().sort_values(ascending=False).head(5).reset_index()
+            top_scorers = df.groupby('batter', observed=True)[run_col].sum().sort_values(ascending=False).head(5).reset_index()
             top_scorers.columns = ['Batter', 'Runs']
             st.dataframe(top_scorers, use_container_width=True)
         except Exception as e:
@@ -82,7 +85,7 @@ def venue_analysis_page(ipl):
         st.subheader("🎯 Top Wicket Takers")
         try:
             if {'isWicketDelivery', 'bowler', 'player_out'}.issubset(df.columns):
-                top_wickets = df[df['isWicketDelivery'] == 1].groupby('bowler')['player_out'].count() \
+                top_wickets = df[df['isWicketDelivery'] == 1].groupby('bowler', observed=True)['player_out'].count() \
                     .sort_values(ascending=False).head(5).reset_index()
                 top_wickets.columns = ['Bowler', 'Wickets']
                 st.dataframe(top_wickets, use_container_width=True)
@@ -96,7 +99,7 @@ def venue_analysis_page(ipl):
         st.subheader("🔥 Top Boundary Hitters")
         try:
             boundary_df = df[df['batsman_run'].isin([4, 6])]
-            boundary_counts = boundary_df.groupby(['batter', 'batsman_run']).size().unstack(fill_value=0)
+            boundary_counts = boundary_df.groupby(['batter', 'batsman_run'], observed=True).size().unstack(fill_value=0)
             boundary_counts['Total Boundaries'] = boundary_counts.get(4, 0) + boundary_counts.get(6, 0)
             top_boundary_hitters = boundary_counts.sort_values(by='Total Boundaries', ascending=False).head(5)
 
@@ -0,0 +1,403 @@
+"""
+Knowledge-base generators as they were before they were vectorised, kept
+verbatim so the tests can check the grouped versions produce the same tables.
+"""
+import pandas as pd
+from src.fact_tables import get_batting_innings, get_bowling_spells
+
+
+def venue_stats_per_season(df):
+    venue_stats = []
+
+    # Group by season + venue
+    for (season, venue), temp in df.groupby(["Season", "Venue"], observed=True):
+        total_matches = temp["ID"].nunique()
+
+        # first/second innings subsets for averages
+        first_innings = temp[temp["innings"] == 1]
+        second_innings = temp[temp["innings"] == 2]
+
+        # Initialize counters
+        bat1st_wins = 0
+        chasing_wins = 0
+        no_result = 0
+
+        # iterate per match to determine batting order and winner
+        for match_id, mdf in temp.groupby("ID"):
+            # get unique batting teams in order of appearance
+            teams = mdf["BattingTeam"].dropna().unique().tolist()
+
+            # if only one team present (abandoned / incomplete innings), treat as no result
+            if len(teams) < 2:
+                no_result += 1
+                continue
+
+            team1 = teams[0]   # batted first
+            team2 = teams[1]   # batted second (chasing)
+
+            # find winning team for this match (if present)
+            winners = mdf["WinningTeam"].dropna().unique().tolist()
+            if not winners:
+                # no winning team recorded -> no result / abandoned
+                no_result += 1
+                continue
+
+            winning_team = winners[0]
+
+            # categorize
+            if winning_team == team1:
+                bat1st_wins += 1
+            elif winning_team == team2:
+                chasing_wins += 1
+            else:
+                # a corner case: WinningTeam not equal to either batting team (data issue)
+                no_result += 1
+
+        bat1st_win_pct = round((bat1st_wins / total_matches) * 100, 2) if total_matches else 0.0
+        chasing_win_pct = round((chasing_wins / total_matches) * 100, 2) if total_matches else 0.0
+
+        # averages
+        avg_1st_innings_score = first_innings.groupby("ID")["total_run"].sum().mean()
+        avg_2nd_innings_score = second_innings.groupby("ID")["total_run"].sum().mean()
+
+        total_scores = temp.groupby("ID")["total_run"].sum()
+        highest_total = int(total_scores.max()) if not total_scores.empty else 0
+        lowest_total = int(total_scores.min()) if not total_scores.empty else 0
+
+        total_fours = int((temp["batsman_run"] == 4).sum())
+        total_sixes = int((temp["batsman_run"] == 6).sum())
+        total_runs = int(temp["total_run"].sum())
+
+        # Player milestones (fifties/hundreds) per match at this venue & season
+        player_scores = temp.groupby(["ID", "batter"], observed=True)["batsman_run"].sum()
+        total_hundreds = int((player_scores >= 100).sum())
+        total_fifties = int(((player_scores >= 50) & (player_scores < 100)).sum())
+
+        # Top 5 batsmen (runs at this venue+season)
+        top_batsmen = (
+            temp.groupby("batter", observed=True)["batsman_run"]
+            .sum()
+            .sort_values(ascending=False)
+            .head(5)
+            .reset_index()
+        )
+
+        # Top 5 bowlers (wickets)
+        top_bowlers = (
+            temp[temp["isWicketDelivery"] == 1]
+            .groupby("bowler", observed=True)
+            .size()
+            .sort_values(ascending=False)
+            .head(5)
+            .reset_index(name="wickets")
+        )
+
+        venue_stats.append({
+            "Season": season,
+            "Venue": venue,
+            "total_matches": int(total_matches),
+            "bat1st_wins": bat1st_wins,
+            "chasing_wins": chasing_wins,
+            "no_result": no_result,
+            "bat1st_win_pct": bat1st_win_pct,
+            "chasing_win_pct": chasing_win_pct,
+            "avg_1st_innings_score": round(avg_1st_innings_score, 2) if not pd.isna(avg_1st_innings_score) else 0,
+            "avg_2nd_innings_score": round(avg_2nd_innings_score, 2) if not pd.isna(avg_2nd_innings_score) else 0,
+            "highest_total": highest_total,
+            "lowest_total": lowest_total,
+            "total_fours": total_fours,
+            "total_sixes": total_sixes,
+            "total_runs": total_runs,
+            "total_hundreds": total_hundreds,
+            "total_fifties": total_fifties,
+            "top_5_batsmen": top_batsmen.to_dict("records"),
+            "top_5_bowlers": top_bowlers.to_dict("records")
+        })
+
+    return pd.DataFrame(venue_stats)
+
+
+def player_stats(df):
+    df = df.dropna(subset=["batter", "bowler"])
+
+    player_stats = {}
+
+    batters = df.groupby("batter", observed=True)
+    bowlers = df.groupby("bowler", observed=True)
+
+    all_players = set(df["batter"].unique()).union(set(df["bowler"].unique()))
+
+    for player in all_players:
+        # Batting stats
+        if player in batters.groups:
+            bdf = batters.get_group(player)
+            total_runs = bdf["batsman_run"].sum()
+            balls_faced = bdf["ballnumber"].count()
+            fours = (bdf["batsman_run"] == 4).sum()
+            sixes = (bdf["batsman_run"] == 6).sum()
+            matches = bdf["ID"].nunique()
+            innings = bdf["ID"].nunique()
+
+            player_match_runs = bdf.groupby("ID")["batsman_run"].sum()
+            fifties = player_match_runs[(player_match_runs >= 50) & (player_match_runs < 100)].count()
+            hundreds = player_match_runs[player_match_runs >= 100].count()
+
+            dismissals = df[(df["player_out"] == player)].shape[0]
+            strike_rate = (total_runs / balls_faced) * 100 if balls_faced else 0
+            batting_avg = (total_runs / dismissals) if dismissals else None
+        else:
+            total_runs = balls_faced = fours = sixes = matches = innings = strike_rate = batting_avg = dismissals = fifties = hundreds = 0
+
+       
+        player_stats[player] = {
+            "Matches": matches,
+            "Innings": innings,
+            "Runs": total_runs,
+            "BallsFaced": balls_faced,
+            "Fours": fours,
+            "Sixes": sixes,
+            "Dismissals": dismissals,
+            "50s": fifties,
+            "100s": hundreds,
+            "StrikeRate": round(strike_rate, 2) if strike_rate else 0,
+            "BattingAverage": round(batting_avg, 2) if batting_avg else None,
+        }
+
+    return pd.DataFrame.from_dict(player_stats, orient='index').reset_index().rename(columns={"index": "Player"})
+
+
+def playoff_stats(df):
+    playoff_matches = df[df["MatchNumber"].str.contains("Qualifier|Eliminator|Final", case=False, na=False)]
+    records = []
+
+    for player in playoff_matches["batter"].unique():
+        player_df = playoff_matches[playoff_matches["batter"] == player]
+        runs = player_df["batsman_run"].sum()
+        balls = player_df.shape[0]
+        strike_rate = (runs / balls) * 100 if balls else 0
+
+        # Bowling side for same player
+        bowling_df = playoff_matches[playoff_matches["bowler"] == player]
+        wickets = bowling_df[bowling_df["isWicketDelivery"] == 1]["player_out"].notnull().sum()
+        runs_conceded = bowling_df["total_run"].sum()
+        overs_bowled = bowling_df.shape[0] / 6
+        economy = runs_conceded / overs_bowled if overs_bowled else 0
+
+        records.append({
+            "player": player,
+            "total_runs": runs,
+            "balls_faced": balls,
+            "strike_rate": round(strike_rate, 2),
+            "wickets": wickets,
+            "runs_conceded": runs_conceded,
+            "economy": round(economy, 2) if overs_bowled else None
+        })
+
+    return pd.DataFrame(records)
+
+
+def team_vs_team(df):
+    # Work on a copy; the shared frame is read-only
+    df = df.copy()
+
+    # Ensure numeric types
+    df['batsman_run'] = pd.to_numeric(df['batsman_run'], errors='coerce').fillna(0)
+    df['total_run'] = pd.to_numeric(df['total_run'], errors='coerce').fillna(0)
+    df['isWicketDelivery'] = df['isWicketDelivery'].astype(int)
+
+    # Clean text columns
+    for col in ['Team1', 'Team2', 'WinningTeam', 'BattingTeam', 'batter', 'bowler']:
+        df[col] = df[col].astype(str).str.strip()
+
+    # Extra columns
+    df['four'] = (df['batsman_run'] == 4).astype(int)
+    df['six'] = (df['batsman_run'] == 6).astype(int)
+    df['dot_ball'] = (df['total_run'] == 0).astype(int)
+
+    wicket_types = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
+    df['isBowlerWicket'] = df['player_out'].notnull() & df['kind'].isin(wicket_types)
+
+    # Create team pair
+    df['team_pair'] = df.apply(lambda x: '_vs_'.join(sorted([x['Team1'], x['Team2']])), axis=1)
+
+    team_stats = []
+
+    for (season, team_pair), group in df.groupby(['Season', 'team_pair']):
+        team1, team2 = team_pair.split('_vs_')
+        matches = group['ID'].nunique()
+
+        team1_wins = group[group['WinningTeam'] == team1]['ID'].nunique()
+        team2_wins = group[group['WinningTeam'] == team2]['ID'].nunique()
+        no_result = matches - (team1_wins + team2_wins)
+
+        team1_win_pct = round((team1_wins / matches) * 100, 2) if matches else 0
+        team2_win_pct = round((team2_wins / matches) * 100, 2) if matches else 0
+
+        # Batting records
+        match_scores = group.groupby(['ID', 'BattingTeam'], observed=True)['total_run'].sum()
+        highest_score = match_scores.max()
+        total_50s = (match_scores.between(50, 99)).sum()
+        total_100s = (match_scores >= 100).sum()
+
+        total_fours = group['four'].sum()
+        total_sixes = group['six'].sum()
+
+        balls_faced = len(group)
+        total_runs = group['total_run'].sum()
+        strike_rate = round((total_runs / balls_faced) * 100, 2) if balls_faced else 0
+        run_rate = round(total_runs / (balls_faced / 6), 2) if balls_faced else 0
+
+        # Bowling records
+        bowler_wickets = group[group['isBowlerWicket']].groupby('bowler', observed=True).size()
+        most_wickets = bowler_wickets.max() if not bowler_wickets.empty else 0
+        top_bowler = bowler_wickets.idxmax() if not bowler_wickets.empty else None
+
+        best_figures = group.groupby(['ID', 'bowler'], observed=True)['isBowlerWicket'].sum().max()
+        total_dot_balls = group['dot_ball'].sum()
+
+        total_balls_bowled = len(group)
+        runs_conceded = group['total_run'].sum()
+        economy_rate = round(runs_conceded / (total_balls_bowled / 6), 2) if total_balls_bowled else 0
+
+        three_wicket_hauls = (group.groupby(['ID', 'bowler'], observed=True)['isBowlerWicket'].sum() >= 3).sum()
+        five_wicket_hauls = (group.groupby(['ID', 'bowler'], observed=True)['isBowlerWicket'].sum() >= 5).sum()
+
+        # Top batsman
+        batter_stats = group.groupby('batter', observed=True)['batsman_run'].sum().sort_values(ascending=False)
+        top_batsman = batter_stats.index[0] if not batter_stats.empty else None
+        top_batsman_runs = batter_stats.iloc[0] if not batter_stats.empty else 0
+
+        team_stats.append({
+            'season': season,
+            'team1': team1,
+            'team2': team2,
+            'matches': matches,
+            'team1_wins': team1_wins,
+            'team2_wins': team2_wins,
+            'no_result': no_result,
+            'team1_win_%': team1_win_pct,
+            'team2_win_%': team2_win_pct,
+
+            # Batting
+            'highest_score': highest_score,
+            'total_50s': total_50s,
+            'total_100s': total_100s,
+            'total_fours': total_fours,
+            'total_sixes': total_sixes,
+            'strike_rate': strike_rate,
+            'run_rate': run_rate,
+
+            # Bowling
+            'most_wickets': most_wickets,
+            'top_bowler': top_bowler,
+            'best_figures': best_figures,
+            'economy_rate': economy_rate,
+            'total_dot_balls': total_dot_balls,
+            'three_wicket_hauls': three_wicket_hauls,
+            'five_wicket_hauls': five_wicket_hauls,
+
+            # Top batter
+            'top_batsman': top_batsman,
+            'top_batsman_runs': top_batsman_runs
+        })
+
+    return pd.DataFrame(team_stats)
+
+
+def player_boundary_stats(ipl):
+    # The original also wrote the CSV itself and returned nothing; only the table is kept here
+    boundary_stats = []
+
+    # Group data by batter and calculate boundaries
+    for player in ipl['batter'].dropna().unique():
+        player_df = ipl[ipl['batter'] == player]
+        total_fours = player_df[player_df['batsman_run'] == 4].shape[0]
+        total_sixes = player_df[player_df['batsman_run'] == 6].shape[0]
+        total_boundaries = total_fours + total_sixes
+
+        boundary_stats.append({
+            'player': player,
+            'total_fours': total_fours,
+            'total_sixes': total_sixes,
+            'total_boundaries': total_boundaries
+        })
+
+    df = pd.DataFrame(boundary_stats)
+    df.sort_values(by='total_boundaries', ascending=False, inplace=True)
+    return df
+
+
+def team_records(df):
+   
+    # Strip spaces from key columns (on a copy; the shared frame is read-only)
+    df = df.copy()
+    for col in ['BattingTeam', 'bowler', 'batter', 'WinningTeam', 'Team1', 'Team2']:
+        df[col] = df[col].str.strip()
+
+    teams = pd.unique(pd.concat([df['Team1'], df['Team2']]))
+    seasons = df['Season'].unique()
+    final_stats = []
+    batting_innings = get_batting_innings(df)
+    bowling_spells = get_bowling_spells(df)
+
+    for season in seasons:
+        season_df = df[df['Season'] == season]
+
+        for team in teams:
+            team_matches = season_df[(season_df['Team1'] == team) | (season_df['Team2'] == team)]
+            match_ids = team_matches['ID'].unique()
+            total_matches = len(match_ids)
+
+            # Wins
+            wins = season_df[season_df['WinningTeam'] == team]['ID'].nunique()
+
+            # No Result
+            decided_matches = season_df[~season_df['WinningTeam'].isna()]
+            no_result = total_matches - decided_matches[
+                (decided_matches['Team1'] == team) | (decided_matches['Team2'] == team)
+            ]['ID'].nunique()
+
+            # Losses
+            losses = total_matches - wins - no_result
+
+            # Win %
+            win_pct = round((wins / total_matches) * 100, 2) if total_matches > 0 else 0.0
+
+            # Runs scored
+            team_runs = season_df[season_df['BattingTeam'] == team].groupby('ID')['total_run'].sum().sum()
+
+            # Wickets taken
+            wickets_taken = season_df[
+                (season_df['isWicketDelivery'] == 1) &
+                ((season_df['Team1'] == team) | (season_df['Team2'] == team)) &
+                (season_df['BattingTeam'] != team)
+            ]
+            total_wickets = wickets_taken['player_out'].count()
+
+            # 50s and 100s
+            innings_runs = batting_innings[(batting_innings['Season'] == season) & (batting_innings['team'] == team)]
+            fifties = innings_runs[innings_runs['runs'].between(50, 99)].shape[0]
+            hundreds = innings_runs[innings_runs['runs'] >= 100].shape[0]
+
+            # 3W and 5W hauls
+            bowler_hauls = bowling_spells[(bowling_spells['Season'] == season) & (bowling_spells['team'] == team)]
+            threes = bowler_hauls[bowler_hauls['wickets'].between(3, 4)].shape[0]
+            fives = bowler_hauls[bowler_hauls['wickets'] >= 5].shape[0]
+
+            final_stats.append({
+                'season': season,
+                'team': team,
+                'matches_played': total_matches,
+                'wins': wins,
+                'losses': losses,
+                'no_result': no_result,
+                'win_%': win_pct,
+                'total_runs_scored': team_runs,
+                'total_wickets_taken': total_wickets,
+                '50s': fifties,
+                '100s': hundreds,
+                '3w_hauls': threes,
+                '5w_hauls': fives
+            })
+
+    return pd.DataFrame(final_stats)
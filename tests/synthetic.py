@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+from src.data_loader import compact_ipl_frame
+
+TEAMS = ["Chennai Super Kings", "Mumbai Indians", "Royal Challengers Bangalore", "Kolkata Knight Riders"]
+VENUES = ["Wankhede Stadium", "Eden Gardens", "M Chinnaswamy Stadium"]
+KINDS = ["caught", "bowled", "run out", "lbw", "stumped", "caught and bowled"]
+
+
+def raw_ipl_frame(seed=0, seasons=(2019, 2020), matches_per_season=6):
+    """
+    A small, random ball-by-ball frame with the columns of final_ipl.csv (0-indexed overs).
+
+    The last two matches of each season are a Qualifier 1 and a Final; the
+    second match of each season has no result (one innings, no winner).
+    """
+    rng = np.random.default_rng(seed)
+    squads = {team: [f"{team.split()[0]} P{i}" for i in range(11)] for team in TEAMS}
+    matches, balls = [], []
+    match_id = 1000
+
+    for season in seasons:
+        for number in range(matches_per_season):
+            match_id += 1
+            team1, team2 = (str(team) for team in rng.choice(TEAMS, 2, replace=False))
+            stage = {matches_per_season - 1: "Final", matches_per_season - 2: "Qualifier 1"}.get(number, str(number + 1))
+            abandoned = number == 1
+            order = [team1, team2] if rng.random() < 0.5 else [team2, team1]
+            matches.append(dict(
+                ID=match_id, City="X", Date=f"{season}-04-{number + 1:02d}", Season=season, MatchNumber=stage,
+                Team1=team1, Team2=team2, Venue=str(rng.choice(VENUES)), TossWinner=order[0], TossDecision="bat",
+                SuperOver="N", WinningTeam=np.nan if abandoned else str(rng.choice(order)), WonBy="Runs", Margin=10,
+                method=np.nan, Player_of_Match=squads[team1][0], Team1Players="", Team2Players="",
+                Umpire1="U", Umpire2="V",
+            ))
+
+            for innings, batting in enumerate(order, 1):
+                if abandoned and innings == 2:
+                    break
+                bowling = order[1] if innings == 1 else order[0]
+                batters = list(squads[batting])
+                striker, non_striker, next_in, wickets = batters[0], batters[1], 2, 0
+                for over in range(20):
+                    bowler = squads[bowling][6 + over % 5]
+                    ball = 1
+                    while ball <= 6:
+                        extra = rng.choice([None, "wides", "legbyes", "noballs"], p=[.9, .05, .03, .02])
+                        runs = 0 if extra == "wides" else int(rng.choice([0, 1, 2, 4, 6], p=[.35, .35, .1, .12, .08]))
+                        out = extra is None and wickets < 9 and rng.random() < 0.05
+                        balls.append({
+                            "ID": match_id, "innings": innings, "overs": over, "ballnumber": ball,
+                            "batter": striker, "bowler": bowler, "non-striker": non_striker, "extra_type": extra,
+                            "batsman_run": 0 if out else runs, "extras_run": int(extra is not None),
+                            "total_run": (0 if out else runs) + int(extra is not None), "non_boundary": 0,
+                            "isWicketDelivery": int(out), "player_out": striker if out else np.nan,
+                            "kind": rng.choice(KINDS) if out else np.nan, "fielders_involved": np.nan,
+                            "BattingTeam": batting,
+                        })
+                        if out:
+                            wickets += 1
+                            striker, next_in = batters[next_in], next_in + 1
+                        elif runs % 2 == 1:
+                            striker, non_striker = non_striker, striker
+                        if extra not in ("wides", "noballs"):
+                            ball += 1
+                    striker, non_striker = non_striker, striker
+                    if wickets >= 9:
+                        break
+
+    frame = pd.DataFrame(balls).merge(pd.DataFrame(matches), on="ID")
+    frame["BowlingTeam"] = np.where(frame["BattingTeam"] == frame["Team1"], frame["Team2"], frame["Team1"])
+    frame["valid_ball"] = (~frame["extra_type"].isin(["wides", "noballs"])).astype(int)
+    return frame
+
+
+def make_ipl_frame(raw=None, **kwargs):
+    """``raw`` (default: ``raw_ipl_frame(**kwargs)``) compacted the way load_ipl_data returns it."""
+    return compact_ipl_frame(raw_ipl_frame(**kwargs) if raw is None else raw)[0]
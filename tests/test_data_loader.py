@@ -0,0 +1,21 @@
+import pandas as pd
+from src.data_loader import PLAYER_COLUMNS, TEAM_COLUMNS, _reshare_categories, compact_ipl_frame
+from tests.synthetic import make_ipl_frame, raw_ipl_frame
+
+
+def test_snapshot_read_is_reshared_without_compacting(tmp_path):
+    ipl = make_ipl_frame()
+    ipl.to_parquet(tmp_path / "final_ipl.parquet", index=False)
+    snapshot = pd.read_parquet(tmp_path / "final_ipl.parquet")
+
+    assert _reshare_categories(snapshot)
+    pd.testing.assert_frame_equal(snapshot, ipl)
+    for group in (PLAYER_COLUMNS, TEAM_COLUMNS):
+        assert all(snapshot[col].dtype is snapshot[group[0]].dtype for col in group)
+
+
+def test_raw_frame_is_left_for_compacting():
+    raw = raw_ipl_frame()
+    assert not _reshare_categories(raw)
+    pd.testing.assert_frame_equal(raw, raw_ipl_frame())
+    assert compact_ipl_frame(raw)[0]["batter"].dtype == "category"
@@ -0,0 +1,62 @@
+import os
+import pandas as pd
+import pytest
+from RAG_helper import pipeline
+from tests.synthetic import make_ipl_frame, raw_ipl_frame
+
+GRAINS = {kind: [name for name, (_, _, (grain, _)) in pipeline.GENERATORS.items() if grain == kind]
+          for kind in ("match", "season", "player")}
+
+
+def read_sorted(path):
+    table = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return table.sort_values(list(table.columns)).reset_index(drop=True)
+
+
+def assert_incremental_matches_full(monkeypatch, tmp_path, before, after, names):
+    """Build ``names`` from ``before``, update incrementally to ``after``, and compare with a full build of ``after``."""
+    frames = {"ipl": before}
+    monkeypatch.setattr(pipeline, "load_ipl_data", lambda source="final": frames["ipl"])
+    incremental, full = str(tmp_path / "incremental"), str(tmp_path / "full")
+
+    pipeline.run_pipeline(only=names, output_dir=incremental, workers=1)
+    frames["ipl"] = after
+    results = pipeline.run_pipeline(only=names, output_dir=incremental, workers=1)
+    pipeline.run_pipeline(only=names, output_dir=full, workers=1, full=True)
+
+    for name in names:
+        assert not isinstance(results[name], Exception), results[name]
+        filename = pipeline.GENERATORS[name][1]
+        pd.testing.assert_frame_equal(read_sorted(os.path.join(incremental, filename)),
+                                      read_sorted(os.path.join(full, filename)))
+
+
+@pytest.fixture(scope="module")
+def raw():
+    return raw_ipl_frame()
+
+
+def test_incremental_run_after_player_rename_matches_full_rebuild(monkeypatch, tmp_path, raw):
+    renamed = raw.copy()
+    match = renamed["ID"] == renamed.loc[renamed["batter"] == "Chennai P0", "ID"].iloc[0]
+    for column in pipeline.ROLE_COLUMNS:
+        renamed.loc[match, column] = renamed.loc[match, column].replace("Chennai P0", "Chennai P0 (corrected)")
+    assert_incremental_matches_full(monkeypatch, tmp_path, make_ipl_frame(raw), make_ipl_frame(renamed), GRAINS["player"])
+
+
+def test_incremental_run_after_season_correction_matches_full_rebuild(monkeypatch, tmp_path, raw):
+    corrected = raw.copy()
+    corrected.loc[corrected["ID"] == corrected["ID"].iloc[0], "Season"] = corrected["Season"].max()
+    assert_incremental_matches_full(monkeypatch, tmp_path, make_ipl_frame(raw), make_ipl_frame(corrected), GRAINS["season"])
+
+
+def test_plan_update_covers_recorded_partitions_of_changed_matches(raw, tmp_path):
+    before, after = make_ipl_frame(raw), make_ipl_frame(raw.assign(Season=raw["Season"].where(raw["ID"] != 1001, 2020)))
+    previous, current = pipeline.match_fingerprints(before), pipeline.match_fingerprints(after)
+    players = {**pipeline.match_players(before, previous), **pipeline.match_players(after, current)}
+    open(tmp_path / pipeline.GENERATORS["venue_stats"][1], "w").close()
+
+    assert pipeline.plan_update("venue_stats", current, previous, str(tmp_path), players) == ("season", {2019, 2020})
+    # Without the recorded players of a changed match, a player grain falls back to a full rebuild
+    open(tmp_path / pipeline.GENERATORS["player_stats"][1], "w").close()
+    assert pipeline.plan_update("player_stats", current, previous, str(tmp_path), {}) == "full"
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+from src import sqlite_backend
+from src.functional_tools.pair_stats_tool import get_pair_stats
+from tests.synthetic import make_ipl_frame
+
+KEYS = ["ID", "innings", "overs", "ballnumber"]
+
+
+@pytest.fixture
+def ipl():
+    return make_ipl_frame()
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path, ipl):
+    monkeypatch.setattr(sqlite_backend, "load_ipl_data", lambda source="final": ipl)
+    monkeypatch.setattr(sqlite_backend, "_store_fingerprint", lambda source: "test")
+    store = sqlite_backend.SQLiteIPLStore(sqlite_backend.build_sqlite_store(str(tmp_path / "ipl.sqlite")))
+    yield store
+    store.close()
+
+
+def test_store_reuses_the_frame_of_a_scope(store, ipl):
+    teams = ["Mumbai Indians", "Chennai Super Kings"]
+    frame = store.deliveries(teams=teams, seasons=["2019"])
+    assert store.deliveries(teams=teams[::-1], seasons=[2019]) is frame
+
+    in_scope = (ipl["Team1"].isin(teams) | ipl["Team2"].isin(teams)) & (ipl["Season"] == 2019)
+    pd.testing.assert_frame_equal(frame[KEYS], ipl.loc[in_scope, KEYS].reset_index(drop=True), check_dtype=False)
+    plan = store.query("EXPLAIN QUERY PLAN SELECT * FROM deliveries WHERE Team1 IN (?) OR Team2 IN (?)", teams)
+    assert plan["detail"].str.contains("idx_deliveries_team2").any()
+
+
+def test_venue_lookup_uses_the_venue_index(store, ipl):
+    frame = store.deliveries(venue="eden GARDENS ")
+    in_scope = ipl["Venue"] == "Eden Gardens"
+    pd.testing.assert_frame_equal(frame[KEYS], ipl.loc[in_scope, KEYS].reset_index(drop=True), check_dtype=False)
+    plan = store.query("EXPLAIN QUERY PLAN SELECT * FROM deliveries WHERE Venue = ? COLLATE NOCASE", ["eden gardens"])
+    assert plan["detail"].str.contains("USING INDEX idx_deliveries_venue").all()
+
+
+def test_pair_stats_run_against_the_store(store, ipl):
+    # The openers, and a middle-order pair whose wicket number counts wickets neither of them was part of
+    assert get_pair_stats("Chennai P0", "Chennai P1", ipl=store) == get_pair_stats("Chennai P0", "Chennai P1", ipl=ipl)
+    assert get_pair_stats("Chennai P2", "Chennai P3", 2020, ipl=store) == get_pair_stats("Chennai P2", "Chennai P3", 2020, ipl=ipl)